@@ -0,0 +1,246 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Benchmarks for the project tracker (FinalHedyK.py / project_tracker)
+# Description: Times the load, save, add, delete and display paths of FinalHedyK.py
+#              without the menu loop.
+#              1) Synthetic csv files with the same columns as EmployeeProjectHours.csv
+#              are generated with a chosen number of rows, projects and employees.
+#              2) Each operation is timed with time.perf_counter and run a second time
+#              under tracemalloc to measure its peak memory.
+#              3) Results are saved as json; a previous results file can be given to
+#              compare the two runs.
+#              Example: python benchmark.py --sizes 1000 100000 --output results.json
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+# -------------------------------------------------------------------------------------------- #
+
+import os           # module for file handling
+import sys          # module for the python version and the null output
+import csv          # module for writing the generated csv files
+import json         # module for saving and comparing results
+import time         # module for timing the operations
+import random       # module for generating the synthetic timesheets
+import argparse     # module for the command line options
+import datetime     # module for generating dates
+import platform     # module for describing the machine in the results
+import tempfile     # module for a scratch folder for the generated files
+import tracemalloc  # module for measuring the peak memory of each operation
+import contextlib   # module for hiding the output of the display operations
+
+import project_tracker as tracker
+
+
+class TimesheetGenerator:
+    """ Writes synthetic timesheets with the columns of EmployeeProjectHours.csv """
+
+    @staticmethod
+    def names(prefix, count):
+        """
+        makes a list of distinct names
+        :param prefix: first word of each name
+        :param count: number of names
+        :return: list of names
+        """
+        letters = 'abcdefghijklmnopqrstuvwxyz'
+        names = []
+        for number in range(count):
+            word = ''
+            while True:                 # the number written with letters (names may not contain digits)
+                number, remainder = divmod(number, 26)
+                word = letters[remainder] + word
+                if number == 0:
+                    break
+            names.append(prefix + ' ' + word.title())
+        return names
+
+    @staticmethod
+    def write_csv(file_name, rows, projects=50, employees=200, seed=0):
+        """
+        writes a csv file with random entries (the rows are streamed to the file)
+        :param file_name:
+        :param rows: number of entries
+        :param projects: number of different projects
+        :param employees: number of different employees
+        :param seed: seed for the random numbers (same seed, same file)
+        :return: nothing
+        """
+        generator = random.Random(seed)
+        project_names = TimesheetGenerator.names('Project', projects)
+        employee_names = TimesheetGenerator.names('Employee', employees)
+        first_day = datetime.date(2020, 1, 1).toordinal()
+        with open(file_name, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(tracker.EntryStream.fieldnames)
+            for entry_num in range(1, rows + 1):
+                date = datetime.date.fromordinal(first_day + generator.randrange(730))
+                writer.writerow([entry_num, generator.choice(employee_names), generator.choice(project_names),
+                                 str(date.month) + '/' + str(date.day) + '/' + str(date.year),
+                                 generator.randrange(1, 33) * 0.25])
+
+    @staticmethod
+    def new_entries(count, counter, seed=1):
+        """
+        makes EmployeeHours objects as if they were typed in the menu
+        :param count: number of entries
+        :param counter: entry number of the first entry
+        :param seed:
+        :return: list of EmployeeHours
+        """
+        generator = random.Random(seed)
+        entries = []
+        for number in range(count):
+            entry = tracker.EmployeeHours()
+            entry.entry_num = counter + number
+            entry.employee_name = 'New Employee'
+            entry.project_name = 'Project A'
+            entry.full_date = '0' + str(generator.randrange(1, 10)) + '/15/2021'
+            entry.hours_worked = str(generator.randrange(1, 33) * 0.25)
+            entries.append(entry)
+        return entries
+
+
+class Benchmark:
+    """ Runs the operations of FinalHedyK.py on generated files and collects the results """
+
+    def __init__(self, folder, changes=100):
+        self.folder = folder
+        self.changes = changes   # entries added or deleted by the add, delete and save-changes operations
+
+    @staticmethod
+    def measure(setup, operation):
+        """
+        times an operation, then runs it again (after a new setup) to measure its peak memory
+        :param setup: function that prepares the arguments (not measured)
+        :param operation: function that takes the prepared arguments
+        :return: seconds, peak bytes
+        """
+        arguments = setup()
+        start = time.perf_counter()
+        operation(arguments)
+        seconds = time.perf_counter() - start
+        arguments = setup()
+        tracemalloc.start()
+        operation(arguments)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return seconds, peak_bytes
+
+    def operations(self, file_name):
+        """
+        :param file_name: generated csv file
+        :return: list of (name, setup, operation)
+        """
+        save_name = os.path.join(self.folder, 'save.csv')
+
+        def load():
+            return tracker.Processor.read_data_from_file(file_name)
+
+        def loaded_with_changes():   # a loaded file with new entries, saved to a copy of the file
+            list_employee_hours, list_projects, status, counter = load()
+            for entry in TimesheetGenerator.new_entries(self.changes, counter):
+                tracker.Processor.add_data_to_list(entry, list_employee_hours)
+            with open(file_name, 'rb') as source, open(save_name, 'wb') as copy:
+                copy.write(source.read())
+            return list_employee_hours, counter + self.changes
+
+        def add_entries(arguments):
+            list_employee_hours, list_projects, status, counter = arguments
+            for entry in TimesheetGenerator.new_entries(self.changes, counter):
+                tracker.Processor.add_data_to_list(entry, list_employee_hours)
+
+        def delete_entries(arguments):
+            list_employee_hours = arguments[0]
+            for entry_num in range(1, self.changes + 1):
+                tracker.Processor.remove_data_from_list(str(entry_num), list_employee_hours)
+
+        def display_all(arguments):
+            with open(os.devnull, 'w') as null_output, contextlib.redirect_stdout(null_output):
+                tracker.IO.print_current_Entries_in_list(arguments[0])
+
+        def display_page(arguments):
+            with open(os.devnull, 'w') as null_output, contextlib.redirect_stdout(null_output):
+                page_rows, total = tracker.Processor.select_entries(arguments[0], 0, 20)
+                tracker.IO.print_entries_page(page_rows, 0, total)
+
+        return [
+            ('load', lambda: None, lambda arguments: load()),
+            ('save', load, lambda arguments: tracker.Processor.write_data_to_file(save_name, arguments[0])),
+            ('save_changes', loaded_with_changes,
+             lambda arguments: tracker.Processor.save_changes_to_file(save_name, *arguments)),
+            ('add', load, add_entries),
+            ('delete', load, delete_entries),
+            ('display_all', load, display_all),
+            ('display_page', load, display_page),
+        ]
+
+    def run(self, sizes, projects, employees, selected=None):
+        """
+        generates a file for each size and measures every operation on it
+        :param sizes: list of numbers of rows
+        :param projects: number of different projects
+        :param employees: number of different employees
+        :param selected: names of the operations to run (None for all)
+        :return: list of result dictionaries
+        """
+        results = []
+        for rows in sizes:
+            file_name = os.path.join(self.folder, 'timesheet_' + str(rows) + '.csv')
+            TimesheetGenerator.write_csv(file_name, rows, projects, employees)
+            for name, setup, operation in self.operations(file_name):
+                if selected and name not in selected:
+                    continue
+                seconds, peak_bytes = self.measure(setup, operation)
+                results.append({'operation': name, 'rows': rows, 'projects': projects, 'employees': employees,
+                                'seconds': round(seconds, 6), 'peak_bytes': peak_bytes})
+                print(name.ljust(14), str(rows).rjust(10), 'rows', str(round(seconds, 4)).rjust(10), 's',
+                      str(round(peak_bytes / 2 ** 20, 2)).rjust(10), 'MiB peak')
+            os.remove(file_name)
+        return results
+
+    @staticmethod
+    def compare(results, previous_results):
+        """
+        prints how the times and peak memory changed since a previous run
+        :param results: list of result dictionaries
+        :param previous_results: list of result dictionaries from an earlier run
+        :return: nothing
+        """
+        previous = {(result['operation'], result['rows']): result for result in previous_results}
+        print('-' * 60)
+        print('Operation', '|', 'Rows', '|', 'Time (new/old)', '|', 'Peak memory (new/old)')
+        for result in results:
+            old = previous.get((result['operation'], result['rows']))
+            if old is None:
+                continue
+            time_ratio = result['seconds'] / old['seconds'] if old['seconds'] else float('inf')
+            memory_ratio = result['peak_bytes'] / old['peak_bytes'] if old['peak_bytes'] else float('inf')
+            print(result['operation'], '|', result['rows'], '|', str(round(time_ratio, 2)) + 'x', '|',
+                  str(round(memory_ratio, 2)) + 'x')
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Benchmark the load, save, add, delete and display paths.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='numbers of rows to generate (for example 1000 up to 10000000)')
+    parser.add_argument('--projects', type=int, default=50, help='number of different projects')
+    parser.add_argument('--employees', type=int, default=200, help='number of different employees')
+    parser.add_argument('--changes', type=int, default=100, help='entries added or deleted per operation')
+    parser.add_argument('--operations', nargs='+', help='only run these operations')
+    parser.add_argument('--output', default='benchmark_results.json', help='json file for the results')
+    parser.add_argument('--compare', help='json file of an earlier run to compare with')
+    options = parser.parse_args(arguments)
+
+    with tempfile.TemporaryDirectory() as folder:
+        results = Benchmark(folder, options.changes).run(options.sizes, options.projects,
+                                                         options.employees, options.operations)
+    with open(options.output, 'w') as output_file:
+        json.dump({'python': sys.version.split()[0], 'machine': platform.platform(),
+                   'numpy': tracker.numpy is not None, 'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                   'results': results}, output_file, indent=2)
+    print('Results saved to ' + options.output + '.')
+    if options.compare:
+        with open(options.compare) as previous_file:
+            Benchmark.compare(results, json.load(previous_file)['results'])
+
+
+if __name__ == '__main__':
+    main()
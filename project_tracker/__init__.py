@@ -0,0 +1,39 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: project_tracker package
+# Description: Tracks the number of hours each employee has worked on a project.
+#              data.py          - the entry, store, index and registry classes
+#              processing.py    - reading, saving, binary files and reports (Processor)
+#              storage.py       - the csv and SQLite storage backends (Storage)
+#              batch.py         - the batch import mode (BatchImporter)
+#              presentation.py  - menu input and output (IO)
+#              server.py        - the HTTP/JSON server (ApiServer)
+#              session.py       - the state of one run of the tracker (Session)
+#              menu.py          - main(), the menu loop
+#              instrumentation.py - timings of the hot paths when TRACKER_PROFILE is set (Instrumentation)
+#              export.py        - the monthly export to csv.gz, csv.zst and npz (MonthlyExporter)
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Package from FinalHedyK.py
+#                   10/17/2026, Added storage.py (csv and SQLite backends)
+#                   10/17/2026, Added server.py (HTTP/JSON server)
+#                   10/17/2026, Added instrumentation.py (timings and profiling)
+#                   10/17/2026, Added export.py (monthly export)
+# -------------------------------------------------------------------------------------------- #
+
+from .instrumentation import Instrumentation
+from .data import (DEFAULT_FILE_NAME, numpy, EntryValidator, EmployeeHours, EntryRow, EntryRecord,
+                   EntryColumns, EntryStore, SortedEntryIndex, EntryFilterIndex, DuplicateDetector,
+                   AggregateTotals, ProjectRegistry)
+from .processing import BinaryTimesheet, EntryStream, HoursReport, SaveSnapshot, Processor
+from .storage import Storage, CsvStorage, SqliteStorage
+from .batch import BatchImporter
+from .presentation import IO
+from .session import Session
+from .server import ApiServer
+from .export import MonthlyExporter
+from .menu import main
+
+__all__ = ['DEFAULT_FILE_NAME', 'EntryValidator', 'EmployeeHours', 'EntryRow', 'EntryRecord', 'EntryColumns',
+           'EntryStore', 'SortedEntryIndex', 'EntryFilterIndex', 'DuplicateDetector', 'AggregateTotals',
+           'ProjectRegistry', 'BinaryTimesheet', 'EntryStream', 'HoursReport', 'SaveSnapshot', 'Processor', 'Storage',
+           'CsvStorage', 'SqliteStorage', 'BatchImporter', 'IO', 'Session', 'ApiServer', 'Instrumentation', 'MonthlyExporter',
+           'main']
@@ -0,0 +1,13 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Runs the project tracker (python -m project_tracker)
+# Description: Same as running FinalHedyK.py: the menu, or the batch import mode
+#              when there are command line arguments.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+# -------------------------------------------------------------------------------------------- #
+
+import sys
+
+from .menu import main
+
+sys.exit(main())
@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Batch import for the project tracker
+# Description: Adds many entries at once from a csv or json-lines file without the menu.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Moved out of FinalHedyK.py into the project_tracker package
+#                   10/17/2026, Batch imports into an SQLite database (SqliteStorage)
+#                   10/17/2026, Imported rows are checked for duplicates and days over 24 hours
+# -------------------------------------------------------------------------------------------- #
+
+import os     # module for file handling
+import csv    # module for reading and writing to csv files
+import sys    # module for reading from stdin
+import json                            # module for reading json-lines batch input
+import argparse                        # module for the batch mode command line options
+from concurrent.futures import ProcessPoolExecutor   # validates large batch imports on all cores
+
+from .data import DEFAULT_FILE_NAME, EntryValidator, EmployeeHours, EntryRecord, ProjectRegistry
+from .processing import Processor, BinaryTimesheet
+from .storage import SqliteStorage
+
+
+class BatchImporter:
+    """
+    adds many entries at once from a csv file (with column headers) or a json-lines
+    file, without the menu; rows are checked with the same EmployeeHours setters
+    (split over several processes for large inputs), rejected rows are written
+    to a reject file with the reasons and all valid rows are saved in one write
+    """
+
+    fieldnames = ['EmployeeName', 'ProjectName', 'FullDate', 'HoursWorked']
+    chunk_size = 5000        # rows validated by a process at a time
+    pool_threshold = 20000   # inputs with fewer rows are validated in this process
+
+    @staticmethod
+    def read_input(source, input_format=''):
+        """
+        reads the rows to import, numbered by line
+        :param source: file name, or '-' for stdin
+        :param input_format: 'csv' or 'jsonl' (taken from the file extension when empty)
+        :return: list of (line number, dictionary row or error message)
+        """
+        if not input_format:
+            input_format = 'jsonl' if os.path.splitext(source)[1].lower() in ('.jsonl', '.json') else 'csv'
+        input_file = sys.stdin if source == '-' else open(source, newline='')
+        try:
+            numbered_rows = []
+            if input_format == 'jsonl':
+                for line_number, line in enumerate(input_file, 1):
+                    if line.strip():
+                        try:
+                            numbered_rows.append((line_number, json.loads(line)))
+                        except ValueError:
+                            numbered_rows.append((line_number, 'line is not valid json'))
+            else:
+                reader = csv.DictReader(input_file)
+                for row in reader:
+                    numbered_rows.append((reader.line_num, row))
+            return numbered_rows
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+
+    @staticmethod
+    def validate_rows(numbered_rows):
+        """
+        checks rows with EntryValidator, a column at a time (runs in a worker process);
+        valid rows are then set through the EmployeeHours setters so they are stored
+        the same way as entries typed in the menu
+        :param numbered_rows: list of (line number, dictionary row or error message)
+        :return: list of (line number, dictionary row), list of (line number, row, reason)
+        """
+        valid_rows = []
+        rejected_rows = []
+        checked_rows = []
+        for line_number, row in numbered_rows:
+            if not isinstance(row, dict):
+                rejected_rows.append((line_number, {}, row if isinstance(row, str) else 'row is not an object'))
+                continue
+            values = {key: '' if row.get(key) is None else str(row.get(key)) for key in BatchImporter.fieldnames}
+            checked_rows.append((line_number, values))
+        codes, date_ordinals = EntryValidator.check_rows([values for line_number, values in checked_rows])
+        for (line_number, values), code, date_ordinal in zip(checked_rows, codes, date_ordinals):
+            if code:
+                rejected_rows.append((line_number, values, EntryValidator.describe(code)))
+                continue
+            entry = EmployeeHours()
+            entry.employee_name = values['EmployeeName']
+            entry.project_name = values['ProjectName']
+            entry.full_date = values['FullDate']
+            entry.hours_worked = values['HoursWorked']
+            row = entry.dict_method()
+            row.date_ordinal = date_ordinal    # the duplicate check does not parse the date again
+            valid_rows.append((line_number, row))
+        return valid_rows, rejected_rows
+
+    @staticmethod
+    def validate_all(numbered_rows, workers=None):
+        """
+        validates the rows, over a pool of processes when there are many of them
+        :param numbered_rows:
+        :param workers: number of processes (None for one per core)
+        :return: list of (line number, dictionary row), list of (line number, row, reason)
+        """
+        if len(numbered_rows) < BatchImporter.pool_threshold or workers == 1:
+            return BatchImporter.validate_rows(numbered_rows)
+        chunks = [numbered_rows[start:start + BatchImporter.chunk_size]
+                  for start in range(0, len(numbered_rows), BatchImporter.chunk_size)]
+        valid_rows = []
+        rejected_rows = []
+        with ProcessPoolExecutor(workers) as executor:
+            for chunk_valid, chunk_rejected in executor.map(BatchImporter.validate_rows, chunks):
+                valid_rows.extend(chunk_valid)
+                rejected_rows.extend(chunk_rejected)
+        return valid_rows, rejected_rows
+
+    @staticmethod
+    def write_rejects(file_name, rejected_rows):
+        """
+        writes the rejected rows with their line number and the reasons
+        :param file_name:
+        :param rejected_rows: list of (line number, row, reason)
+        :return: nothing
+        """
+        with open(file_name, 'w', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=['Line', 'Reason'] + BatchImporter.fieldnames,
+                                    extrasaction='ignore')
+            writer.writeheader()
+            for line_number, row, reason in rejected_rows:
+                writer.writerow(dict(row, Line=line_number, Reason=reason))
+
+    @staticmethod
+    def import_entries(data_file_name, numbered_rows, add_projects=False, workers=None):
+        """
+        validates the rows and adds the valid ones to the data file in one write;
+        the entries in a csv data file are not loaded: the new rows are appended, and
+        the file is only streamed to check them for duplicates (and for its project names
+        when unknown projects are rejected); an SQLite database gets the rows in one transaction.
+        Rows that look like duplicates are added, with a warning in the status
+        :param data_file_name:
+        :param numbered_rows: list of (line number, dictionary row)
+        :param add_projects: adds projects that are not in the project list yet (otherwise rejects the row)
+        :param workers: number of processes for validation (None for one per core)
+        :return: number of entries added, list of (line number, row, reason), status
+        """
+        valid_rows, rejected_rows = BatchImporter.validate_all(numbered_rows, workers)
+        binary = BinaryTimesheet.is_binary(data_file_name)    # a binary file is rewritten, so it is loaded
+        database = SqliteStorage(data_file_name) if SqliteStorage.is_sqlite(data_file_name) else None
+        if database is not None:
+            list_projects = database.projects    # counted by an indexed query; the entries are not read
+        elif binary:
+            list_employee_hours, list_projects, status, counter = Processor.read_data_from_file(data_file_name)
+        elif add_projects:
+            list_projects = ProjectRegistry()   # every project is accepted, so the file is not read
+        else:
+            list_projects = Processor.read_projects_from_file(data_file_name)
+        new_rows = []
+        for line_number, row in valid_rows:
+            if row['ProjectName'] not in list_projects:
+                if not add_projects:
+                    rejected_rows.append((line_number, row, 'project is not in the list of projects'))
+                    continue
+                list_projects.add(row['ProjectName'])
+            row['ProjectName'] = list_projects.get(row['ProjectName'])
+            new_rows.append(row)
+        status = 'No entries to save.'
+        if new_rows and binary:
+            detector = list_employee_hours.duplicate_detector
+            warnings = []
+            for row in new_rows:
+                row['EntryNum'] = str(counter)
+                if list_employee_hours.compact:
+                    row = EntryRecord.from_row(row)
+                warnings.extend(detector.check(row))
+                list_employee_hours.append(row)
+                counter += 1
+            status, counter = Processor.save_changes_to_file(data_file_name, list_employee_hours, counter)
+            status = Processor.with_warnings(status, warnings)
+        elif new_rows and database is not None:
+            warnings, status = database.add_rows(new_rows)    # one transaction for all the rows
+            status = Processor.with_warnings(database.save(), warnings)
+        elif new_rows:
+            status = Processor.append_entries_to_file(data_file_name, new_rows)    # checked against the file
+        if database is not None:
+            database.close()
+        rejected_rows.sort(key=lambda rejected: rejected[0])
+        return len(new_rows), rejected_rows, status
+
+    @staticmethod
+    def main(arguments):
+        """
+        runs the batch mode from the command line
+        :param arguments: command line arguments (without the script name)
+        :return: exit code (0 if every row was imported, 1 if rows were rejected)
+        """
+        parser = argparse.ArgumentParser(description='Import many employee hours entries at once.')
+        parser.add_argument('--import', dest='source', required=True,
+                            help="csv (with column headers) or json-lines file to import, or - for stdin")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], default='',
+                            help='format of the input (taken from the file extension by default)')
+        parser.add_argument('--data', default=DEFAULT_FILE_NAME, help='data file the entries are added to (csv, .bin or an SQLite .db)')
+        parser.add_argument('--add-projects', action='store_true',
+                            help='add projects that are not in the project list instead of rejecting the rows')
+        parser.add_argument('--rejects', default='rejected_rows.csv', help='file for the rejected rows')
+        parser.add_argument('--workers', type=int, default=None, help='number of processes for validation')
+        options = parser.parse_args(arguments)
+
+        numbered_rows = BatchImporter.read_input(options.source, options.format)
+        added, rejected_rows, status = BatchImporter.import_entries(options.data, numbered_rows,
+                                                                   options.add_projects, options.workers)
+        print(status)
+        print(str(added) + ' entries were added to ' + options.data + '.')
+        if rejected_rows:
+            BatchImporter.write_rejects(options.rejects, rejected_rows)
+            print(str(len(rejected_rows)) + ' rows were rejected (see ' + options.rejects + ').')
+            return 1
+        return 0
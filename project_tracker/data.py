@@ -0,0 +1,1212 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Data classes of the project tracker
+# Description: Entries (EmployeeHours, EntryRecord, EntryColumns), their validation
+#              (EntryValidator) and the containers and indexes that hold them in
+#              memory (EntryStore, SortedEntryIndex, EntryFilterIndex, DuplicateDetector,
+#              AggregateTotals, ProjectRegistry).
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Moved out of FinalHedyK.py into the project_tracker package
+#                   10/17/2026, EntryStore can take in rows saved by others without tracking them as changes
+#                   10/17/2026, Added DuplicateDetector (entries logged twice, days over 24 hours)
+#                   10/17/2026, Added AggregateTotals (running totals per project, employee and month)
+#                   10/17/2026, Rows carry their date ordinal (EntryRow); remove_many rebuilds each index once
+#                   10/17/2026, EntryStore builds its EntryFilterIndex the first time a filtered page is asked for
+#                   10/17/2026, DuplicateDetector is built when first needed and keeps one row per key
+#                   10/17/2026, EntryStore keeps its rows as EntryColumns for the reports once one is run
+#                   10/17/2026, EntryStore hands its changes over to a save and takes them back when it fails
+#                   10/17/2026, EntryStore builds its AggregateTotals when first needed (or from the cached totals)
+#                   10/17/2026, ProjectRegistry counts the entries under the same key add() uses (names are stripped)
+# -------------------------------------------------------------------------------------------- #
+
+import sys    # module used for interning repeated names
+import re     # module for the precompiled date and hours patterns
+import datetime                        # module for converting dates to ordinals and back
+from array import array                # compact arrays of numbers (used for columns of data)
+from collections import Counter        # counts the entries per project
+from bisect import insort, bisect_left, bisect_right  # keeps sorted lists sorted and finds positions in them
+from itertools import islice           # takes one page of rows from a generator
+from operator import itemgetter        # sort key of the (key, row) pairs of a SortedEntryIndex
+from collections.abc import Mapping    # lets EntryRecord be used like a dictionary row
+try:
+    import numpy   # optional: vectorized checks and totals (plain Python is used without it)
+except ImportError:
+    numpy = None
+
+# -- Data -- #
+DEFAULT_FILE_NAME = 'EmployeeProjectHours.csv'  # Name of the csv data file
+
+class EntryValidator:
+    '''
+    checks entries a whole column at a time and gives an error code for each row
+    (0 when the row is valid, otherwise the sum of the codes of the values that failed);
+    dates must be real calendar dates (formatted as 01/01/2021) between 2001 and 2099,
+    hours must be more than 0 and less than 24.05
+    '''
+
+    BAD_NAME = 1       # employee name is empty or a number
+    BAD_PROJECT = 2    # project name is empty (or not in the project list, when one is given)
+    BAD_DATE = 4       # date is not formatted as 01/01/2021 or is not a calendar date in range
+    BAD_HOURS = 8      # hours are not a decimal number more than 0 and less than 24.05
+
+    messages = {BAD_NAME: 'employee name is not valid', BAD_PROJECT: 'project name is not valid',
+                BAD_DATE: 'date is not valid', BAD_HOURS: 'hours worked are not valid'}
+
+    date_pattern = re.compile(r'\s*(\d{1,2})/(\d{1,2})/(\d{4})\s*$')
+    hours_pattern = re.compile(r'\s*(\d+\.?\d*|\.\d+)\s*$')
+    days_in_month = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+    @staticmethod
+    def describe(code):
+        '''
+        :param code: error code of a row
+        :return: the reasons, separated by semicolons ('' for a valid row)
+        '''
+        return '; '.join(message for bit, message in EntryValidator.messages.items() if code & bit)
+
+    @staticmethod
+    def name_code(value):
+        value = str(value).strip()
+        return EntryValidator.BAD_NAME if value == '' or value.isnumeric() else 0
+
+    @staticmethod
+    def date_code(value):
+        return 0 if EntryValidator.date_ordinal(value) else EntryValidator.BAD_DATE
+
+    @staticmethod
+    def date_ordinal(value):
+        '''
+        :param value: date string formatted as 01/01/2021
+        :return: the date as an ordinal, or 0 when it is not a valid date
+        '''
+        match = EntryValidator.date_pattern.match(str(value))
+        if match is None:
+            return 0
+        month, day, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        if not (2000 < year < 2100 and 0 < month < 13):
+            return 0
+        leap_day = 1 if month == 2 and year % 4 == 0 else 0    # every year from 2001 to 2099 divisible by 4 is a leap year
+        if not 0 < day <= EntryValidator.days_in_month[month] + leap_day:
+            return 0
+        return datetime.date(year, month, day).toordinal()
+
+    @staticmethod
+    def hours_code(value):
+        if EntryValidator.hours_pattern.match(str(value)) is None:
+            return EntryValidator.BAD_HOURS
+        return 0 if 0 < float(value) < 24.05 else EntryValidator.BAD_HOURS
+
+    @staticmethod
+    def validate_columns(names, projects, dates, hours, list_projects=None):
+        '''
+        checks columns of values (all the same length) in one pass each
+        :param names: employee names
+        :param projects: project names
+        :param dates: dates (strings formatted as 01/01/2021)
+        :param hours: hours worked (strings or numbers)
+        :param list_projects: project names must be in it when given (a ProjectRegistry or set)
+        :return: list of error codes, one for each row
+        '''
+        return EntryValidator.check_columns(names, projects, dates, hours, list_projects)[0]
+
+    @staticmethod
+    def check_columns(names, projects, dates, hours, list_projects=None):
+        '''
+        checks columns of values like validate_columns and also gives the date of each row
+        as an ordinal, so the rows that pass never have their date parsed again
+        :return: list of error codes, list of date ordinals (0 where the date is not valid)
+        '''
+        codes = [EntryValidator.name_code(name) for name in names]
+        for row, project in enumerate(projects):
+            project = str(project).strip()
+            if project == '' or (list_projects is not None and project not in list_projects):
+                codes[row] |= EntryValidator.BAD_PROJECT
+        if numpy is not None and len(codes) > 0:
+            ordinals, hours_codes = EntryValidator.__check_numpy(dates, hours)
+        else:
+            ordinals = [EntryValidator.date_ordinal(date) for date in dates]
+            hours_codes = map(EntryValidator.hours_code, hours)
+        codes = [code | (0 if ordinal else EntryValidator.BAD_DATE) | hours_code
+                 for code, ordinal, hours_code in zip(codes, ordinals, hours_codes)]
+        return codes, ordinals
+
+    @staticmethod
+    def __check_numpy(dates, hours):
+        '''
+        checks the dates and hours columns with numpy: the patterns pick out the numbers
+        and the range and calendar checks (and the date ordinals) are done on whole arrays
+        :return: date ordinals (0 where the date is not valid), hours codes (lists)
+        '''
+        parts = numpy.zeros((len(dates), 3), dtype=numpy.int64)    # month, day, year (0 when it did not match)
+        for row, value in enumerate(dates):
+            match = EntryValidator.date_pattern.match(str(value))
+            if match is not None:
+                parts[row] = match.groups()
+        month, day, year = parts[:, 0], parts[:, 1], parts[:, 2]
+        leap_year = year % 4 == 0    # the same rule as date_code (years 2001 to 2099)
+        month_days = numpy.asarray(EntryValidator.days_in_month)[numpy.clip(month, 0, 12)] + \
+            ((month == 2) & leap_year)
+        good_dates = (year > 2000) & (year < 2100) & (month > 0) & (month < 13) & (day > 0) & (day <= month_days)
+        # datetime.date.toordinal(): days before the year, days before the month, then the day
+        past_years = year - 1
+        days_before_month = numpy.cumsum(EntryValidator.days_in_month)[numpy.clip(month - 1, 0, 12)] + \
+            ((month > 2) & leap_year)
+        ordinals = past_years * 365 + past_years // 4 - past_years // 100 + past_years // 400 + \
+            days_before_month + day
+        hours = [value if EntryValidator.hours_pattern.match(str(value)) else 'nan' for value in hours]
+        hours = numpy.asarray(hours, dtype=float)
+        good_hours = (hours > 0) & (hours < 24.05)    # nan fails both comparisons
+        return (numpy.where(good_dates, ordinals, 0).tolist(),
+                numpy.where(good_hours, 0, EntryValidator.BAD_HOURS).tolist())
+
+    @staticmethod
+    def validate_rows(rows, list_projects=None):
+        '''
+        checks dictionary rows (split into columns first)
+        :param rows: list of dictionary rows
+        :param list_projects: project names must be in it when given
+        :return: list of error codes, one for each row
+        '''
+        return EntryValidator.check_rows(rows, list_projects)[0]
+
+    @staticmethod
+    def check_rows(rows, list_projects=None):
+        '''
+        checks dictionary rows like validate_rows and also gives their dates as ordinals
+        :return: list of error codes, list of date ordinals (0 where the date is not valid)
+        '''
+        return EntryValidator.check_columns([row['EmployeeName'] for row in rows],
+                                            [row['ProjectName'] for row in rows],
+                                            [row['FullDate'] for row in rows],
+                                            [row['HoursWorked'] for row in rows], list_projects)
+
+
+class EmployeeHours():
+    '''
+    manages the user input with setter properties,
+    dict_method() saves all the data for an entry as a dictionary row
+    '''
+
+    def __init__(self, entry_num='', employee_name='', project_name='', full_date='', hours_worked=''):
+        self.__entry_num = entry_num
+        self.__employee_name = employee_name
+        self.__project_name = project_name
+        self.__full_date = full_date
+        self.__hours_worked = hours_worked
+
+   # getters for all five data components
+    @property
+    def entry_num(self):
+        return str(self.__entry_num)
+
+    @property
+    def employee_name(self):
+        return str(self.__employee_name)
+
+    @property
+    def project_name(self):
+        return str(self.__project_name)
+
+    @property
+    def full_date(self):
+        return str(self.__full_date)
+
+    @property
+    def hours_worked(self):
+        return str(self.__hours_worked)
+
+
+    # setters for all five data components; if any are not set and remain '',
+    # the user input is rejected in the next step
+    @entry_num.setter
+    def entry_num(self, value):
+        self.__entry_num = str(value)    # value was assigned from the counter in the IO method
+
+    @employee_name.setter
+    def employee_name(self, value):
+        if EntryValidator.name_code(value) == 0:  # checks that it is not empty or numeric
+            value = value.strip().lower().title()    # strip, lower, and title case
+            self.__employee_name = value     # sets it if condition fulfilled
+        # otherwise, it remains as '' (i.e., an empty string)
+
+    @project_name.setter
+    def project_name(self, value):
+        value = value.strip()            # strip
+        self.__project_name = value      # in the IO method it was verified that entry was
+                                         # present in the project list
+
+    @full_date.setter
+    def full_date(self, value):     # checks that the date is a calendar date between 2001 and 2099
+        if EntryValidator.date_code(value) == 0:
+            self.__full_date = value.strip()  # sets it if the date is valid
+        # otherwise, it remains as '' (i.e., an empty string)
+
+    @hours_worked.setter
+    def hours_worked(self, value):
+        if EntryValidator.hours_code(value) == 0:  # checks that value is logical for number of hours in a day
+            self.__hours_worked = float(value)
+        # otherwise, it remains as '' (i.e., an empty string)
+
+    def dict_method(self):
+        """
+        method for composing all data into a dictionary row
+        :return: entry_dictionary
+        """
+        entry_dictionary = EntryRow({'EntryNum':self.__entry_num,'EmployeeName':self.__employee_name,
+                                     'ProjectName':self.__project_name,'FullDate':self.__full_date,
+                                     'HoursWorked':self.__hours_worked})
+        return entry_dictionary    # this is used to add list of dictionaries which can be written to csv file
+
+    def record_method(self):
+        """
+        method for composing all data into a compact EntryRecord
+        :return: EntryRecord
+        """
+        return EntryRecord.from_row(self.dict_method())
+
+
+class EntryRow(dict):
+    '''
+    dictionary row that also carries its date as an integer ordinal, so the indexes
+    sort and group it without parsing FullDate again; the ordinal is given by the
+    reader (EntryValidator works it out while checking the rows) or by
+    SortedEntryIndex.date_of the first time it is asked for, and is forgotten when
+    FullDate is changed
+    '''
+
+    __slots__ = ('date_ordinal',)
+
+    def __init__(self, values=(), date_ordinal=None):
+        dict.__init__(self, values)
+        if date_ordinal is not None:
+            self.date_ordinal = date_ordinal
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        if key == 'FullDate' and hasattr(self, 'date_ordinal'):
+            del self.date_ordinal    # worked out again from the new date when it is needed
+
+    def __reduce__(self):    # the ordinal is worked out again after a copy or a pickle
+        return EntryRow, (dict(self),)
+
+
+class EntryRecord(Mapping):
+    '''
+    compact replacement for a dictionary row: the five values are kept in __slots__,
+    names are interned (one copy of each name in memory), the date is kept as an
+    integer ordinal and the hours as a float;
+    it can be read and written with the same keys as a dictionary row
+    '''
+
+    __slots__ = ('entry_num', 'employee_name', 'project_name', 'date_ordinal', 'hours_worked')
+    fieldnames = ('EntryNum', 'EmployeeName', 'ProjectName', 'FullDate', 'HoursWorked')
+
+    def __init__(self, entry_num, employee_name, project_name, date_ordinal, hours_worked):
+        self.entry_num = int(entry_num)
+        self.employee_name = sys.intern(employee_name)
+        self.project_name = sys.intern(project_name)
+        self.date_ordinal = int(date_ordinal)
+        self.hours_worked = float(hours_worked)
+
+    @staticmethod
+    def date_to_ordinal(value):
+        '''
+        converts a date string (formatted as 02/02/2021) to an integer ordinal
+        :param value:
+        :return: integer (raises ValueError if it is not a calendar date)
+        '''
+        month, day, year = str(value).strip().split('/')
+        return datetime.date(int(year), int(month), int(day)).toordinal()
+
+    @staticmethod
+    def ordinal_to_date(ordinal):
+        '''
+        converts an integer ordinal back to a date string (formatted as 2/2/2021)
+        :param ordinal:
+        :return: string
+        '''
+        date = datetime.date.fromordinal(ordinal)
+        return str(date.month) + '/' + str(date.day) + '/' + str(date.year)
+
+    @classmethod
+    def from_row(cls, row):
+        '''
+        builds a record from a dictionary row
+        :param row:
+        :return: EntryRecord (raises ValueError if the date or hours can not be converted)
+        '''
+        date_ordinal = getattr(row, 'date_ordinal', 0) or cls.date_to_ordinal(row['FullDate'])
+        return cls(row['EntryNum'], row['EmployeeName'], row['ProjectName'], date_ordinal, row['HoursWorked'])
+
+    def __getitem__(self, key):
+        if key == 'EntryNum':
+            return str(self.entry_num)    # entry numbers are compared as strings elsewhere
+        elif key == 'EmployeeName':
+            return self.employee_name
+        elif key == 'ProjectName':
+            return self.project_name
+        elif key == 'FullDate':
+            return self.ordinal_to_date(self.date_ordinal)
+        elif key == 'HoursWorked':
+            return self.hours_worked
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == 'EntryNum':
+            self.entry_num = int(value)
+        elif key == 'EmployeeName':
+            self.employee_name = sys.intern(str(value))
+        elif key == 'ProjectName':
+            self.project_name = sys.intern(str(value))
+        elif key == 'FullDate':
+            self.date_ordinal = self.date_to_ordinal(value)
+        elif key == 'HoursWorked':
+            self.hours_worked = float(value)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.fieldnames)
+
+    def __len__(self):
+        return len(self.fieldnames)
+
+    def __repr__(self):
+        return 'EntryRecord(' + repr(dict(self)) + ')'
+
+
+class EntryColumns:
+    '''
+    column layout for many entries: numbers are kept in arrays and each
+    name is stored once in a string table and referred to by its id
+    '''
+
+    def __init__(self, rows=()):
+        self.entry_nums = array('q')      # entry numbers
+        self.employee_ids = array('l')    # ids into the names string table
+        self.project_ids = array('l')     # ids into the names string table
+        self.date_ordinals = array('l')   # dates as integer ordinals
+        self.hours = array('d')           # hours worked as floats
+        self.names = []                   # string table (employee and project names)
+        self.__name_ids = {}              # name -> id in the string table
+        for row in rows:
+            self.append(row)
+
+    def __len__(self):
+        return len(self.entry_nums)
+
+    def __iter__(self):
+        for position in range(len(self.entry_nums)):
+            yield self.record(position)
+
+    def name_id(self, name):
+        '''
+        returns the id of a name in the string table (adding it when it is new)
+        :param name:
+        :return: integer
+        '''
+        name_id = self.__name_ids.get(name)
+        if name_id is None:
+            name_id = self.__name_ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return name_id
+
+    def append(self, row):
+        '''
+        adds a dictionary row or an EntryRecord as one element of each column
+        :param row:
+        :return: nothing
+        '''
+        if type(row) is not EntryRecord:
+            row = EntryRecord.from_row(row)    # raises ValueError before any column is changed
+        self.entry_nums.append(row.entry_num)
+        self.employee_ids.append(self.name_id(row.employee_name))
+        self.project_ids.append(self.name_id(row.project_name))
+        self.date_ordinals.append(row.date_ordinal)
+        self.hours.append(row.hours_worked)
+
+    def swap_remove(self, position):
+        '''
+        removes the element at a position by moving the last element into it (as EntryStore.pop does)
+        :param position:
+        :return: nothing
+        '''
+        for column in (self.entry_nums, self.employee_ids, self.project_ids, self.date_ordinals, self.hours):
+            last = column.pop()
+            if position < len(column):
+                column[position] = last
+
+    def keep(self, positions):
+        '''
+        keeps only the elements at some positions (in that order)
+        :param positions: list of positions
+        :return: nothing
+        '''
+        self.entry_nums = array('q', [self.entry_nums[position] for position in positions])
+        self.employee_ids = array('l', [self.employee_ids[position] for position in positions])
+        self.project_ids = array('l', [self.project_ids[position] for position in positions])
+        self.date_ordinals = array('l', [self.date_ordinals[position] for position in positions])
+        self.hours = array('d', [self.hours[position] for position in positions])
+
+    def record(self, position):
+        '''
+        builds the EntryRecord stored at a position of the columns
+        :param position:
+        :return: EntryRecord
+        '''
+        return EntryRecord(self.entry_nums[position], self.names[self.employee_ids[position]],
+                           self.names[self.project_ids[position]], self.date_ordinals[position],
+                           self.hours[position])
+
+
+class EntryStore:
+    '''
+    holds the dictionary rows together with an index of EntryNum -> position in the list,
+    so an entry is found and removed without scanning the whole list;
+    a removed row is replaced by the last row of the list (swap-remove)
+    '''
+
+    def __init__(self, rows=(), compact=False):
+        self.compact = compact   # True when the rows are EntryRecords rather than dictionaries
+        self.__rows = []     # list of dictionary rows (in no particular order)
+        self.__index = {}    # EntryNum (string) -> position of the row in the list
+        self.__added = {}    # rows added since the last save (keyed by id of the row)
+        self.__removed = {}  # rows removed since the last save (keyed by id of the row)
+        self.__listeners = []   # objects told about every added and removed row
+        self.sorted_index = None    # SortedEntryIndex that keeps the rows in display order (optional)
+        self.__filter_index = None  # EntryFilterIndex, built the first time a filtered page is asked for
+        self.disk_state = None      # state of the data file when it was last read or saved (see Processor.disk_state)
+        self.__duplicate_detector = None  # DuplicateDetector, built the first time an entry is checked
+        self.__columns = None       # EntryColumns in the same order as the rows, built for the first report
+        self.__aggregate_totals = None    # AggregateTotals, built the first time the totals are asked for
+        for row in rows:
+            self.append(row)
+        self.clear_changes()    # rows given at the start are already saved
+
+    def __len__(self):
+        return len(self.__rows)
+
+    def __iter__(self):
+        return iter(self.__rows)
+
+    def __contains__(self, entry_num):
+        return str(entry_num).strip() in self.__index
+
+    def append(self, row, track=True):
+        '''
+        adds a dictionary row to the store
+        :param row:
+        :param track: False for a row that is already in the data file (saved by someone else)
+        :return: nothing
+        '''
+        entry_num = str(row['EntryNum']).strip()
+        if entry_num in self.__index:
+            raise ValueError('Entry number ' + entry_num + ' is already in the list.')
+        self.__index[entry_num] = len(self.__rows)
+        self.__rows.append(row)
+        if self.__columns is not None:
+            try:
+                self.__columns.append(row)
+            except ValueError:    # a row the reports can not total: the columns are given up
+                self.__columns = None
+        if self.__removed.pop(id(row), None) is None and track:    # putting back a removed row cancels the removal
+            self.__added[id(row)] = row
+        for listener in self.__listeners:
+            listener.entry_added(row)
+
+    def get(self, entry_num, default=None):
+        '''
+        looks up a row by its entry number
+        :param entry_num:
+        :param default: returned when the entry number is not in the store
+        :return: dictionary row
+        '''
+        position = self.__index.get(str(entry_num).strip())
+        if position is None:
+            return default
+        return self.__rows[position]
+
+    def pop(self, entry_num, default=None, track=True):
+        '''
+        removes a row by its entry number
+        :param entry_num:
+        :param default: returned when the entry number is not in the store
+        :param track: False for a row that is already gone from the data file (removed by someone else)
+        :return: the removed dictionary row
+        '''
+        position = self.__index.pop(str(entry_num).strip(), None)
+        if position is None:
+            return default
+        removed_row = self.__rows[position]
+        last_row = self.__rows.pop()
+        if position < len(self.__rows):    # move the last row into the freed position
+            self.__rows[position] = last_row
+            self.__index[str(last_row['EntryNum']).strip()] = position
+        if self.__columns is not None:
+            self.__columns.swap_remove(position)
+        self.__track_removal(removed_row, track)
+        return removed_row
+
+    def remove_many(self, entry_nums):
+        '''
+        removes several rows in one pass over the list
+        :param entry_nums: entry numbers to remove
+        :return: list of removed dictionary rows
+        '''
+        entry_nums = {str(entry_num).strip() for entry_num in entry_nums} & self.__index.keys()
+        if not entry_nums:
+            return []
+        removed_rows = []
+        kept_rows = []
+        kept_positions = []
+        for position, row in enumerate(self.__rows):
+            if str(row['EntryNum']).strip() in entry_nums:
+                removed_rows.append(row)
+                if self.__added.pop(id(row), None) is None:
+                    self.__removed[id(row)] = row
+            else:
+                kept_rows.append(row)
+                kept_positions.append(position)
+        self.__rows = kept_rows
+        if self.__columns is not None:
+            self.__columns.keep(kept_positions)
+        self.reindex()
+        for listener in self.__listeners:    # indexes that can drop many rows at once rebuild only once
+            entries_removed = getattr(listener, 'entries_removed', None)
+            if entries_removed is not None:
+                entries_removed(removed_rows)
+            else:
+                for row in removed_rows:
+                    listener.entry_removed(row)
+        return removed_rows
+
+    def __track_removal(self, row, track=True):
+        if self.__added.pop(id(row), None) is None and track:    # a row that was never saved is simply forgotten
+            self.__removed[id(row)] = row
+        for listener in self.__listeners:
+            listener.entry_removed(row)
+
+    @property
+    def filter_index(self):
+        '''
+        EntryFilterIndex for finding filtered pages of rows; it is built (from the sorted
+        index, so its groups are already in order) the first time it is needed, since
+        most runs never filter, and is then kept up to date like the other indexes
+        :return: EntryFilterIndex
+        '''
+        if self.__filter_index is None:
+            self.__filter_index = EntryFilterIndex(self.sorted_index if self.sorted_index is not None else self.__rows)
+            self.add_listener(self.__filter_index)
+        return self.__filter_index
+
+    @property
+    def aggregate_totals(self):
+        '''
+        AggregateTotals of the hours per project, employee and month; built in one pass over the
+        rows the first time they are needed (unless the totals cached with the data file were set),
+        and then kept up to date like the other indexes
+        :return: AggregateTotals
+        '''
+        if self.__aggregate_totals is None:
+            self.aggregate_totals = AggregateTotals(self.sorted_index if self.sorted_index is not None else self.__rows)
+        return self.__aggregate_totals
+
+    @aggregate_totals.setter
+    def aggregate_totals(self, aggregate_totals):
+        '''
+        :param aggregate_totals: AggregateTotals of the rows of the store (for example AggregateTotals.from_snapshot
+                                 of the totals cached with the data file)
+        '''
+        if self.__aggregate_totals is not None:
+            self.__listeners.remove(self.__aggregate_totals)
+        self.__aggregate_totals = aggregate_totals
+        self.add_listener(aggregate_totals)
+
+    @property
+    def columns(self):
+        '''
+        the rows as EntryColumns, in the same order as the rows; built the first time a report
+        needs them and then kept up to date as rows are added and removed, so a report only
+        runs the numpy step
+        :return: EntryColumns, or None when a row can not be converted (its date or hours are not valid)
+        '''
+        if self.__columns is None:
+            try:
+                self.__columns = EntryColumns(self.__rows)
+            except ValueError:
+                return None
+        return self.__columns
+
+    @property
+    def duplicate_detector(self):
+        '''
+        DuplicateDetector that flags entries logged twice and days over 24 hours; like the
+        filter index it is built the first time it is needed (an entry is added or the
+        duplicates are listed), not on every load
+        :return: DuplicateDetector
+        '''
+        if self.__duplicate_detector is None:
+            self.__duplicate_detector = DuplicateDetector(self.sorted_index if self.sorted_index is not None
+                                                          else self.__rows)
+            self.add_listener(self.__duplicate_detector)
+        return self.__duplicate_detector
+
+    def attach_sorted_index(self, sorted_index):
+        '''
+        keeps a SortedEntryIndex (which already holds the rows of the store)
+        up to date, so the rows can be listed in order without sorting
+        :param sorted_index:
+        :return: nothing
+        '''
+        self.sorted_index = sorted_index
+        self.add_listener(sorted_index)
+
+    def add_listener(self, listener):
+        '''
+        registers an object whose entry_added(row) and entry_removed(row) methods
+        are called whenever a row is added to or removed from the store
+        (used to keep indexes and counts up to date without rescanning);
+        remove_many calls its entries_removed(rows) instead, when it has one
+        :param listener:
+        :return: nothing
+        '''
+        self.__listeners.append(listener)
+
+    def added_rows(self):
+        '''
+        :return: list of rows added since the last save
+        '''
+        return list(self.__added.values())
+
+    def removed_rows(self):
+        '''
+        :return: list of rows removed since the last save
+        '''
+        return list(self.__removed.values())
+
+    def is_added(self, row):
+        '''
+        :param row:
+        :return: True if the row was added since the last save
+        '''
+        return id(row) in self.__added
+
+    def forget_change(self, row):
+        '''
+        stops tracking an added or removed row (when the same change is already in the data file)
+        :param row:
+        :return: nothing
+        '''
+        self.__added.pop(id(row), None)
+        self.__removed.pop(id(row), None)
+
+    def clear_changes(self):
+        '''
+        forgets the added and removed rows (called once they are saved)
+        :return: nothing
+        '''
+        self.__added = {}
+        self.__removed = {}
+
+    def take_changes(self):
+        '''
+        hands the added and removed rows over to a save and forgets them, so the changes made
+        while the save runs are tracked apart (see restore_changes when the save fails)
+        :return: list of added rows, list of removed rows
+        '''
+        added, removed = self.__added, self.__removed
+        self.__added, self.__removed = {}, {}
+        return list(added.values()), list(removed.values())
+
+    def restore_changes(self, added_rows, removed_rows):
+        '''
+        takes back the changes of a save that failed; a row removed since then (or put back
+        since it was removed) cancels out, as it does in append and pop
+        :param added_rows: as given by take_changes
+        :param removed_rows: as given by take_changes
+        :return: nothing
+        '''
+        for row in added_rows:
+            if self.__removed.pop(id(row), None) is None:
+                self.__added[id(row)] = row
+        for row in removed_rows:
+            if self.__added.pop(id(row), None) is None:
+                self.__removed[id(row)] = row
+
+    def reindex(self):
+        '''
+        rebuilds the index (needed after the EntryNum of the rows were rewritten)
+        :return: nothing
+        '''
+        self.__index = {str(row['EntryNum']).strip(): position for position, row in enumerate(self.__rows)}
+        if self.__columns is not None:
+            self.__columns.entry_nums = array('q', [int(row['EntryNum']) for row in self.__rows])
+
+
+class SortedEntryIndex:
+    '''
+    keeps the rows in sorted order while they are added and removed (a new row is
+    placed with a binary search); rows with the same sort key stay in the order they were added
+    '''
+
+    @staticmethod
+    def date_of(row):
+        '''
+        :param row:
+        :return: the date of a row as an ordinal (0 if it is not a valid date)
+        '''
+        try:
+            return row.date_ordinal    # EntryRows and EntryRecords carry it
+        except AttributeError:
+            pass
+        try:
+            date_ordinal = EntryRecord.date_to_ordinal(row['FullDate'])
+        except ValueError:
+            date_ordinal = 0
+        if type(row) is EntryRow:
+            row.date_ordinal = date_ordinal    # kept for the next time
+        return date_ordinal
+
+    sort_keys = {   # name -> function giving the sort key of a row
+        'project': lambda row: (row['ProjectName'], SortedEntryIndex.date_of(row)),
+        'employee': lambda row: (row['EmployeeName'], SortedEntryIndex.date_of(row)),
+        'date': lambda row: (SortedEntryIndex.date_of(row), row['ProjectName']),
+    }
+    bulk_removal = 16    # removing more rows than this at once rebuilds the lists in one pass
+
+    def __init__(self, rows=(), sort_key='project'):
+        '''
+        :param rows: rows to start with (sorted once; a list that is already in order sorts in linear time)
+        :param sort_key: a name from sort_keys or a function giving the sort key of a row
+        '''
+        self.__key = self.sort_keys[sort_key] if isinstance(sort_key, str) else sort_key
+        keyed_rows = [(self.__key(row), row) for row in rows]
+        keyed_rows.sort(key=itemgetter(0))    # a stable sort: equal keys keep the order of the rows
+        self.__keys = [key for key, row in keyed_rows]    # sorted keys (searched with bisect)
+        self.__rows = [row for key, row in keyed_rows]    # rows in the same order as the keys
+
+    def __len__(self):
+        return len(self.__rows)
+
+    def __iter__(self):
+        return iter(self.__rows)
+
+    def __getitem__(self, position):
+        return self.__rows[position]    # a slice gives a list of rows (used for pages of entries)
+
+    def between(self, low=None, high=None):
+        '''
+        finds the positions of the rows with low <= key < high
+        :param low: start of the key (for example (project,) or (date ordinal,)), or None
+        :param high: start of the first key past the range, or None
+        :return: first position, position past the last row
+        '''
+        first = 0 if low is None else bisect_left(self.__keys, low)
+        last = len(self.__keys) if high is None else bisect_left(self.__keys, high)
+        return first, last
+
+    def entry_added(self, row):
+        key = self.__key(row)
+        position = bisect_right(self.__keys, key)    # after the rows with the same key
+        self.__keys.insert(position, key)
+        self.__rows.insert(position, row)
+
+    def entry_removed(self, row):
+        key = self.__key(row)
+        first, last = bisect_left(self.__keys, key), bisect_right(self.__keys, key)
+        for position in range(first, last):    # only the rows with the same key are compared
+            if self.__rows[position] is row:
+                del self.__keys[position]
+                del self.__rows[position]
+                return
+
+    def entries_removed(self, rows):
+        '''
+        removes many rows at once: the lists are rebuilt in one pass instead of
+        deleting from them once per row
+        :param rows:
+        :return: nothing
+        '''
+        if len(rows) <= self.bulk_removal:
+            for row in rows:
+                self.entry_removed(row)
+            return
+        removed = {id(row) for row in rows}
+        kept = [position for position, row in enumerate(self.__rows) if id(row) not in removed]
+        self.__keys = [self.__keys[position] for position in kept]
+        self.__rows = [self.__rows[position] for position in kept]
+
+
+class EntryFilterIndex:
+    '''
+    indexes the rows by project, by employee (both case-insensitive) and by date,
+    each kept in date order, so filtered pages of entries are found with a binary
+    search instead of rescanning all the entries
+    '''
+
+    def __init__(self, rows=()):
+        rows = list(rows)
+        self.__by_date = SortedEntryIndex(rows, 'date')
+        self.__by_project = self.__group(rows, 'ProjectName')
+        self.__by_employee = self.__group(rows, 'EmployeeName')
+
+    @staticmethod
+    def __group(rows, field):
+        groups = {}
+        for row in rows:
+            groups.setdefault(row[field].lower(), []).append(row)
+        return {name: SortedEntryIndex(group, 'date') for name, group in groups.items()}
+
+    def entry_added(self, row):
+        self.__by_date.entry_added(row)
+        for groups, field in ((self.__by_project, 'ProjectName'), (self.__by_employee, 'EmployeeName')):
+            name = row[field].lower()
+            if name not in groups:
+                groups[name] = SortedEntryIndex(sort_key='date')
+            groups[name].entry_added(row)
+
+    def entry_removed(self, row):
+        self.__by_date.entry_removed(row)
+        for groups, field in ((self.__by_project, 'ProjectName'), (self.__by_employee, 'EmployeeName')):
+            name = row[field].lower()
+            if name in groups:
+                groups[name].entry_removed(row)
+                if not groups[name]:
+                    del groups[name]
+
+    def entries_removed(self, rows):
+        '''
+        removes many rows at once (each index is rebuilt once, see SortedEntryIndex.entries_removed)
+        :param rows:
+        :return: nothing
+        '''
+        self.__by_date.entries_removed(rows)
+        for groups, field in ((self.__by_project, 'ProjectName'), (self.__by_employee, 'EmployeeName')):
+            removed = {}
+            for row in rows:
+                removed.setdefault(row[field].lower(), []).append(row)
+            for name, group_rows in removed.items():
+                if name in groups:
+                    groups[name].entries_removed(group_rows)
+                    if not groups[name]:
+                        del groups[name]
+
+    def page(self, offset, page_size, project='', employee='', start_date=None, end_date=None):
+        '''
+        finds one page of the rows that match the filters
+        :param offset: number of matching rows to skip
+        :param page_size: number of rows on the page
+        :param project: project name (any case), or '' for all projects
+        :param employee: employee name (any case), or '' for all employees
+        :param start_date: first date (ordinal) to show, or None
+        :param end_date: last date (ordinal) to show, or None
+        :return: list of rows on the page, total number of matching rows (None when it is not known)
+        '''
+        if project:
+            index = self.__by_project.get(project.strip().lower())
+        elif employee:
+            index = self.__by_employee.get(employee.strip().lower())
+        else:
+            index = self.__by_date
+        if index is None:
+            return [], 0
+        first, last = index.between(None if start_date is None else (start_date,),
+                                    None if end_date is None else (end_date + 1,))
+        if not (project and employee):   # the index alone gives the matching rows
+            return index[first + offset:min(first + offset + page_size, last)], last - first
+        employee = employee.strip().lower()
+        matches = (index[position] for position in range(first, last)
+                   if index[position]['EmployeeName'].lower() == employee)
+        return list(islice(matches, offset, offset + page_size)), None
+
+
+class DuplicateDetector:
+    '''
+    keeps a hash index of the rows by (employee, project, date) and of the hours each employee
+    worked per day, so entries logged twice and days of more than 24 hours are found while
+    rows are added and removed (each update is a dictionary lookup, so it can stay on for
+    bulk imports); names are compared regardless of case and spacing
+    '''
+
+    max_hours_per_day = 24.0
+
+    def __init__(self, rows=()):
+        self.__rows_by_key = {}       # (employee, project, date ordinal) -> the row, or a list of the rows with that key
+        self.__hours_by_day = {}      # (employee, date ordinal) -> hours worked that day
+        self.__names = {}             # employee -> the name as it was entered
+        self.__normalized = {}        # name as it was entered -> normalized name (each name is normalized once)
+        self.__duplicate_keys = set() # keys that have more than one row
+        self.__long_days = set()      # (employee, date ordinal) with more than max_hours_per_day
+        for row in rows:
+            self.entry_added(row)
+
+    @staticmethod
+    def normalize(name):
+        '''
+        :param name:
+        :return: the name in lower case with single spaces
+        '''
+        return ' '.join(str(name).split()).casefold()
+
+    def keys_of(self, row):
+        '''
+        :param row:
+        :return: (employee, project, date ordinal), (employee, date ordinal)
+        '''
+        employee_name, project_name = row['EmployeeName'], row['ProjectName']
+        employee = self.__normalized.get(employee_name)
+        if employee is None:
+            employee = self.__normalized[employee_name] = sys.intern(self.normalize(employee_name))
+        project = self.__normalized.get(project_name)
+        if project is None:
+            project = self.__normalized[project_name] = sys.intern(self.normalize(project_name))
+        date = SortedEntryIndex.date_of(row)
+        return (employee, project, date), (employee, date)
+
+    @staticmethod
+    def describe(row, same_entry_nums, day_hours):
+        '''
+        :param row: the new row
+        :param same_entry_nums: entry numbers of the rows with the same employee, project and date
+        :param day_hours: hours of the employee on that day, with the new row
+        :return: list of warnings
+        '''
+        warnings = []
+        if same_entry_nums:
+            warnings.append(row['EmployeeName'] + ' already has an entry on ' + row['ProjectName'] + ' for ' +
+                            str(row['FullDate']) + ' (entry ' + ', '.join(same_entry_nums) + ').')
+        if day_hours > DuplicateDetector.max_hours_per_day:
+            warnings.append(row['EmployeeName'] + ' has ' + str(round(day_hours, 2)) + ' hours on ' +
+                            str(row['FullDate']) + '.')
+        return warnings
+
+    def rows_of(self, key):
+        '''
+        :param key: (employee, project, date ordinal) from keys_of
+        :return: list of the rows with that key
+        '''
+        rows = self.__rows_by_key.get(key)
+        if rows is None:
+            return []
+        return rows if type(rows) is list else [rows]
+
+    def check(self, row):
+        '''
+        finds what a new row clashes with (call it before the row is added)
+        :param row:
+        :return: list of warnings (empty when there is nothing to warn about)
+        '''
+        key, day = self.keys_of(row)
+        same_entry_nums = [str(same_row['EntryNum']) for same_row in self.rows_of(key)]
+        return self.describe(row, same_entry_nums, self.__hours_by_day.get(day, 0.0) + float(row['HoursWorked']))
+
+    def entry_added(self, row):
+        key, day = self.keys_of(row)
+        same_rows = self.__rows_by_key.get(key)
+        if same_rows is None:
+            self.__rows_by_key[key] = row    # most keys have a single row, which is kept without a list
+        elif type(same_rows) is list:
+            same_rows.append(row)
+        else:
+            self.__rows_by_key[key] = [same_rows, row]
+            self.__duplicate_keys.add(key)
+        hours = round(self.__hours_by_day.get(day, 0.0) + float(row['HoursWorked']), 6)
+        self.__hours_by_day[day] = hours
+        self.__names[day[0]] = row['EmployeeName']
+        if hours > self.max_hours_per_day:
+            self.__long_days.add(day)
+
+    def entry_removed(self, row):
+        key, day = self.keys_of(row)
+        same_rows = self.__rows_by_key.get(key)
+        if same_rows is row:
+            del self.__rows_by_key[key]
+        elif type(same_rows) is list:
+            for position, same_row in enumerate(same_rows):
+                if same_row is row:
+                    del same_rows[position]
+                    break
+            if len(same_rows) == 1:
+                self.__rows_by_key[key] = same_rows[0]
+                self.__duplicate_keys.discard(key)
+        hours = round(self.__hours_by_day.get(day, 0.0) - float(row['HoursWorked']), 6)
+        if hours > 0:
+            self.__hours_by_day[day] = hours
+        else:
+            self.__hours_by_day.pop(day, None)
+        if hours <= self.max_hours_per_day:
+            self.__long_days.discard(day)
+
+    def check_rows(self, rows):
+        '''
+        checks new rows one after the other, as they would be added (so rows that repeat
+        each other are found too); the rows are added to the detector
+        :param rows:
+        :return: list of warnings
+        '''
+        warnings = []
+        for row in rows:
+            warnings.extend(self.check(row))
+            self.entry_added(row)
+        return warnings
+
+    def duplicates(self):
+        '''
+        :return: list of groups of rows with the same employee, project and date
+        '''
+        return [list(self.__rows_by_key[key]) for key in sorted(self.__duplicate_keys)]
+
+    def long_days(self):
+        '''
+        :return: list of (employee name, date, hours) for days of more than max_hours_per_day
+        '''
+        return [(self.__names[employee], EntryRecord.ordinal_to_date(date), self.__hours_by_day[(employee, date)])
+                for employee, date in sorted(self.__long_days)]
+
+
+class AggregateTotals:
+    '''
+    running totals of the hours and entries per project, per employee and per project and
+    month, kept up to date as rows are added and removed (each update is a few dictionary
+    lookups), so summaries never need a pass over the entries; the totals can be saved
+    next to the data file (see Processor.write_totals)
+    '''
+
+    def __init__(self, rows=()):
+        self.projects = {}     # project name -> [hours, entries]
+        self.employees = {}    # employee name -> [hours, entries]
+        self.months = {}       # (project name, month as 2020-01) -> [hours, entries]
+        for row in rows:
+            self.entry_added(row)
+
+    @staticmethod
+    def month_of(ordinal):
+        '''
+        :param ordinal: date as an ordinal
+        :return: its month formatted as 2020-01 ('' if it is not a valid date)
+        '''
+        if not ordinal:
+            return ''
+        date = datetime.date.fromordinal(ordinal)
+        return '%04d-%02d' % (date.year, date.month)
+
+    @staticmethod
+    def __change(totals, key, hours, entries):
+        total = totals.get(key)
+        if total is None:
+            total = totals[key] = [0.0, 0]
+        total[0] = round(total[0] + hours, 6)
+        total[1] += entries
+        if total[1] <= 0:
+            del totals[key]
+
+    def __update(self, row, sign):
+        hours = sign * float(row['HoursWorked'])
+        self.__change(self.projects, row['ProjectName'], hours, sign)
+        self.__change(self.employees, row['EmployeeName'], hours, sign)
+        self.__change(self.months, (row['ProjectName'], self.month_of(SortedEntryIndex.date_of(row))), hours, sign)
+
+    def entry_added(self, row):
+        self.__update(row, 1)
+
+    def entry_removed(self, row):
+        self.__update(row, -1)
+
+    @staticmethod
+    def from_snapshot(snapshot):
+        '''
+        :param snapshot: as given by snapshot() (the totals cached with a data file)
+        :return: AggregateTotals with those totals, without a pass over the rows
+        '''
+        aggregate_totals = AggregateTotals()
+        aggregate_totals.projects = {name: [hours, entries] for name, hours, entries in snapshot['projects']}
+        aggregate_totals.employees = {name: [hours, entries] for name, hours, entries in snapshot['employees']}
+        aggregate_totals.months = {(project, month): [hours, entries]
+                                   for project, month, hours, entries in snapshot['months']}
+        return aggregate_totals
+
+    def snapshot(self):
+        '''
+        :return: dictionary of sorted lists: projects and employees as [name, hours, entries],
+                 months as [project name, month, hours, entries]
+        '''
+        return {'projects': [[name, hours, entries] for name, (hours, entries) in sorted(self.projects.items())],
+                'employees': [[name, hours, entries] for name, (hours, entries) in sorted(self.employees.items())],
+                'months': [[project, month, hours, entries]
+                           for (project, month), (hours, entries) in sorted(self.months.items())]}
+
+
+class ProjectRegistry:
+    '''
+    the list of projects: names are looked up regardless of case, a list of the names
+    is kept in sorted order as projects are added and the entries per project are counted
+    '''
+
+    def __init__(self, names=()):
+        self.__names = {}          # lower case name -> name as first entered
+        self.__sorted_names = []   # names kept in sorted order
+        self.__entry_counts = Counter()   # lower case name -> number of entries
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self.__sorted_names)
+
+    def __iter__(self):
+        return iter(self.__sorted_names)    # projects in alphabetical order
+
+    def __contains__(self, name):
+        return self.key(name) in self.__names
+
+    @staticmethod
+    def key(name):
+        '''
+        :param name: project name in any case
+        :return: the name the project is kept under (lower case, without surrounding spaces)
+        '''
+        return str(name).strip().lower()
+
+    def get(self, name, default=None):
+        '''
+        :param name: project name in any case
+        :return: the project name as it was first entered
+        '''
+        return self.__names.get(self.key(name), default)
+
+    def add(self, name):
+        '''
+        adds a project (unless it is already in the registry)
+        :param name:
+        :return: True if the project was new
+        '''
+        name, key = str(name).strip(), self.key(name)
+        if key in self.__names:
+            return False
+        self.__names[key] = name
+        insort(self.__sorted_names, name)
+        return True
+
+    def entry_count(self, name):
+        '''
+        :param name: project name in any case
+        :return: number of entries on the project
+        '''
+        return self.__entry_counts[self.key(name)]
+
+    def set_entry_count(self, name, count):
+        '''
+        adds the project (if needed) with a number of entries counted elsewhere (by a database query)
+        :param name:
+        :param count:
+        :return: nothing
+        '''
+        self.add(name)
+        self.__entry_counts[self.key(name)] = count
+
+    def entry_added(self, row):
+        key = self.key(row['ProjectName'])
+        if key not in self.__names:
+            self.add(row['ProjectName'])
+        self.__entry_counts[key] += 1
+
+    def entry_removed(self, row):
+        self.__entry_counts[self.key(row['ProjectName'])] -= 1
@@ -0,0 +1,227 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Monthly export of the project tracker
+# Description: Writes the entries of a data file into one file per month of FullDate, so
+#              analytics can read a single month without parsing the whole history.
+#              1) Formats: csv.gz (gzip), csv.zst (when the zstandard module is installed)
+#              and npz (numpy columns, when numpy is installed).
+#              2) The data file is streamed twice: the first pass only computes a digest of each
+#              month, the second writes the months whose digest differs from the manifest
+#              (manifest.json in the export folder), so unchanged months are not rewritten.
+#              The digest does not depend on the order of the rows, so a data file that was
+#              only sorted again (a full save, a compaction) does not export anything.
+#              3) EntryNum is left out: the entries are renumbered on every load, and keeping it
+#              would change every later month whenever one entry is removed.
+#              Example: python FinalHedyK.py --export exports/ --export-format csv.gz,npz
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+#                   10/17/2026, The digest of a month no longer depends on the order of its rows
+# -------------------------------------------------------------------------------------------- #
+
+import os        # module for file handling
+import io        # module for writing text to the compressed files
+import csv       # module for writing the csv partitions
+import gzip      # module for the csv.gz partitions
+import json      # module for the manifest
+import hashlib   # module for the digest of each month
+import datetime  # module for the dates of the npz columns
+from array import array    # compact columns of the npz partitions
+try:
+    import zstandard   # optional: csv.zst partitions
+except ImportError:
+    zstandard = None
+
+from .data import numpy, SortedEntryIndex, AggregateTotals
+from .processing import EntryStream, Processor
+from .storage import SqliteStorage
+
+
+class MonthlyExporter:
+    '''
+    exports the entries partitioned by month; only the months that changed since the
+    last export (or that are missing a format) are written again
+    '''
+
+    fieldnames = ['EmployeeName', 'ProjectName', 'FullDate', 'HoursWorked']
+    manifest_name = 'manifest.json'
+    digest_modulus = 1 << 256    # the row hashes (sha256) of a month are added up modulo 2 ** 256
+    unix_epoch = datetime.date(1970, 1, 1).toordinal()    # npz dates are days since 1/1/1970 (datetime64[D])
+
+    def __init__(self, directory, formats=None):
+        '''
+        :param directory: export folder (created when it does not exist)
+        :param formats: list of 'csv.gz', 'csv.zst' and 'npz'; None for csv.gz (and npz with numpy)
+        '''
+        if formats is None:
+            formats = ['csv.gz'] + (['npz'] if numpy is not None else [])
+        for file_format in formats:
+            if file_format not in self.available_formats():
+                raise ValueError('Export format ' + file_format + ' is not available (choose from ' +
+                                 ', '.join(self.available_formats()) + ').')
+        self.directory = directory
+        self.formats = list(formats)
+
+    @staticmethod
+    def available_formats():
+        '''
+        :return: the formats that can be written with the installed modules
+        '''
+        return ['csv.gz'] + (['csv.zst'] if zstandard is not None else []) + (['npz'] if numpy is not None else [])
+
+    @staticmethod
+    def rows_of_file(file_name):
+        '''
+        :param file_name: csv, .bin or SQLite data file
+        :return: function that gives a new iterator of the rows each time it is called
+        '''
+        if SqliteStorage.is_sqlite(file_name):
+            def rows():
+                database = SqliteStorage(file_name)
+                try:
+                    yield from database.rows()
+                finally:
+                    database.close()
+            return rows
+        return lambda: EntryStream(file_name)
+
+    @staticmethod
+    def month_of(row):
+        '''
+        :param row:
+        :return: month of the row formatted as 2020-01 ('' if its date is not valid)
+        '''
+        return AggregateTotals.month_of(SortedEntryIndex.date_of(row))
+
+    def partition_name(self, month, file_format):
+        return os.path.join(self.directory, month + '.' + file_format)
+
+    def read_manifest(self):
+        '''
+        :return: dictionary month -> {'digest', 'rows', 'formats'} from the last export
+        '''
+        try:
+            with open(os.path.join(self.directory, self.manifest_name)) as manifest_file:
+                return json.load(manifest_file)['partitions']
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def write_manifest(self, source, partitions):
+        manifest_file_name = os.path.join(self.directory, self.manifest_name)
+        with open(manifest_file_name + '.tmp', 'w') as manifest_file:
+            json.dump({'source': source, 'partitions': partitions}, manifest_file, indent=1, sort_keys=True)
+        os.replace(manifest_file_name + '.tmp', manifest_file_name)
+
+    def digests(self, rows):
+        '''
+        first pass: a digest of the rows of each month; it is the sum of the hashes of the rows,
+        so it does not depend on their order (a sum rather than an XOR, so a row logged twice
+        does not cancel itself out)
+        :param rows: iterable of dictionary rows or EntryRecords
+        :return: dictionary month -> [digest, number of rows]
+        '''
+        sums = {}
+        counts = {}
+        for row in rows:
+            month = self.month_of(row)
+            if not month:
+                continue
+            row_hash = hashlib.sha256('\x1f'.join(str(row[key]) for key in self.fieldnames).encode()).digest()
+            sums[month] = sums.get(month, 0) + int.from_bytes(row_hash, 'big')
+            counts[month] = counts.get(month, 0) + 1
+        return {month: ['{:064x}'.format(total % self.digest_modulus), counts[month]]
+                for month, total in sums.items()}
+
+    def open_csv(self, file_name, file_format):
+        '''
+        :return: text file that compresses what is written to it (the gzip header has no time stamp,
+                 so the same rows always give the same bytes)
+        '''
+        if file_format == 'csv.gz':
+            binary_file = gzip.GzipFile(file_name, 'wb', mtime=0)
+        else:
+            binary_file = zstandard.ZstdCompressor().stream_writer(open(file_name, 'wb'))
+        return io.TextIOWrapper(binary_file, newline='', encoding='utf-8')
+
+    def write_npz(self, file_name, columns):
+        employees, projects, dates, hours = columns
+        with open(file_name, 'wb') as npz_file:
+            numpy.savez_compressed(npz_file,
+                                   employee_name=numpy.array(employees, dtype=str),
+                                   project_name=numpy.array(projects, dtype=str),
+                                   full_date=numpy.asarray(dates, dtype='int64').astype('datetime64[D]'),
+                                   hours_worked=numpy.asarray(hours, dtype='float64'))
+
+    def export(self, rows_factory, source=''):
+        '''
+        writes the months that changed since the last export; months that no longer have
+        entries are deleted
+        :param rows_factory: function that gives a new iterator of the rows (called twice)
+        :param source: name of the data file (kept in the manifest)
+        :return: status
+        '''
+        os.makedirs(self.directory, exist_ok=True)
+        known = self.read_manifest()
+        digests = self.digests(rows_factory())
+        changed = {month for month, (digest, count) in digests.items()
+                   if known.get(month, {}).get('digest') != digest or
+                   any(not os.path.exists(self.partition_name(month, file_format)) for file_format in self.formats)}
+        writers, csv_files, columns = {}, [], {}
+        try:
+            if changed:    # second pass: only the rows of the changed months are written
+                for row in rows_factory():
+                    month = self.month_of(row)
+                    if month not in changed:
+                        continue
+                    if month not in writers:
+                        writers[month] = []
+                        for file_format in self.formats:
+                            if file_format == 'npz':
+                                columns[month] = ([], [], array('l'), array('d'))
+                            else:
+                                csv_file = self.open_csv(self.partition_name(month, file_format) + '.tmp', file_format)
+                                csv_files.append(csv_file)
+                                writer = csv.writer(csv_file)
+                                writer.writerow(self.fieldnames)
+                                writers[month].append(writer)
+                    values = [row[key] for key in self.fieldnames]
+                    for writer in writers[month]:
+                        writer.writerow(values)
+                    if month in columns:
+                        employees, projects, dates, hours = columns[month]
+                        employees.append(values[0])
+                        projects.append(values[1])
+                        dates.append(SortedEntryIndex.date_of(row) - self.unix_epoch)
+                        hours.append(float(values[3]))
+        finally:
+            for csv_file in csv_files:
+                csv_file.close()
+        for month, month_columns in columns.items():
+            self.write_npz(self.partition_name(month, 'npz') + '.tmp', month_columns)
+        for month in changed:
+            for file_format in self.formats:
+                os.replace(self.partition_name(month, file_format) + '.tmp', self.partition_name(month, file_format))
+            for file_format in set(known.get(month, {}).get('formats', [])) - set(self.formats):
+                if os.path.exists(self.partition_name(month, file_format)):    # out of date, not written this time
+                    os.remove(self.partition_name(month, file_format))
+        removed = set(known) - set(digests)
+        for month in removed:    # no entries left in that month
+            for file_format in known[month].get('formats', []):
+                if os.path.exists(self.partition_name(month, file_format)):
+                    os.remove(self.partition_name(month, file_format))
+        partitions = {month: {'digest': digest, 'rows': count,
+                              'formats': sorted(set(self.formats) | (set() if month in changed else
+                                                                     set(known[month].get('formats', []))))}
+                      for month, (digest, count) in digests.items()}
+        self.write_manifest(source, partitions)
+        return 'Exported ' + str(len(digests)) + ' months to ' + self.directory + ' (' + str(len(changed)) + \
+               ' written, ' + str(len(digests) - len(changed)) + ' unchanged, ' + str(len(removed)) + ' removed).'
+
+    def export_file(self, file_name):
+        '''
+        exports a data file without loading it (the file is locked against saves while it is read)
+        :param file_name: csv, .bin or SQLite data file
+        :return: status
+        '''
+        if SqliteStorage.is_sqlite(file_name):
+            return self.export(self.rows_of_file(file_name), file_name)
+        with Processor.locked(file_name, shared=True):
+            return self.export(self.rows_of_file(file_name), file_name)
@@ -0,0 +1,182 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Instrumentation of the project tracker
+# Description: Times the hot paths (reading and saving the data file, adding and removing
+#              entries, the print functions), counts the rows they process and the bytes
+#              they read and write, and tracks the memory high-water mark.
+#              It is switched on by the TRACKER_PROFILE environment variable, read when the
+#              package is imported:
+#                 TRACKER_PROFILE=1              prints a summary when the tracker exits
+#                 TRACKER_PROFILE=run.pstats     also runs cProfile and saves its stats to run.pstats
+#                                                (python -m pstats run.pstats to browse them)
+#              When it is not set, Instrumentation.timed returns the functions unchanged,
+#              so there is no overhead at all.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+#                   10/17/2026, Bytes are counted once, by the outermost timed call, and include the journal
+# -------------------------------------------------------------------------------------------- #
+
+import os       # module for the environment variable and the file sizes
+import sys      # module for writing the summary to stderr
+import time     # module for the timings
+import atexit   # module for writing the summary when the tracker exits
+import tracemalloc    # module for the memory high-water mark
+import threading      # module for keeping the nesting of the timed calls per thread
+from functools import wraps
+try:
+    import resource   # optional: peak memory of the whole process (not available on Windows)
+except ImportError:
+    resource = None
+
+ENVIRONMENT_VARIABLE = 'TRACKER_PROFILE'
+
+
+class Instrumentation:
+    '''
+    collects the counters of the functions decorated with Instrumentation.timed
+    (only when TRACKER_PROFILE is set)
+    '''
+
+    setting = os.environ.get(ENVIRONMENT_VARIABLE, '').strip()
+    enabled = setting not in ('', '0')
+    profile_file = setting if enabled and setting.lower() not in ('1', 'true', 'yes', 'summary') else ''
+    counters = {}     # function name -> [calls, seconds, rows, bytes read, bytes written, peak memory (bytes)]
+    profiler = None   # cProfile.Profile when profile_file is set
+    local = threading.local()    # per thread: depth (nesting of the timed calls, the peak memory is reset
+                                 # by the outermost one), reading and writing (a call that counts bytes
+                                 # is running) and written (bytes reported through wrote())
+    high_water = 0    # highest memory traced during a timed call (bytes)
+
+    @staticmethod
+    def timed(rows=None, reads=False, writes=False):
+        '''
+        decorator that times a function (returns the function unchanged when instrumentation is off)
+        :param rows: function(result, args) that gives the number of rows the call processed
+        :param reads: the first argument is a file the call reads (its size counts as bytes read)
+        :param writes: the bytes the call writes to files (data file, journal, totals), as reported by
+                       the writers through wrote(), count as bytes written
+        Bytes are only counted by the outermost call that counts them, so a timed call made by
+        another one does not count the same bytes twice.
+        :return: decorator
+        '''
+        def decorate(function):
+            if not Instrumentation.enabled:
+                return function
+            name = function.__qualname__
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                local = Instrumentation.local
+                depth = getattr(local, 'depth', 0)
+                reading = reads and not getattr(local, 'reading', False)
+                writing = writes and not getattr(local, 'writing', False)
+                file_before = Instrumentation.file_stat(args[0]) if reading else None
+                memory_before = tracemalloc.get_traced_memory()[0]
+                if not depth:
+                    tracemalloc.reset_peak()
+                local.depth = depth + 1
+                if reading:
+                    local.reading = True
+                if writing:
+                    local.writing, local.written = True, 0
+                start = time.perf_counter()
+                try:
+                    result = function(*args, **kwargs)
+                finally:
+                    seconds = time.perf_counter() - start
+                    local.depth = depth
+                    if reading:
+                        local.reading = False
+                    if writing:
+                        local.writing = False
+                counter = Instrumentation.counters.setdefault(name, [0, 0.0, 0, 0, 0, 0])
+                counter[0] += 1
+                counter[1] += seconds
+                peak = tracemalloc.get_traced_memory()[1]
+                counter[5] = max(counter[5], peak - memory_before)
+                Instrumentation.high_water = max(Instrumentation.high_water, peak)
+                if rows is not None:
+                    counter[2] += rows(result, args)
+                if file_before is not None:
+                    counter[3] += file_before.st_size
+                if writing:
+                    counter[4] += local.written
+                return result
+            return wrapper
+        return decorate
+
+    @staticmethod
+    def wrote(byte_count):
+        '''
+        counts bytes written to a file, for the timed call with writes=True running on this thread
+        (the writers call it; it does nothing when instrumentation is off)
+        :param byte_count:
+        :return: nothing
+        '''
+        if Instrumentation.enabled:
+            Instrumentation.local.written = getattr(Instrumentation.local, 'written', 0) + byte_count
+
+    @staticmethod
+    def file_stat(file_name):
+        '''
+        :param file_name:
+        :return: os.stat_result, or None when the file does not exist
+        '''
+        try:
+            return os.stat(file_name)
+        except (OSError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def start():
+        '''
+        starts tracing memory (and cProfile when a stats file is given) and writes the results on exit
+        :return: nothing
+        '''
+        tracemalloc.start()
+        if Instrumentation.profile_file:
+            import cProfile    # only imported when it is used
+            Instrumentation.profiler = cProfile.Profile()
+            Instrumentation.profiler.enable()
+        atexit.register(Instrumentation.finish)
+
+    @staticmethod
+    def finish():
+        '''
+        writes the summary to stderr and the cProfile stats to the stats file
+        :return: nothing
+        '''
+        if Instrumentation.profiler is not None:
+            Instrumentation.profiler.disable()
+            Instrumentation.profiler.dump_stats(Instrumentation.profile_file)
+            print('cProfile stats saved to ' + Instrumentation.profile_file + '.', file=sys.stderr)
+        print(Instrumentation.summary(), file=sys.stderr)
+
+    @staticmethod
+    def summary():
+        '''
+        :return: table of the counters (text)
+        '''
+        if not Instrumentation.enabled:
+            return 'Instrumentation is off. Set ' + ENVIRONMENT_VARIABLE + '=1 (or a .pstats file name) ' \
+                   'before starting the tracker to record timings.'
+        lines = ['{:<36} {:>7} {:>10} {:>9} {:>11} {:>11} {:>10}'.format(
+            'Function', 'Calls', 'Seconds', 'Rows', 'Bytes read', 'Written', 'Peak KiB')]
+        for name, (calls, seconds, rows, bytes_read, bytes_written, peak) in sorted(
+                Instrumentation.counters.items(), key=lambda item: -item[1][1]):    # slowest first
+            lines.append('{:<36} {:>7} {:>10.4f} {:>9} {:>11} {:>11} {:>10.1f}'.format(
+                name, calls, seconds, rows, bytes_read, bytes_written, peak / 1024))
+        if not Instrumentation.counters:
+            lines.append('(nothing was timed yet)')
+        current, peak = tracemalloc.get_traced_memory()
+        high_water = max(Instrumentation.high_water, peak)
+        lines.append('Python memory: ' + str(round(current / 1024)) + ' KiB now, ' +
+                     str(round(high_water / 1024)) + ' KiB high-water mark.')
+        if resource is not None:    # ru_maxrss is in KiB on Linux and in bytes on macOS
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            lines.append('Process peak resident memory: ' +
+                         str(round(max_rss / 1024 if sys.platform == 'darwin' else max_rss)) + ' KiB.')
+        return '\n'.join(lines)
+
+
+if Instrumentation.enabled:
+    Instrumentation.start()
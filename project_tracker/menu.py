@@ -0,0 +1,248 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Menu of the project tracker
+# Description: main() runs the menu loop on a Session (or the batch import mode when
+#              command line arguments are given).
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Moved out of FinalHedyK.py into the project_tracker package
+#                   10/17/2026, Added the --data option (an SQLite database can be used)
+#                   10/17/2026, Added the --serve option (HTTP/JSON server)
+#                   10/17/2026, Added the --merge option (reads many data files in parallel)
+#                   10/17/2026, Added menu option 9 (possible duplicate entries)
+#                   10/17/2026, Added menu option 10 (timings, see instrumentation.py)
+#                   10/17/2026, Added the --totals option
+#                   10/17/2026, Added the --export option (monthly files, see export.py)
+#                   10/17/2026, A damaged data file is reported instead of ending with a traceback
+# -------------------------------------------------------------------------------------------- #
+
+import sys    # module for the command line arguments
+import argparse    # module for the --data option of the menu
+import json        # module for printing the --totals
+
+from .data import DEFAULT_FILE_NAME
+from .batch import BatchImporter
+from .processing import Processor
+from .presentation import IO
+from .session import Session
+from .server import ApiServer
+from .instrumentation import Instrumentation
+from .export import MonthlyExporter
+
+intPageSize = 20              # Number of entries shown on each page
+
+
+def main(arguments=None, file_name=DEFAULT_FILE_NAME):
+    """
+    runs the tracker: the batch import mode when the arguments include --import
+    (for example: python FinalHedyK.py --import hours.csv), the HTTP/JSON server with
+    --serve, otherwise the menu (python FinalHedyK.py --data hours.db runs the menu on an SQLite database)
+    :param arguments: command line arguments (without the script name); sys.argv when None
+    :param file_name: data file used by the menu (unless --data is given)
+    :return: exit code
+    """
+    if arguments is None:
+        arguments = sys.argv[1:]
+    if any(argument.startswith('--import') for argument in arguments):
+        return BatchImporter.main(arguments)
+    if arguments:
+        parser = argparse.ArgumentParser(description='Track the hours employees work on projects.')
+        parser.add_argument('--data', default=file_name,
+                            help='data file: csv, .bin, or an SQLite database (.db, .sqlite, .sqlite3)')
+        parser.add_argument('--serve', action='store_true', help='serve the entries over HTTP/JSON instead of the menu')
+        parser.add_argument('--host', default='127.0.0.1', help='address the server listens on')
+        parser.add_argument('--port', type=int, default=8080, help='port the server listens on')
+        parser.add_argument('--flush-interval', type=float, default=2.0, help='seconds between saves of the server')
+        parser.add_argument('--merge', metavar='PATTERN',
+                            help='read many data files at once (a folder or a glob such as "teams/*.csv")')
+        parser.add_argument('--output', help='file the merged entries are written to (with --merge)')
+        parser.add_argument('--workers', type=int, default=None, help='number of processes for --merge')
+        parser.add_argument('--totals', action='store_true',
+                            help='print the hours per project, employee and month as json (cached next to the '
+                                 'data file, so it is only read when it changed)')
+        parser.add_argument('--export', metavar='FOLDER',
+                            help='write the entries into one file per month (only the months that changed)')
+        parser.add_argument('--export-format', default=None,
+                            help='comma separated formats for --export: csv.gz, csv.zst (zstandard) and npz (numpy); '
+                                 'csv.gz and npz when not given')
+        parser.add_argument('--skip-duplicates', action='store_true',
+                            help='keep only the first copy of entries found in more than one file (with --merge)')
+        options = parser.parse_args(arguments)
+        file_name = options.data
+        if options.merge:
+            try:
+                list_employee_hours, list_projects, status, counter, duplicates = Processor.read_data_from_files(
+                    options.merge, workers=options.workers, skip_duplicates=options.skip_duplicates)
+            except ValueError as error:    # a damaged .bin file
+                print(error)
+                return 2
+            print(status)
+            IO.print_duplicates(duplicates)
+            if options.output:
+                print(Processor.write_data_to_file(options.output, list_employee_hours)[0])
+            return 0
+        if options.export:
+            formats = options.export_format.split(',') if options.export_format else None
+            try:
+                print(MonthlyExporter(options.export, formats).export_file(file_name))
+            except ValueError as error:
+                print(error)
+                return 2
+            return 0
+        if options.totals:
+            session = Session(file_name)
+            try:
+                print(json.dumps(session.totals()))
+            except ValueError as error:
+                print(error)
+                return 2
+            finally:
+                session.close()
+            return 0
+        if options.serve:
+            return ApiServer.run(Session(file_name), options.host, options.port, options.flush_interval)
+
+    session = Session(file_name)
+
+    # When the program starts, print header, load data from 'EmployeeProjectHours.csv' and print list of entries & list of
+    # projects
+    IO.print_header()
+    try:
+        print(session.load())   # feedback to user regarding file contents
+    except ValueError as error:    # the data file is damaged (or is not a data file)
+        print(error)
+        session.close()
+        return 2
+    print('-' * 60)
+    lstPage, intTotal = session.page(0, intPageSize)
+    IO.print_entries_page(lstPage, 0, intTotal)           # shows the first page of current data in the list
+    IO.print_current_Projects_in_list(session.projects)   # shows current projects in the list
+
+    # Display a menu of choices to the user
+    while (True):
+        # Show menu and ask user to choose a menu option
+        IO.print_menu_options()  # Shows menu
+        strChoice = IO.input_menu_choice(session.projects)  # Get menu option
+
+
+        # Process user's menu choice
+        if strChoice == '1':  # Add a new entry
+            objEntry, status, status_project = IO.input_new_entry(session.counter, session.projects)
+            if objEntry != '':
+                print(session.add_entry(objEntry))   # message to user
+            else:
+                print(status_project)   # if project was not in list of projects, message informs the user
+                print(status)           # names which of the values were not valid
+                print('Data rejected. Employee and process names should only contain letters.\n'
+                      'Dates should be entered as 01/01/2021 and be valid.\n'
+                      'Hours worked should be entered as decimals.')
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+
+        elif strChoice == '2' and session.count():  # Remove an existing entry (enter the EntryNumber)
+            strEntry = IO.input_entry_to_remove()
+            dictEntryRow, status = session.remove_entry(strEntry)
+            if dictEntryRow is None:    # the entry number was not in the list
+                print(status)
+                IO.input_press_to_continue()
+                continue  # to show the menu
+            print("The entry you chose to remove is: ")
+            print(dictEntryRow['EntryNum'],'|', dictEntryRow['ProjectName'],'|',dictEntryRow['HoursWorked'],'|',
+                  dictEntryRow['FullDate'], '|',dictEntryRow['EmployeeName'])
+            strChoice = IO.input_yes_no_choice("Are you sure you want to delete this entry? (y/n) -  ")
+            if strChoice.lower() == 'y':
+                print(status)
+            else:
+                session.restore_entry(dictEntryRow)
+                print("Entry Was Not Removed!")
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+        elif strChoice == '2' and not session.count():  # Handles the situation when there are no entries to remove
+            print("There are no entries to remove!")
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+        elif strChoice == '3':  # Save Data to File
+            strChoice = IO.input_yes_no_choice("Save this data to file? (y/n) - ")
+            if strChoice.lower() == "y":
+                print(session.save())
+                IO.input_press_to_continue()
+            else:
+                IO.input_press_to_continue("Save Cancelled!")
+            continue  # to show the menu
+
+        elif strChoice == '4':  # Reload Data from File
+            print("Warning: Unsaved Data Will Be Lost!")
+            strChoice = IO.input_yes_no_choice("Are you sure you want to reload data from file? (y/n) -  ")
+            if strChoice.lower() == 'y':
+                try:
+                    print(session.load())
+                except ValueError as error:    # the entries in the list are kept
+                    print(error)
+                    IO.input_press_to_continue()
+                    continue  # to show the menu
+                lstPage, intTotal = session.page(0, intPageSize)
+                IO.print_entries_page(lstPage, 0, intTotal)
+                IO.input_press_to_continue()
+            else:
+                IO.input_press_to_continue("File Reload Cancelled!")
+            continue  # to show the menu
+
+        elif strChoice == '5':  # Show current data in the list of dictionary rows, a page at a time
+            dictFilters = IO.input_entry_filters()
+            intOffset = 0
+            while True:
+                try:
+                    lstPage, intTotal = session.page(intOffset, intPageSize, **dictFilters)
+                except ValueError:
+                    print('Dates should be entered as 01/01/2021 and be valid.')
+                    break
+                IO.print_entries_page(lstPage, intOffset, intTotal)
+                intOffset += intPageSize
+                if len(lstPage) < intPageSize or intOffset == intTotal or \
+                        IO.input_yes_no_choice("Press [Enter] for the next page or q to stop - ") == 'q':
+                    break
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+        elif strChoice == '6':   # Add a project to list of projects
+            IO.print_current_Projects_in_list(session.projects)
+            strChoice = IO.input_yes_no_choice("Are you sure you want to add a new project name? (y/n) -  ")
+            if strChoice.lower() == 'y':
+                _, status = IO.input_new_project(session.projects)
+                print(status)
+                IO.input_press_to_continue()
+            else:
+                IO.input_press_to_continue("Adding New Project Cancelled!")
+            continue  # to show the menu
+
+        elif strChoice == '7':  # Exit Program
+            input("Press ENTER to exit.")
+            break  # and Exit
+
+        elif strChoice == '8':  # Show hours totals per project, employee, day or week
+            strGroupBy, strStartDate, strEndDate = IO.input_report_options()
+            try:
+                IO.print_hours_report(session.report(strGroupBy, strStartDate, strEndDate), strGroupBy)
+            except ValueError:
+                print('Report rejected. Choose project, employee, day or week and\n'
+                      'enter dates as 01/01/2021.')
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+        elif strChoice == '9':  # Show entries logged twice and days over 24 hours
+            lstGroups, lstLongDays = session.duplicates()
+            IO.print_possible_duplicates(lstGroups, lstLongDays)
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+        elif strChoice == '10':  # Show the timings of this session (when TRACKER_PROFILE is set)
+            print(Instrumentation.summary())
+            print('-' * 60)
+            IO.input_press_to_continue()
+            continue  # to show the menu
+
+        else:
+            print("Please choose from menu options")
+    session.close()
+    return 0
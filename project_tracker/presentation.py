@@ -0,0 +1,327 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Presentation classes of the project tracker
+# Description: User interface: menu options, capturing the user's choices and displaying
+#              entries, projects and reports.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Moved out of FinalHedyK.py into the project_tracker package
+#                   10/17/2026, Added print_duplicates (for reading many data files at once)
+#                   10/17/2026, Added print_possible_duplicates (menu option 9)
+#                   10/17/2026, The print functions are timed when TRACKER_PROFILE is set; menu option 10
+# -------------------------------------------------------------------------------------------- #
+
+import sys    # module for writing a page of entries at once
+
+from .data import EntryValidator, EmployeeHours
+from .processing import Processor
+from .instrumentation import Instrumentation
+
+# -- Presentation (I/O) -- #
+# user interface including menu options, capturing user's choice and
+# displaying the list of project employee-hours as well as list of projects
+
+USER_RETURN_NOTHING_ = """  Display a menu of choices to the user
+
+        :return: nothing
+        """
+
+
+class IO:
+    """ Performs Input and Output functions """
+
+    @staticmethod
+    def print_header():
+        """
+        Displays a description of what the script does and
+        instructions for valid input formats
+        :return:
+        """
+        print('''
+        This program keeps track of number of hours each employee has worked on a specific project.
+        Employee and project names should only contain letters.
+        Dates should be entered as 01/01/2021 and hours worked per project as decimals 
+        - for example 3.5 represents 3 and a half hours.
+        Add a new project name to the project list before adding it as a new entry.
+        ''')
+        print('-'*60)  # Add a line separator
+
+
+    @staticmethod
+    def print_menu_options():
+        USER_RETURN_NOTHING_
+        print('''
+        Menu of Options:
+        1) Add a new entry
+        2) Delete an existing entry
+        3) Save data to CSV File        
+        4) Reload data from CSV File
+        5) Show list of entries (by page)
+        6) Show & add to project list
+        7) Exit program
+        8) Show hours totals report
+        9) Show possible duplicate entries
+        10) Show timings (TRACKER_PROFILE)
+        ''')
+        print('-'*60)  # Add a line separator
+
+    @staticmethod
+    def input_menu_choice(list_projects):
+        """ Gets the menu choice from a user &
+            enforces entering a project name (default choice 6) if
+            project list is empty
+
+        :param list_projects: the ProjectRegistry
+        :return: string
+        """
+        if not list_projects:
+            print("There are no projects in the list. Please enter a project name before "   
+                  "starting to track employee work hours on a project.")
+            choice = '6'
+        else:
+            choice = str(input("Which option would you like to perform? [1 to 10] - ")).strip()
+        print()  # Add an extra line for looks
+        return choice
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[0]))
+    def print_current_Entries_in_list(list_employee_hours):
+        """ Shows the current entries
+
+        :param list_employee_hours
+        :return: nothing
+        """
+
+        print("----    Current entries are:    ----")
+        # checks whether list is empty; prints the list sorted based on ProjectName
+        # I re-ordered the print order for each row to highlight the hours worked per project
+        if list_employee_hours:
+            print('Entry #', '|', 'Project Name','|', 'Hours Worked','|','Date','|', 'Employee Name')
+            for row in Processor.sorted_entries(list_employee_hours):
+                print(row['EntryNum'],'|', row['ProjectName'],'|',row['HoursWorked'],'|', row['FullDate'], '|',row['EmployeeName'])
+        else:
+            print("There are no entries in the list.")
+        print('-'*60)  # Add a line separator
+
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[0]))
+    def print_entries_page(page_rows, offset, total):
+        """ Shows one page of entries, written to the screen all at once
+
+        :param page_rows: rows on the page
+        :param offset: position of the first row on the page
+        :param total: number of matching entries (None when it is not known)
+        :return: nothing
+        """
+        lines = ["----    Current entries are:    ----"]
+        if page_rows:
+            lines.append('Entry # | Project Name | Hours Worked | Date | Employee Name')
+            for row in page_rows:
+                lines.append(' | '.join(str(row[key]) for key in
+                                        ('EntryNum', 'ProjectName', 'HoursWorked', 'FullDate', 'EmployeeName')))
+            shown = 'Showing entries ' + str(offset + 1) + ' to ' + str(offset + len(page_rows))
+            lines.append(shown + ('' if total is None else ' of ' + str(total)) + '.')
+        else:
+            lines.append("There are no entries to show.")
+        lines.append('-'*60)  # Add a line separator
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    @staticmethod
+    def input_entry_filters():
+        """ Asks the user for optional filters on the entries to show
+
+        :return: dictionary of filters (project, employee, start_date, end_date)
+        """
+        filters = {}
+        if IO.input_yes_no_choice("Filter the entries? (y/n) - ") == 'y':
+            filters['project'] = input("Project name (Enter for all): ").strip()
+            filters['employee'] = input("Employee name (Enter for all): ").strip()
+            filters['start_date'] = input("Start date in 01/01/2020 format (Enter for all): ").strip()
+            filters['end_date'] = input("End date in 01/01/2020 format (Enter for all): ").strip()
+        return filters
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[0]))
+    def print_hours_report(report, group_by):
+        """ Shows the hours totals
+
+        :param report: list of (label, total hours, number of entries)
+        :param group_by: what the totals are grouped by
+        :return: nothing
+        """
+        print("----    Hours worked per " + group_by + ":    ----")
+        if report != []:
+            print(group_by.title(), '|', 'Total Hours', '|', 'Entries')
+            for label, total, count in report:
+                print(label, '|', round(total, 2), '|', count)
+        else:
+            print("There are no entries for this report.")
+        print('-'*60)  # Add a line separator
+
+    @staticmethod
+    def print_duplicates(duplicates, limit=20):
+        """ Shows the entries that were found in more than one data file
+
+        :param duplicates: list of (row, first file name, file name)
+        :param limit: most duplicates to list
+        :return: nothing
+        """
+        if not duplicates:
+            return
+        print("----    Entries found in more than one file:    ----")
+        for row, first_file_name, file_name in duplicates[:limit]:
+            print(row['EmployeeName'], '|', row['ProjectName'], '|', row['FullDate'], '|', row['HoursWorked'],
+                  '|', first_file_name, 'and', file_name)
+        if len(duplicates) > limit:
+            print('... and ' + str(len(duplicates) - limit) + ' more.')
+        print('-'*60)  # Add a line separator
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[0]) + len(args[1]))
+    def print_possible_duplicates(groups, long_days, limit=20):
+        """ Shows the entries logged more than once for the same employee, project and date,
+            and the days an employee has more than 24 hours
+
+        :param groups: lists of rows with the same employee, project and date
+        :param long_days: list of (employee name, date, hours)
+        :param limit: most groups and days to list
+        :return: nothing
+        """
+        if not groups and not long_days:
+            print("No duplicate entries or days over 24 hours were found.")
+            return
+        if groups:
+            print("----    Entries logged more than once (same employee, project & date):    ----")
+            for rows in groups[:limit]:
+                for row in rows:
+                    print(row['EntryNum'], '|', row['ProjectName'], '|', row['HoursWorked'], '|', row['FullDate'],
+                          '|', row['EmployeeName'])
+                print()
+            if len(groups) > limit:
+                print('... and ' + str(len(groups) - limit) + ' more.')
+        if long_days:
+            print("----    Days with more than 24 hours:    ----")
+            for employee_name, date, hours in long_days[:limit]:
+                print(employee_name, '|', date, '|', hours, 'hours')
+            if len(long_days) > limit:
+                print('... and ' + str(len(long_days) - limit) + ' more.')
+        print('-'*60)  # Add a line separator
+
+    @staticmethod
+    def input_report_options():
+        """ Asks the user how to group the hours totals and for an optional date range
+
+        :return: group_by, start_date, end_date (strings)
+        """
+        group_by = input("Total hours per project, employee, day or week? - ").strip().lower()
+        start_date = input("Start date in 01/01/2020 format (Enter for all): ").strip()
+        end_date = input("End date in 01/01/2020 format (Enter for all): ").strip()
+        return group_by, start_date, end_date
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[0]))
+    def print_current_Projects_in_list(list_projects):
+        """ Shows the current projects (with the number of entries on each project)
+
+        :param list_projects: a ProjectRegistry (already in alphabetical order)
+        :return: nothing
+        """
+
+        print("----    Current projects are:    ----")
+        if list_projects:   # check whether list is empty
+            for project in list_projects:
+                print(project, '(' + str(list_projects.entry_count(project)) + ' entries)')
+        else:
+            print("There are no projects in the list.\n"
+                  "Before adding new entries, add projects \n"
+                  "using MENU OPTION 6.")
+        print('-'*60)  # Add a line separator
+
+    @staticmethod
+    def input_yes_no_choice(message):
+        """ Gets a yes or no choice from the user
+
+        :return: string
+        """
+        choice = str(input(message))
+        choice = choice.strip().lower()
+        return choice
+
+    @staticmethod
+    def input_press_to_continue(optional_message=''):
+        """ Pause program and show a message before continuing
+
+        :param optional_message:  An optional message you want to display
+        :return: nothing
+        """
+        print(optional_message)
+        input('Press the [Enter] key to continue.')
+
+
+    @staticmethod
+    def input_new_entry(counter, list_projects):
+        """
+        asks for user input for data in entry row,
+        instantiates and EmployeeHours object,
+        uses setter properties to validate appropriateness of entries,
+        if all appropriate returns object, otherwise rejects it
+        :param counter: entry number for the new entry
+        :param list_projects: the ProjectRegistry the project name must be in
+        :return:new_entry_object, status, status_project
+        """
+        status_project = ""    # string for capturing the validity of the project name
+        # Step 1: capture user input
+        strEmployeeName =  input("Enter employee name: ")
+        strProjectName = input("Enter project name: ")
+        strDate = input("Enter date in 01/01/2020 format: ")
+        floatHours = input("Enter number of hours: ")
+
+        # Step 2A: instantiate an object of EmployeeHours & set values
+        new_entry_object = EmployeeHours()
+        new_entry_object.entry_num = counter   # once entry is verified will add one to counter
+        new_entry_object.employee_name = strEmployeeName
+        new_entry_object.full_date = strDate
+        new_entry_object.hours_worked = floatHours
+
+        # Step 2B: check if project name is in project list
+        if strProjectName in list_projects:    # project names are insensitive to case
+            new_entry_object.project_name = list_projects.get(strProjectName)
+        else:
+            status_project = ('The project name was not in the list of projects.\n'
+                              'Check for correct spelling \n'
+                              'or add project to list of projects first.')
+
+        # Step 3: ensure that all variables are valid; otherwise, entry is rejected (status says why)
+        code = EntryValidator.validate_columns([strEmployeeName], [strProjectName], [strDate], [floatHours],
+                                               list_projects)[0]
+        if code == 0:
+            status = 'All entries were valid.'
+            return new_entry_object, status, status_project
+        else:
+            new_entry_object = ''
+            status = 'Data was not valid: ' + EntryValidator.describe(code) + '.'
+            return new_entry_object, status, status_project
+
+    @staticmethod
+    def input_entry_to_remove():
+        """ Asks user which entry row they would like to remove
+
+        :return: (string) entry_number
+        """
+        entry_number = str(input("Enter the entry number to remove: "))
+        return entry_number
+
+    @staticmethod
+    def input_new_project(list_projects):
+        """
+        asks user for a new project name and adds to to the project registry
+        (project names are compared regardless of case)
+        :param list_projects: the ProjectRegistry the new project is added to
+        :return: list_projects, status
+        """
+        strNewProject =  input("Enter name of new project: ")
+        strNewProject = strNewProject.strip()    # strip input
+        if list_projects.add(strNewProject):
+            status = 'New project was added to list of projects'
+        else:
+            status = 'Project was already in project list.'
+        return list_projects, status
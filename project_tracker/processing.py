@@ -0,0 +1,1416 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Processing classes of the project tracker
+# Description: Reads and writes the data files (csv, binary and the journal of removed
+#              rows), totals the hours and adds and removes entries.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Moved out of FinalHedyK.py into the project_tracker package
+#                   10/17/2026, Saves lock the data file (fcntl) and merge in what other users
+#                               saved since the file was read
+#                   10/17/2026, Added entries are checked for duplicates and days over 24 hours
+#                   10/17/2026, The hot paths are timed when TRACKER_PROFILE is set (instrumentation.py)
+#                   10/17/2026, Totals per project, employee and month are cached next to the data file
+#                   10/17/2026, The csv rows keep the date ordinals EntryValidator works out (EntryRow)
+#                   10/17/2026, The filter index is no longer built on every load
+#                   10/17/2026, A .bin file is always read as EntryRecords
+#                   10/17/2026, Reports use the columns the EntryStore keeps instead of rebuilding them
+#                   10/17/2026, locked() can fail at once instead of waiting (blocking=False)
+#                   10/17/2026, Background compactions are waited for on close, and the journal is
+#                               marked before a data file is replaced so a crash can not leave it stale
+#                   10/17/2026, A full save only renumbers the entries once the new file is in place
+#                   10/17/2026, Saves go through a SaveSnapshot, so the server can write it on another thread
+#                   10/17/2026, The writers report the bytes they write (journal included) to Instrumentation
+#                   10/17/2026, A .bin file too short for its header, records or names raises ValueError
+#                   10/17/2026, The totals are no longer built on every load
+# -------------------------------------------------------------------------------------------- #
+
+import os     # module for file handling
+import csv    # module for reading and writing to csv files
+import sys    # module used for interning repeated names
+import threading                       # module for compacting the data file in the background
+import mmap                            # module for reading binary data files without copying them
+import struct                          # module for packing entries into fixed-width binary records
+import io                              # module for reading the rows appended to a file since it was read
+import json                            # module for the file of cached totals
+import zlib                            # crc32 checksums of the data file (for the cached totals)
+import errno                           # error number of a lock that is held (see Processor.locked)
+from contextlib import contextmanager  # module for the file lock context manager
+from collections import Counter        # counts the journalled removals per entry
+import glob                            # module for finding the data files of a multi-file read
+import heapq                           # merges the sorted rows of many data files
+from operator import itemgetter        # sort key of the rows read by the workers
+from itertools import repeat           # tags each merged row with the number of its file
+from concurrent.futures import ProcessPoolExecutor   # reads many data files on all cores
+try:
+    import fcntl   # optional: locks the data file against other processes (not available on Windows)
+except ImportError:
+    fcntl = None
+
+from .data import (numpy, EntryRow, EntryRecord, EntryColumns, EntryStore, SortedEntryIndex, DuplicateDetector,
+                   ProjectRegistry, EntryValidator)
+from .instrumentation import Instrumentation
+
+# -- Processing -- #
+# read from csv file and write to csv file
+# add and remove entry rows from a list of dictionary rows
+
+class BinaryTimesheet:
+    '''
+    reads a binary data file through mmap: only the parts of the file that are
+    used are loaded, and records are unpacked straight from the mapped file.
+
+    layout: header (magic, version, record count, string table offset and count),
+    then fixed-width records (entry number, employee id, project id, date ordinal,
+    hours), then the string table (length-prefixed utf-8 names)
+    '''
+
+    magic = b'EPHB'
+    version = 1
+    header = struct.Struct('<4sHHQQQ')   # magic, version, unused, record count, string table offset, string count
+    record = struct.Struct('<qIIid')     # entry number, employee id, project id, date ordinal, hours
+    name_length = struct.Struct('<I')
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.names = []           # string table: id -> name
+        self.__count = 0          # number of records
+        self.__file = open(file_name, 'rb')
+        self.__map = None
+        size = os.path.getsize(file_name)
+        if size > 0:
+            if size < self.header.size:
+                self.close()
+                raise ValueError(file_name + ' is not a binary data file (it is too short).')
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, unused, self.__count, names_offset, name_count = self.header.unpack_from(self.__map)
+            if magic != self.magic or version != self.version:
+                self.close()
+                raise ValueError(file_name + ' is not a binary data file.')
+            if not self.header.size + self.__count * self.record.size <= names_offset <= size:
+                self.close()
+                raise ValueError(file_name + ' is truncated or damaged (its records do not fit in the file).')
+            try:
+                for name_number in range(name_count):
+                    length, = self.name_length.unpack_from(self.__map, names_offset)
+                    names_offset += self.name_length.size
+                    if names_offset + length > size:
+                        raise ValueError('the name goes past the end of the file')
+                    self.names.append(sys.intern(self.__map[names_offset:names_offset + length].decode('utf-8')))
+                    names_offset += length
+            except (struct.error, ValueError):    # UnicodeDecodeError is a ValueError as well
+                self.close()
+                raise ValueError(file_name + ' is truncated or damaged (its names do not fit in the file).') from None
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.__count:
+            raise IndexError(position)
+        offset = self.header.size + position * self.record.size
+        return self.__record(self.record.unpack_from(self.__map, offset))
+
+    def __iter__(self):
+        if self.__count:
+            end = self.header.size + self.__count * self.record.size
+            with memoryview(self.__map)[self.header.size:end] as records:   # no copy of the records
+                for values in self.record.iter_unpack(records):
+                    yield self.__record(values)
+
+    def __record(self, values):
+        entry_num, employee_id, project_id, date_ordinal, hours = values
+        return EntryRecord(entry_num, self.names[employee_id], self.names[project_id], date_ordinal, hours)
+
+    def close(self):
+        if self.__map is not None:
+            self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def is_binary(file_name):
+        '''
+        :param file_name:
+        :return: True when the file name has the .bin extension
+        '''
+        return os.path.splitext(file_name)[1].lower() == '.bin'
+
+    @staticmethod
+    def write(file_name, rows, renumber=False):
+        '''
+        writes rows (dictionary rows or EntryRecords) to a binary data file;
+        records are written as the rows go by and the string table is added at the end
+        :param file_name:
+        :param rows:
+        :param renumber: numbers the records 1, 2, 3... instead of keeping their EntryNum (the rows are not changed)
+        :return: number of records written
+        '''
+        header, record, name_length = BinaryTimesheet.header, BinaryTimesheet.record, BinaryTimesheet.name_length
+        name_ids = {}
+        count = 0
+        with open(file_name, 'wb') as binary_file:
+            binary_file.write(bytes(header.size))    # header is filled in once the counts are known
+            for row in rows:
+                if not isinstance(row, EntryRecord):
+                    row = EntryRecord.from_row(row)
+                employee_id = name_ids.setdefault(row.employee_name, len(name_ids))
+                project_id = name_ids.setdefault(row.project_name, len(name_ids))
+                binary_file.write(record.pack(count + 1 if renumber else row.entry_num, employee_id, project_id,
+                                              row.date_ordinal, row.hours_worked))
+                count += 1
+            names_offset = binary_file.tell()
+            for name in name_ids:    # dictionaries keep the order the names were added in
+                encoded = name.encode('utf-8')
+                binary_file.write(name_length.pack(len(encoded)) + encoded)
+            binary_file.seek(0)
+            binary_file.write(header.pack(BinaryTimesheet.magic, BinaryTimesheet.version, 0,
+                                          count, names_offset, len(name_ids)))
+            binary_file.flush()
+            os.fsync(binary_file.fileno())
+        return count
+
+
+class EntryStream:
+    '''
+    streams the rows of a csv file as dictionary rows, one at a time
+    (only one row is held in memory unless rows() is asked for),
+    validates each row and builds the project registry and the counter as it goes;
+    a .bin file is read through BinaryTimesheet instead, as EntryRecords
+    '''
+
+    fieldnames = ['EntryNum', 'EmployeeName', 'ProjectName', 'FullDate', 'HoursWorked']
+    batch_size = 10000   # rows checked by EntryValidator at a time
+
+    def __init__(self, file_name, compact=False, validate=True, start=0):
+        self.file_name = file_name
+        self.start = start               # byte offset to read from (rows appended since an earlier read)
+        self.validate = validate         # skips rows that fail EntryValidator (only headers otherwise)
+        self.errors = []                 # (line number, error code) of each row that failed validation
+        self.file_found = os.path.exists(file_name)
+        self.binary = BinaryTimesheet.is_binary(file_name)
+        self.compact = compact or self.binary    # yields EntryRecords (always for a .bin file, whose values are typed)
+        self.counter = 1                 # next entry number; the rows are numbered as they are read
+        self.rejected = 0                # number of rows skipped because they were not valid
+        self.projects = ProjectRegistry()    # projects found in the file with their entry counts
+        self.__removed = Processor.read_journal(file_name) if not start else Counter()   # rows removed by incremental saves
+
+    def __iter__(self):
+        '''
+        generator pipeline: csv rows -> validated rows -> numbered rows
+        :return: generator of dictionary rows
+        '''
+        if self.binary:
+            rows = self.__read_binary()
+        else:
+            rows = self.__validate(self.__read())
+            if self.__removed:
+                rows = self.__drop_removed(rows)
+            if self.compact:
+                rows = self.__compact(rows)
+        for row in rows:
+            row['EntryNum'] = str(self.counter)
+            self.counter += 1
+            self.projects.entry_added(row)   # populates the project registry (without redundancies)
+            yield row
+
+    def __read(self):
+        '''
+        yields the rows of the csv file with the whitespace around each value stripped
+        (nothing if the file does not exist)
+        :return: generator of (line number, EntryRow)
+        '''
+        if self.file_found:
+            width = len(self.fieldnames)
+            with open(self.file_name, 'rb') as binary_file:
+                binary_file.seek(self.start)
+                csvfile = io.TextIOWrapper(binary_file, newline='')
+                reader = csv.reader(csvfile)
+                for values in reader:
+                    if not values:    # blank line
+                        continue
+                    if len(values) != width:    # a line cut short gets empty values, values past the last column are ignored
+                        values = (values + [''] * width)[:width]
+                    yield reader.line_num, EntryRow(zip(self.fieldnames, map(str.strip, values)))
+
+    def __read_binary(self):
+        '''
+        yields the records of a binary data file; they stay EntryRecords (names interned,
+        dates as ordinals), since turning them into dictionaries of strings would only have
+        every index parse them again
+        :return: generator of EntryRecords
+        '''
+        if self.file_found:
+            with BinaryTimesheet(self.file_name) as binary_file:
+                yield from binary_file
+
+    def __validate(self, numbered_rows):
+        '''
+        drops column headers and checks the rows with EntryValidator a batch at a time;
+        the line numbers and error codes of the rows that fail are kept in self.errors
+        and the rows that pass keep the date ordinal the check worked out
+        :param numbered_rows:
+        :return: generator of dictionary rows
+        '''
+        batch = []
+        for line_number, row in numbered_rows:
+            if row['EntryNum'] == 'EntryNum':    # do not pass the column headers on
+                continue
+            if not self.validate:
+                yield row
+                continue
+            batch.append((line_number, row))
+            if len(batch) == self.batch_size:
+                yield from self.__validate_batch(batch)
+                batch = []
+        yield from self.__validate_batch(batch)
+
+    def __validate_batch(self, batch):
+        codes, date_ordinals = EntryValidator.check_rows([row for line_number, row in batch])
+        for (line_number, row), code, date_ordinal in zip(batch, codes, date_ordinals):
+            if code:
+                self.rejected += 1
+                self.errors.append((line_number, code))
+            else:
+                row.date_ordinal = date_ordinal
+                yield row
+
+    def __drop_removed(self, rows):
+        '''
+        skips the rows that were logged as removed in the journal file
+        :param rows:
+        :return: generator of dictionary rows
+        '''
+        for row in rows:
+            key = Processor.entry_key(row)
+            if self.__removed[key] > 0:
+                self.__removed[key] -= 1
+                continue
+            yield row
+
+    def __compact(self, rows):
+        '''
+        converts the dictionary rows to EntryRecords, dropping rows whose
+        date or hours can not be converted
+        :param rows:
+        :return: generator of EntryRecords
+        '''
+        for row in rows:
+            try:
+                yield EntryRecord.from_row(row)
+            except ValueError:
+                self.rejected += 1
+
+    def rows(self, sort=False):
+        '''
+        materializes the stream into a list of dictionary rows
+        :param sort: sorts the list based on ProjectName (and date) and renumbers the EntryNum in ascending order
+        :return: list of dictionary rows
+        '''
+        list_rows = list(self)
+        if sort:
+            list_rows.sort(key=SortedEntryIndex.sort_keys['project'])
+            for number, row in enumerate(list_rows, 1):   # change EntryNum to ascending order
+                row['EntryNum'] = str(number)
+        return list_rows
+
+
+class HoursReport:
+    '''
+    totals the hours worked per project, employee, day or week, optionally
+    within a date range; the columns are loaded into numpy arrays (when numpy
+    is installed) so the grouping is done in whole-array operations
+    '''
+
+    group_choices = ('project', 'employee', 'day', 'week')
+
+    def __init__(self, list_employee_hours):
+        self.skipped = 0     # rows whose date or hours could not be converted
+        if isinstance(list_employee_hours, EntryColumns):
+            self.columns = list_employee_hours
+        elif getattr(list_employee_hours, 'columns', None) is not None:    # an EntryStore keeps them up to date
+            self.columns = list_employee_hours.columns
+        else:
+            self.columns = EntryColumns()
+            for row in list_employee_hours:
+                try:
+                    self.columns.append(row)
+                except ValueError:
+                    self.skipped += 1
+
+    def totals(self, group_by='project', start_date=None, end_date=None):
+        '''
+        sums and counts the hours for each group
+        :param group_by: 'project', 'employee', 'day' or 'week' (weeks start on Monday)
+        :param start_date: first date (ordinal) to include, or None
+        :param end_date: last date (ordinal) to include, or None
+        :return: list of (label, total hours, number of entries)
+        '''
+        if group_by not in self.group_choices:
+            raise ValueError('Report can be grouped by ' + ', '.join(self.group_choices) + '.')
+        if numpy is not None:
+            groups = self.__totals_numpy(group_by, start_date, end_date)
+        else:
+            groups = self.__totals_python(group_by, start_date, end_date)
+        if group_by in ('project', 'employee'):    # name ids -> names, listed alphabetically
+            return sorted((self.columns.names[key], total, count) for key, total, count in groups)
+        labels = 'Week of ' if group_by == 'week' else ''
+        return [(labels + EntryRecord.ordinal_to_date(key), total, count) for key, total, count in sorted(groups)]
+
+    def __totals_numpy(self, group_by, start_date, end_date):
+        # the arrays share memory with the columns (no copy); they are only kept for this call
+        # because the columns can not grow while numpy holds on to them
+        hours = numpy.asarray(self.columns.hours)
+        dates = numpy.asarray(self.columns.date_ordinals)
+        mask = numpy.ones(len(hours), dtype=bool)
+        if start_date is not None:
+            mask &= dates >= start_date
+        if end_date is not None:
+            mask &= dates <= end_date
+        if group_by == 'project':
+            keys = numpy.asarray(self.columns.project_ids)[mask]
+        elif group_by == 'employee':
+            keys = numpy.asarray(self.columns.employee_ids)[mask]
+        else:
+            keys = dates[mask]
+            if group_by == 'week':
+                keys = keys - (keys - 1) % 7    # ordinal 1 (1/1/0001) was a Monday
+        unique_keys, group_of_row = numpy.unique(keys, return_inverse=True)
+        totals = numpy.bincount(group_of_row, weights=hours[mask], minlength=len(unique_keys))
+        counts = numpy.bincount(group_of_row, minlength=len(unique_keys))
+        return zip(unique_keys.tolist(), totals.tolist(), counts.tolist())
+
+    def __totals_python(self, group_by, start_date, end_date):
+        columns = self.columns
+        if group_by == 'project':
+            keys = columns.project_ids
+        elif group_by == 'employee':
+            keys = columns.employee_ids
+        else:
+            keys = columns.date_ordinals
+        totals = {}
+        counts = Counter()
+        for key, date, hours in zip(keys, columns.date_ordinals, columns.hours):
+            if (start_date is not None and date < start_date) or (end_date is not None and date > end_date):
+                continue
+            if group_by == 'week':
+                key -= (key - 1) % 7
+            totals[key] = totals.get(key, 0.0) + hours
+            counts[key] += 1
+        return [(key, totals[key], counts[key]) for key in totals]
+
+
+class SaveSnapshot:
+    '''
+    the changes of an EntryStore to save, taken at one moment, so the data file can be written
+    on another thread while the store goes on changing (the server saves this way):
+    the snapshot is taken on the thread that changes the store, Processor.write_save writes
+    it (it only uses the file and the snapshot), then Processor.end_save brings the result back
+    into the store on the first thread (Processor.cancel_save when the write failed)
+    '''
+
+    def __init__(self, file_name, list_employee_hours, totals=None):
+        '''
+        :param file_name: data file the store was read from
+        :param list_employee_hours: EntryStore (its changes are handed over, see EntryStore.take_changes)
+        :param totals: totals of the entries to cache with the file (AggregateTotals.snapshot), or None
+        '''
+        self.file_name = file_name
+        self.rows = list(Processor.sorted_entries(list_employee_hours))    # all the rows, in sorted order
+        self.added_rows, self.removed_rows = list_employee_hours.take_changes()
+        self.disk_state = list_employee_hours.disk_state    # the file as it was read or last saved
+        self.compact = list_employee_hours.compact
+        self.totals = totals
+        self.journal_rows = self.removed_rows    # removals to log (those others saved are left out)
+        self.others_added = []                   # rows others saved since the file was read
+        self.others_removed = Counter()          # keys of the rows others removed
+        self.numbered = False                    # the file was written in full (entries numbered 1, 2, 3...)
+        self.status = ''
+        self.new_disk_state = None
+
+
+class Processor:
+    """
+    reads and writes to csv files (as dictionary rows),
+    adds and deletes entries from a list of dictionary rows
+
+    """
+
+    file_lock = threading.RLock()   # only one save or compaction touches the data files at a time
+    lock_depth = 0                  # nesting of locked() in this process (the file lock is taken once)
+    compactions = {}                # file name -> (state before, state after) of the last compaction here
+    compaction_threads = {}         # file name -> thread of the last background compaction
+    journal_marker = '#replaced'    # EntryNum of the journal line naming the file that replaces the data file
+
+    @staticmethod
+    @contextmanager
+    def locked(file_name, shared=False, blocking=True):
+        '''
+        holds the lock of a data file: the threads of this process take turns through
+        file_lock, and other processes through an advisory fcntl lock on file_name + '.lock'
+        (the data file itself is replaced on full saves, so it can not carry the lock);
+        nested calls only take the file lock once
+        :param file_name: data file
+        :param shared: True for reading (other readers are let in, writers wait)
+        :param blocking: False to raise BlockingIOError at once, instead of waiting, when another
+                         thread or process holds the lock (the server tries its save again later)
+        :return: context manager
+        '''
+        if not Processor.file_lock.acquire(blocking):
+            raise BlockingIOError(errno.EWOULDBLOCK, 'The data file is being saved or compacted.', file_name)
+        try:
+            if fcntl is None or Processor.lock_depth > 0:
+                Processor.lock_depth += 1
+                try:
+                    yield
+                finally:
+                    Processor.lock_depth -= 1
+                return
+            with open(Processor.lock_name(file_name), 'a') as lock_file:
+                mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                fcntl.flock(lock_file.fileno(), mode if blocking else mode | fcntl.LOCK_NB)
+                Processor.lock_depth += 1
+                try:
+                    yield
+                finally:
+                    Processor.lock_depth -= 1
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            Processor.file_lock.release()
+
+    @staticmethod
+    def lock_name(file_name):
+        '''
+        :param file_name:
+        :return: name of the lock file of a data file
+        '''
+        return file_name + '.lock'
+
+    @staticmethod
+    def disk_state(file_name):
+        '''
+        describes the data file as it is on disk, to tell whether someone else saved to it
+        :param file_name:
+        :return: (size, mtime in ns, size of the journal, last bytes), or None when there is no file
+        '''
+        if not os.path.exists(file_name):
+            return None
+        with open(file_name, 'rb') as binary_file:
+            stat = os.fstat(binary_file.fileno())
+            binary_file.seek(max(0, stat.st_size - 64))
+            last_bytes = binary_file.read(64)    # checked again later to see the file was only appended to
+        journal_file_name = Processor.journal_name(file_name)
+        journal_size = os.path.getsize(journal_file_name) if os.path.exists(journal_file_name) else 0
+        return stat.st_size, stat.st_mtime_ns, journal_size, last_bytes
+
+    @staticmethod
+    def read_file_changes(snapshot):
+        '''
+        finds the rows other users saved (or removed) since the store of a SaveSnapshot was read
+        or saved; when the file was only appended to, just the new rows and journal lines are read,
+        otherwise (it was rewritten) the file is streamed and compared with the snapshot. Rows
+        others added and removed again cancel out, and a removal this session made that someone
+        else already saved is not logged twice. Call it while holding locked().
+        :param snapshot: SaveSnapshot (its others_added, others_removed and journal_rows are set)
+        :return: nothing
+        '''
+        file_name = snapshot.file_name
+        known_state = snapshot.disk_state
+        state = Processor.disk_state(file_name)
+        compaction = Processor.compactions.get(file_name)
+        if compaction is not None and known_state == compaction[0]:    # compacted here: same rows, new file
+            known_state = compaction[1]
+        if state == known_state:
+            return
+        known_size, known_mtime, known_journal_size, known_last_bytes = known_state or (0, 0, 0, b'')
+        appended_only = known_state is not None and state is not None and \
+            not BinaryTimesheet.is_binary(file_name) and state[0] >= known_size and state[2] >= known_journal_size
+        if appended_only and known_last_bytes:
+            with open(file_name, 'rb') as binary_file:
+                binary_file.seek(known_size - len(known_last_bytes))
+                appended_only = binary_file.read(len(known_last_bytes)) == known_last_bytes
+        if appended_only:
+            added_rows = list(EntryStream(file_name, snapshot.compact, start=known_size))
+            removed_keys = Processor.read_journal(file_name, start=known_journal_size)
+        else:
+            added_rows, removed_keys = Processor.__compare_with_file(snapshot)
+        for row in added_rows:    # rows that others added and removed again cancel out
+            key = Processor.entry_key(row)
+            if removed_keys[key] > 0:
+                removed_keys[key] -= 1
+            else:
+                snapshot.others_added.append(row)
+        snapshot.journal_rows = []
+        for row in snapshot.removed_rows:
+            key = Processor.entry_key(row)
+            if removed_keys[key] > 0:    # someone else already removed it
+                removed_keys[key] -= 1
+            else:
+                snapshot.journal_rows.append(row)
+        snapshot.others_removed = +removed_keys
+
+    @staticmethod
+    def __compare_with_file(snapshot):
+        '''
+        finds what others changed by comparing the rows in the file with the rows of the snapshot
+        that were already saved (rows this session removed are counted as still saved)
+        :return: rows in the file that the snapshot does not have, Counter of keys of rows the file no longer has
+        '''
+        file_rows = {}
+        for row in EntryStream(snapshot.file_name, snapshot.compact):
+            file_rows.setdefault(Processor.entry_key(row), []).append(row)
+        added = {id(row) for row in snapshot.added_rows}
+        saved = Counter(Processor.entry_key(row) for row in snapshot.rows if id(row) not in added)
+        saved.update(Processor.entry_key(row) for row in snapshot.removed_rows)
+        added_rows = []
+        for key, rows in file_rows.items():
+            added_rows.extend(rows[saved[key]:])    # copies past the ones the store already has
+        removed_keys = Counter({key: count - len(file_rows.get(key, ())) for key, count in saved.items()})
+        return added_rows, +removed_keys
+
+    @staticmethod
+    def __merged_rows(snapshot):
+        '''
+        :param snapshot: SaveSnapshot after read_file_changes
+        :return: the rows of the snapshot with the changes others saved, in sorted order (for a full write)
+        '''
+        removed_keys = Counter(snapshot.others_removed)
+        added = {id(row) for row in snapshot.added_rows}
+        rows = []
+        for row in snapshot.rows:
+            if removed_keys and id(row) not in added:
+                key = Processor.entry_key(row)
+                if removed_keys[key] > 0:
+                    removed_keys[key] -= 1
+                    continue
+            rows.append(row)
+        if snapshot.others_added:
+            rows.extend(snapshot.others_added)
+            rows.sort(key=SortedEntryIndex.sort_keys['project'])
+        return rows
+
+    @staticmethod
+    def __apply_file_changes(list_employee_hours, snapshot, counter):
+        '''
+        adds and removes the rows others saved (found by read_file_changes) without marking them as
+        changes of this session; a removal made here since the snapshot that someone else already
+        saved is not saved twice
+        :return: number of rows added, number of rows removed, counter
+        '''
+        removed_keys = Counter(snapshot.others_removed)
+        removed = 0
+        if removed_keys:
+            for row in list_employee_hours.removed_rows():
+                key = Processor.entry_key(row)
+                if removed_keys[key] > 0:
+                    removed_keys[key] -= 1
+                    list_employee_hours.forget_change(row)
+            saved_here = {id(row) for row in snapshot.added_rows}
+            for row in list(list_employee_hours):
+                key = Processor.entry_key(row)
+                if removed_keys[key] > 0 and not list_employee_hours.is_added(row) and id(row) not in saved_here:
+                    removed_keys[key] -= 1
+                    list_employee_hours.pop(row['EntryNum'], track=False)
+                    removed += 1
+        for row in snapshot.others_added:
+            while counter in list_employee_hours:    # numbers already given to this session's new rows
+                counter += 1
+            row['EntryNum'] = str(counter)
+            counter += 1
+            list_employee_hours.append(row, track=False)
+        return len(snapshot.others_added), removed, counter
+
+    @staticmethod
+    def stream_data_from_file(file_name, compact=False):
+        '''
+        opens a streaming reader over the csv file; rows are validated one at a time
+        and the project registry and counter are built as the rows go by
+        :param file_name:
+        :param compact: yields EntryRecords instead of dictionary rows
+        :return: EntryStream
+        '''
+        return EntryStream(file_name, compact)
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(result[0]), reads=True)
+    def read_data_from_file(file_name, compact=False, sort_key='project'):
+        '''
+        reads data from csv file as rows of dictionaries
+        :param file_name:
+        :param compact: reads the rows as EntryRecords instead of dictionaries (a .bin file always is)
+        :param sort_key: order the entries are kept in (see SortedEntryIndex.sort_keys)
+        :return:list_employee_hours, project_registry, status, counter
+        '''
+        status = 'File does not currently exist or is empty.\n' \
+                 'A file will be created once you save your entries.'  # circumvents an error message when file is empty
+        with Processor.locked(file_name, shared=True):    # a save by someone else is not read half-written
+            stream = Processor.stream_data_from_file(file_name, compact)
+            sorted_index = SortedEntryIndex(stream, sort_key)   # a file saved by this script is already in order
+            disk_state = Processor.disk_state(file_name)
+        for number, row in enumerate(sorted_index, 1):     # change EntryNum to ascending order
+            row['EntryNum'] = str(number)
+        list_employee_hours = Processor.__index_store(sorted_index, stream.projects, stream.compact)
+        list_employee_hours.disk_state = disk_state
+        if stream.file_found:
+            status = 'Data read from file.'
+            if stream.rejected:
+                status += '\n' + str(stream.rejected) + ' invalid row(s) were skipped (line ' + \
+                          ', '.join(str(line_number) for line_number, code in stream.errors[:10]) + \
+                          (' ...' if len(stream.errors) > 10 else '') + ').'
+        return list_employee_hours, stream.projects, status, stream.counter
+
+    @staticmethod
+    def __index_store(sorted_index, list_projects, compact=False):
+        '''
+        puts sorted rows into an EntryStore that keeps its indexes and project counts up to date
+        (its EntryFilterIndex, DuplicateDetector and AggregateTotals are only built when they are needed)
+        :param sorted_index: SortedEntryIndex of the rows
+        :param list_projects: ProjectRegistry that already counts the rows
+        :param compact: True when the rows are EntryRecords
+        :return: EntryStore
+        '''
+        list_employee_hours = EntryStore(sorted_index, compact)
+        list_employee_hours.attach_sorted_index(sorted_index)
+        list_employee_hours.add_listener(list_projects)   # keeps the entries per project up to date
+        return list_employee_hours
+
+    @staticmethod
+    def find_data_files(pattern):
+        '''
+        :param pattern: a folder (its .csv files are used) or a glob pattern such as teams/*.csv
+        :return: sorted list of file names
+        '''
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '*.csv')
+        return sorted(file_name for file_name in glob.glob(pattern) if os.path.isfile(file_name))
+
+    @staticmethod
+    def read_sorted_file(file_name):
+        '''
+        reads and validates one data file and sorts its rows by project and date
+        (runs in a worker process; tuples are sent back since they pickle faster than dictionaries)
+        :param file_name:
+        :return: file_name, list of (ProjectName, date ordinal, EmployeeName, FullDate, HoursWorked), rejected rows
+        '''
+        stream = EntryStream(file_name)
+        rows = [(row['ProjectName'], SortedEntryIndex.date_of(row), row['EmployeeName'],
+                 row['FullDate'], row['HoursWorked']) for row in stream]
+        rows.sort(key=itemgetter(0, 1))
+        return file_name, rows, stream.rejected
+
+    @staticmethod
+    def read_data_from_files(pattern, compact=False, workers=None, skip_duplicates=False):
+        '''
+        reads many data files (a folder or a glob pattern) at once: each file is read, validated
+        and sorted in its own worker process, then the sorted files are merged (k-way, by
+        ProjectName and date) so the entries never have to be sorted as a whole; the entries are
+        numbered once, in merged order. An entry found in more than one file (same employee,
+        project, date and hours) is reported as a duplicate.
+        :param pattern: a folder or a glob pattern
+        :param compact: reads the rows as EntryRecords instead of dictionaries
+        :param workers: number of processes (None for one per core)
+        :param skip_duplicates: keeps only the first copy of a duplicate
+        :return: list_employee_hours, project_registry, status, counter, list of (row, first file, file)
+        '''
+        file_names = Processor.find_data_files(pattern)
+        if len(file_names) < 2 or workers == 1:
+            results = [Processor.read_sorted_file(file_name) for file_name in file_names]
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                results = list(executor.map(Processor.read_sorted_file, file_names))
+        sources = [zip(rows, repeat(number)) for number, (file_name, rows, rejected) in enumerate(results)]
+        merged_rows = []
+        duplicates = []
+        list_projects = ProjectRegistry()
+        counter = 1
+        group, first_file_of = None, {}   # duplicates have the same project and date, so they are next to each other
+        for values, number in heapq.merge(*sources, key=lambda source: source[0][:2]):
+            project_name, date_ordinal, employee_name, full_date, hours_worked = values
+            if (project_name, date_ordinal) != group:
+                group, first_file_of = (project_name, date_ordinal), {}
+            row = EntryRow({'EntryNum': str(counter), 'EmployeeName': employee_name, 'ProjectName': project_name,
+                            'FullDate': full_date, 'HoursWorked': hours_worked}, date_ordinal)
+            first_file = first_file_of.setdefault((employee_name, float(hours_worked)), number)
+            if first_file != number:
+                duplicates.append((row, results[first_file][0], results[number][0]))
+                if skip_duplicates:
+                    continue
+            if compact:
+                row = EntryRecord.from_row(row)
+            merged_rows.append(row)
+            list_projects.entry_added(row)
+            counter += 1
+        sorted_index = SortedEntryIndex(merged_rows, 'project')    # already in order, so this is linear
+        list_employee_hours = Processor.__index_store(sorted_index, list_projects, compact)
+        rejected = sum(result[2] for result in results)
+        status = str(len(merged_rows)) + ' entries read from ' + str(len(file_names)) + ' files.'
+        if rejected:
+            status += '\n' + str(rejected) + ' invalid row(s) were skipped.'
+        if duplicates:
+            status += '\n' + str(len(duplicates)) + ' entries were found in more than one file' + \
+                      (' (only the first copy was kept).' if skip_duplicates else '.')
+        return list_employee_hours, list_projects, status, counter, duplicates
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[1]), writes=True)
+    def write_data_to_file(file_name, list_employee_hours):
+        '''
+        writes data to csv file; the data is written to a temporary file first which
+        then replaces the csv file, so a failed save never leaves a truncated file.
+        The entries are numbered in sorted order in the file, and the rows themselves are only
+        renumbered once the new file is in place (after a failed save the numbers on screen
+        still match the EntryStore)
+        :param file_name:
+        :param list_employee_hours:
+        :return: status, counter
+        '''
+        counter = 1  # resets counter to one to renumber the entry rows saved to csv file
+        status = 'No data to write to file!'
+        if list_employee_hours:
+            list_sorted = Processor.sorted_entries(list_employee_hours)
+            with Processor.locked(file_name):
+                Processor.__write_rows(file_name, list_sorted)
+                disk_state = Processor.disk_state(file_name)
+            for entry_row in list_sorted:
+                entry_row['EntryNum'] = str(counter)  # renumber EntryNum in sorted list, as in the file
+                counter += 1
+            status = 'Data written to file.'
+            if isinstance(list_employee_hours, EntryStore):
+                list_employee_hours.reindex()    # the entry numbers were rewritten
+                list_employee_hours.clear_changes()
+                list_employee_hours.disk_state = disk_state
+        return status, counter
+
+    @staticmethod
+    def __write_rows(file_name, rows):
+        '''
+        writes the rows, numbered 1, 2, 3... in the order given, to a temporary file which then
+        replaces the data file (the rows themselves are not changed); call it while holding locked()
+        :param file_name: csv or .bin data file
+        :param rows:
+        :return: nothing
+        '''
+        temp_file_name = file_name + '.tmp'
+        try:
+            if BinaryTimesheet.is_binary(file_name):
+                BinaryTimesheet.write(temp_file_name, rows, renumber=True)
+            else:
+                with open(temp_file_name, 'w', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(EntryStream.fieldnames)  # column headers are written
+                    writer.writerows([number] + [entry_row[key] for key in EntryStream.fieldnames[1:]]
+                                     for number, entry_row in enumerate(rows, 1))
+                    csvfile.flush()
+                    os.fsync(csvfile.fileno())
+            Instrumentation.wrote(os.path.getsize(temp_file_name))
+            Processor.replace_data_file(temp_file_name, file_name)    # removals are part of the new file
+        except BaseException:
+            if os.path.exists(temp_file_name):    # the data file was not replaced
+                os.remove(temp_file_name)
+            raise
+
+    @staticmethod
+    def sorted_entries(list_employee_hours):
+        '''
+        gives the entries sorted by ProjectName (and date); an EntryStore that keeps
+        a SortedEntryIndex is already in order, anything else is sorted here
+        :param list_employee_hours:
+        :return: rows in sorted order
+        '''
+        if getattr(list_employee_hours, 'sorted_index', None) is not None:
+            return list_employee_hours.sorted_index
+        return sorted(list_employee_hours, key=SortedEntryIndex.sort_keys['project'])
+
+    @staticmethod
+    def select_entries(list_employee_hours, offset=0, page_size=20, project='', employee='',
+                       start_date='', end_date=''):
+        '''
+        finds one page of the entries (sorted by ProjectName) that match the filters;
+        an EntryStore is searched through its EntryFilterIndex without rescanning the entries
+        :param list_employee_hours:
+        :param offset: number of matching entries to skip
+        :param page_size: number of entries on the page
+        :param project: project name (any case), or '' for all projects
+        :param employee: employee name (any case), or '' for all employees
+        :param start_date: first date to show (string formatted as 01/01/2021), or ''
+        :param end_date: last date to show (string formatted as 01/01/2021), or ''
+        :return: list of rows on the page, total number of matching entries (None when it is not known)
+        '''
+        start_date = EntryRecord.date_to_ordinal(start_date) if start_date else None
+        end_date = EntryRecord.date_to_ordinal(end_date) if end_date else None
+        filtered = project or employee or start_date is not None or end_date is not None
+        if not filtered:
+            list_sorted = Processor.sorted_entries(list_employee_hours)
+            return list(list_sorted[offset:offset + page_size]), len(list_sorted)
+        if getattr(list_employee_hours, 'filter_index', None) is not None:
+            return list_employee_hours.filter_index.page(offset, page_size, project, employee, start_date, end_date)
+        project, employee = project.strip().lower(), employee.strip().lower()
+        matches = [row for row in Processor.sorted_entries(list_employee_hours)
+                   if (not project or row['ProjectName'].lower() == project)
+                   and (not employee or row['EmployeeName'].lower() == employee)
+                   and (start_date is None or SortedEntryIndex.date_of(row) >= start_date)
+                   and (end_date is None or SortedEntryIndex.date_of(row) <= end_date)]
+        return matches[offset:offset + page_size], len(matches)
+
+    @staticmethod
+    @Instrumentation.timed(writes=True)
+    def save_changes_to_file(file_name, list_employee_hours, counter):
+        '''
+        saves only what changed since the last save (see write_save); what others saved since
+        the file was read is merged into the list, so nobody's work is overwritten.
+        :param file_name:
+        :param list_employee_hours: an EntryStore (a plain list is written in full)
+        :param counter: the next entry number (kept, since rows are not renumbered)
+        :return: status, counter
+        '''
+        if not isinstance(list_employee_hours, EntryStore):
+            return Processor.write_data_to_file(file_name, list_employee_hours)
+        snapshot = SaveSnapshot(file_name, list_employee_hours)
+        try:
+            Processor.write_save(snapshot)
+        except BaseException:
+            Processor.cancel_save(list_employee_hours, snapshot)
+            raise
+        return Processor.end_save(list_employee_hours, snapshot, counter)
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: len(args[0].rows) if args[0].numbered else
+                           len(args[0].added_rows) + len(args[0].journal_rows), writes=True)
+    def write_save(snapshot, blocking=True):
+        '''
+        writes a SaveSnapshot to its data file: new rows are appended to the csv file and removed
+        rows are logged in the journal file; the file is written in full when it does not exist
+        yet (and for .bin files). The file stays locked during the save, and what others saved
+        since the store was read is taken into account first (see read_file_changes).
+        Only the file and the snapshot are used, so it can run on another thread than the store.
+        :param snapshot: SaveSnapshot (its status and new_disk_state are set)
+        :param blocking: False to raise BlockingIOError at once when the data file is locked
+        :return: nothing
+        '''
+        file_name = snapshot.file_name
+        with Processor.locked(file_name, blocking=blocking):
+            Processor.read_file_changes(snapshot)
+            merged = snapshot.others_added or snapshot.others_removed
+            if not os.path.exists(file_name) or os.path.getsize(file_name) == 0 \
+                    or BinaryTimesheet.is_binary(file_name):
+                rows = Processor.__merged_rows(snapshot) if merged else snapshot.rows
+                if rows:
+                    Processor.__write_rows(file_name, rows)
+                    snapshot.numbered = True
+                    snapshot.status = 'Data written to file.'
+                else:
+                    snapshot.status = 'No data to write to file!'
+            elif snapshot.added_rows or snapshot.journal_rows:
+                if snapshot.journal_rows:
+                    Processor.__append_rows(Processor.journal_name(file_name), snapshot.journal_rows)
+                if snapshot.added_rows:
+                    Processor.__append_rows(file_name, snapshot.added_rows)
+                snapshot.status = 'Changes saved to file (' + str(len(snapshot.added_rows)) + ' added, ' + \
+                                  str(len(snapshot.journal_rows)) + ' removed).'
+            else:
+                snapshot.status = 'There were no changes to save.'
+            snapshot.new_disk_state = Processor.disk_state(file_name)
+            if snapshot.totals is not None and not merged:    # the totals do not have what others saved
+                Processor.write_totals(file_name, snapshot.totals)
+        if Processor.needs_compaction(file_name):
+            Processor.compact_file_in_background(file_name)
+
+    @staticmethod
+    def end_save(list_employee_hours, snapshot, counter):
+        '''
+        brings a written SaveSnapshot back into the EntryStore it was taken from: the rows others
+        saved are added and removed, and after a full write the entries are numbered as in the
+        file (unless the store was changed while the file was written)
+        :param list_employee_hours: the EntryStore
+        :param snapshot: SaveSnapshot written by write_save
+        :param counter: the next entry number
+        :return: status, counter
+        '''
+        added, removed, counter = Processor.__apply_file_changes(list_employee_hours, snapshot, counter)
+        if snapshot.numbered and not list_employee_hours.added_rows() and not list_employee_hours.removed_rows():
+            counter = 1
+            for entry_row in Processor.sorted_entries(list_employee_hours):
+                entry_row['EntryNum'] = str(counter)
+                counter += 1
+            list_employee_hours.reindex()    # the entry numbers were rewritten
+        list_employee_hours.disk_state = snapshot.new_disk_state
+        if not added and not removed:
+            return snapshot.status, counter
+        return 'Merged changes saved by others (' + str(added) + ' added, ' + str(removed) + ' removed).\n' + \
+            snapshot.status, counter
+
+    @staticmethod
+    def cancel_save(list_employee_hours, snapshot):
+        '''
+        gives the changes of a SaveSnapshot that could not be written back to the EntryStore
+        (they are saved the next time)
+        :param list_employee_hours: the EntryStore
+        :param snapshot: SaveSnapshot
+        :return: nothing
+        '''
+        list_employee_hours.restore_changes(snapshot.added_rows, snapshot.removed_rows)
+
+    @staticmethod
+    def append_entries_to_file(file_name, rows):
+        '''
+        appends new rows to a csv data file without loading its entries (the file is
+        created with column headers when it does not exist); the rows are numbered
+        after the lines already in the file, since entry numbers are rewritten on loading,
+        and checked for duplicates against the file (see check_against_file)
+        :param file_name:
+        :param rows: dictionary rows or EntryRecords
+        :return: status (with warnings for rows that look like duplicates)
+        '''
+        with Processor.locked(file_name):
+            first_entry_num = 1
+            if os.path.exists(file_name) and os.path.getsize(file_name) > 0:
+                with open(file_name, 'rb') as binary_file:    # counts lines without parsing them
+                    first_entry_num = sum(block.count(b'\n') for block in iter(lambda: binary_file.read(1 << 20), b''))
+            else:
+                with open(file_name, 'w', newline='') as csvfile:
+                    csv.DictWriter(csvfile, fieldnames=EntryStream.fieldnames).writeheader()
+            for entry_num, row in enumerate(rows, first_entry_num):
+                row['EntryNum'] = str(entry_num)
+            warnings = Processor.check_against_file(file_name, rows)
+            Processor.__append_rows(file_name, rows)
+        return Processor.with_warnings('Data added to file (' + str(len(rows)) + ' entries).', warnings)
+
+    @staticmethod
+    def check_against_file(file_name, rows):
+        '''
+        checks new rows for entries logged twice and days over 24 hours without loading the
+        data file: it is streamed and only its rows on the days of the new rows are kept
+        :param file_name: csv data file
+        :param rows: new rows (numbered)
+        :return: list of warnings
+        '''
+        detector = DuplicateDetector()
+        days = {detector.keys_of(row)[1] for row in rows}
+        for row in EntryStream(file_name):
+            if detector.keys_of(row)[1] in days:
+                detector.entry_added(row)
+        return detector.check_rows(rows)
+
+    @staticmethod
+    def read_projects_from_file(file_name):
+        '''
+        streams through the data file to find its projects (the entries are not kept)
+        :param file_name:
+        :return: ProjectRegistry
+        '''
+        stream = EntryStream(file_name)
+        for row in stream:
+            pass
+        return stream.projects
+
+    @staticmethod
+    def __append_rows(file_name, rows):
+        '''
+        appends rows to a csv file and makes sure they reached the disk
+        :param file_name:
+        :param rows:
+        :return: nothing
+        '''
+        with open(file_name, 'a+b') as binary_file:    # a row cut short by a crash must not swallow the next one
+            size_before = binary_file.tell()
+            if size_before > 0:
+                binary_file.seek(-1, os.SEEK_END)
+                if binary_file.read(1) != b'\n':
+                    binary_file.write(b'\r\n')
+        with open(file_name, 'a', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=EntryStream.fieldnames)
+            for row in rows:
+                writer.writerow(row)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+            Instrumentation.wrote(os.fstat(csvfile.fileno()).st_size - size_before)
+
+    @staticmethod
+    def open_binary(file_name):
+        '''
+        opens a binary data file for reading through mmap (records are unpacked when used)
+        :param file_name:
+        :return: BinaryTimesheet (close it when done)
+        '''
+        return BinaryTimesheet(file_name)
+
+    @staticmethod
+    def export_to_binary(csv_file_name, binary_file_name):
+        '''
+        converts a csv data file to a binary data file (rows are streamed)
+        :param csv_file_name:
+        :param binary_file_name:
+        :return: status
+        '''
+        stream = EntryStream(csv_file_name, compact=True)
+        with Processor.locked(binary_file_name):
+            count = BinaryTimesheet.write(binary_file_name + '.tmp', stream)
+            os.replace(binary_file_name + '.tmp', binary_file_name)
+        return str(count) + ' entries exported to ' + binary_file_name + '.'
+
+    @staticmethod
+    def import_from_binary(binary_file_name, csv_file_name):
+        '''
+        converts a binary data file to a csv data file (rows are streamed)
+        :param binary_file_name:
+        :param csv_file_name:
+        :return: status
+        '''
+        count = 0
+        with Processor.locked(csv_file_name), BinaryTimesheet(binary_file_name) as binary_file:
+            with open(csv_file_name + '.tmp', 'w', newline='') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=EntryStream.fieldnames)
+                writer.writeheader()
+                for record in binary_file:
+                    writer.writerow(record)
+                    count += 1
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
+            Processor.replace_data_file(csv_file_name + '.tmp', csv_file_name)    # the journal belonged to the old file
+        return str(count) + ' entries imported to ' + csv_file_name + '.'
+
+    @staticmethod
+    def replace_data_file(temp_file_name, file_name):
+        '''
+        puts a rewritten data file in place and deletes the journal of the old one. The two steps
+        can not be done at once, so the journal is first marked with the new file (its device and
+        inode, which os.replace keeps): if the process dies in between, read_journal finds that
+        the marked file is the data file and skips the rows logged before the mark.
+        Call it while holding locked().
+        :param temp_file_name: the new data file (already written to disk)
+        :param file_name:
+        :return: nothing
+        '''
+        journal_file_name = Processor.journal_name(file_name)
+        if os.path.exists(journal_file_name):
+            stat = os.stat(temp_file_name)
+            if stat.st_ino:    # some file systems have no inode numbers (the journal is then left unmarked)
+                Processor.__append_rows(journal_file_name, [{'EntryNum': Processor.journal_marker,
+                                                             'EmployeeName': str(stat.st_dev),
+                                                             'ProjectName': str(stat.st_ino)}])
+        os.replace(temp_file_name, file_name)
+        if os.path.exists(journal_file_name):
+            os.remove(journal_file_name)
+
+    @staticmethod
+    def is_marked_file(file_name, marker_row):
+        '''
+        :param file_name:
+        :param marker_row: journal row written by replace_data_file
+        :return: True when file_name is the file the journal was marked with (it already replaced the old one)
+        '''
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return False
+        return [str(stat.st_dev), str(stat.st_ino)] == [marker_row['EmployeeName'], marker_row['ProjectName']]
+
+    @staticmethod
+    def journal_name(file_name):
+        '''
+        :param file_name:
+        :return: name of the journal file that logs the removed rows of a csv file
+        '''
+        return file_name + '.journal'
+
+    @staticmethod
+    def totals_name(file_name):
+        '''
+        :param file_name:
+        :return: name of the file that caches the totals of a data file
+        '''
+        return file_name + '.totals.json'
+
+    @staticmethod
+    def file_checksum(file_name, known=None):
+        '''
+        crc32 of a file; when the file was only appended to since an earlier checksum (the bytes
+        before its old end are unchanged), only the new bytes are read
+        :param file_name:
+        :param known: [size, mtime in ns, crc, last bytes (hex)] from an earlier call, or None
+        :return: [size, mtime in ns, crc, last bytes (hex)], or None when there is no file
+        '''
+        if not os.path.exists(file_name):
+            return None
+        with open(file_name, 'rb') as binary_file:
+            stat = os.fstat(binary_file.fileno())
+            start, crc = 0, 0
+            if known and known[0] <= stat.st_size:
+                binary_file.seek(max(0, known[0] - 64))
+                if binary_file.read(min(64, known[0])).hex() == known[3]:
+                    start, crc = known[0], known[2]
+            binary_file.seek(start)
+            for chunk in iter(lambda: binary_file.read(2 ** 20), b''):
+                crc = zlib.crc32(chunk, crc)
+            binary_file.seek(max(0, stat.st_size - 64))
+            last_bytes = binary_file.read(64)
+        return [stat.st_size, stat.st_mtime_ns, crc, last_bytes.hex()]
+
+    @staticmethod
+    def read_totals(file_name):
+        '''
+        reads the cached totals of a data file, without reading its entries
+        :param file_name:
+        :return: totals as given by AggregateTotals.snapshot, or None when there is no cache or the
+                 data file (or its journal) was changed since the cache was written
+        '''
+        try:
+            with open(Processor.totals_name(file_name)) as totals_file:
+                cache = json.load(totals_file)
+            checksums = {'data': file_name, 'journal': Processor.journal_name(file_name)}
+            for key, checked_file_name in checksums.items():
+                known = cache[key]
+                if known is None:
+                    if os.path.exists(checked_file_name):
+                        return None
+                    continue
+                stat = os.stat(checked_file_name)
+                if [stat.st_size, stat.st_mtime_ns] != known[:2]:    # touched or changed: compare the contents
+                    checksum = Processor.file_checksum(checked_file_name)
+                    if checksum is None or checksum[0] != known[0] or checksum[2] != known[2]:
+                        return None
+            return cache['totals']
+        except (OSError, ValueError, KeyError, TypeError):    # no cache, or a file was deleted or is damaged
+            return None
+
+    @staticmethod
+    def write_totals(file_name, totals):
+        '''
+        saves the totals next to the data file with the checksums of the data file and its
+        journal (call it while holding locked(), so nobody saves between the two)
+        :param file_name:
+        :param totals: as given by AggregateTotals.snapshot
+        :return: nothing
+        '''
+        if not os.path.exists(file_name):
+            return
+        totals_file_name = Processor.totals_name(file_name)
+        try:
+            with open(totals_file_name) as totals_file:
+                known = json.load(totals_file)
+        except (OSError, ValueError):
+            known = None
+        if not isinstance(known, dict):
+            known = {}
+        cache = {'data': Processor.file_checksum(file_name, known.get('data')),
+                 'journal': Processor.file_checksum(Processor.journal_name(file_name), known.get('journal')),
+                 'totals': totals}
+        temp_file_name = totals_file_name + '.' + str(os.getpid()) + '.tmp'    # readers can write it at once
+        with open(temp_file_name, 'w') as totals_file:
+            json.dump(cache, totals_file)
+            Instrumentation.wrote(totals_file.tell())
+        os.replace(temp_file_name, totals_file_name)
+
+    @staticmethod
+    def entry_key(row):
+        '''
+        identifies an entry by its contents (entry numbers change on every load);
+        dates and hours are compared as values so 01/01/2021 matches 1/1/2021
+        :param row:
+        :return: tuple
+        '''
+        date = getattr(row, 'date_ordinal', 0)    # EntryRows and EntryRecords carry it
+        if not date:
+            try:
+                date = EntryRecord.date_to_ordinal(row['FullDate'])
+            except ValueError:
+                date = str(row['FullDate']).strip()
+        try:
+            hours = float(row['HoursWorked'])
+        except ValueError:
+            hours = str(row['HoursWorked']).strip()
+        return str(row['EmployeeName']).strip(), str(row['ProjectName']).strip(), date, hours
+
+    @staticmethod
+    def read_journal(file_name, start=0):
+        '''
+        reads the rows logged as removed for a csv file; the rows logged before a mark
+        of replace_data_file are dropped when the data file is the marked one (the process
+        died before it could delete the journal, and the new file no longer has those rows)
+        :param file_name:
+        :param start: byte offset to read from (rows logged since an earlier read)
+        :return: Counter of entry keys
+        '''
+        removed = Counter()
+        if os.path.exists(Processor.journal_name(file_name)):
+            with open(Processor.journal_name(file_name), 'rb') as binary_file:
+                binary_file.seek(start)
+                journal_file = io.TextIOWrapper(binary_file, newline='')
+                for row in csv.DictReader(journal_file, EntryStream.fieldnames):
+                    if row['EntryNum'] == Processor.journal_marker:
+                        if Processor.is_marked_file(file_name, row):
+                            removed.clear()
+                    elif None not in row.values():    # a row cut short by a crash is ignored
+                        removed[Processor.entry_key(row)] += 1
+        return removed
+
+    @staticmethod
+    def needs_compaction(file_name):
+        '''
+        checks whether the journal has grown past a tenth of the size of the csv file
+        :param file_name:
+        :return: boolean
+        '''
+        journal_file_name = Processor.journal_name(file_name)
+        return os.path.exists(journal_file_name) and \
+            os.path.getsize(journal_file_name) * 10 > os.path.getsize(file_name)
+
+    @staticmethod
+    def compact_file(file_name):
+        '''
+        rewrites the csv file without the rows logged in the journal and deletes the journal
+        (rows are streamed, so the file is never held in memory)
+        :param file_name:
+        :return: status
+        '''
+        with Processor.locked(file_name):
+            if not os.path.exists(Processor.journal_name(file_name)):
+                return 'There was nothing to compact.'
+            state_before = Processor.disk_state(file_name)
+            totals = Processor.read_totals(file_name)    # still right after the compaction (same rows)
+            temp_file_name = file_name + '.tmp'
+            with open(temp_file_name, 'w', newline='') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=EntryStream.fieldnames)
+                writer.writeheader()
+                for row in EntryStream(file_name, validate=False):    # rows that do not validate are kept
+                    writer.writerow(row)
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
+            Processor.replace_data_file(temp_file_name, file_name)
+            # the rows are the same, so a list read before the compaction need not be compared with the file again
+            Processor.compactions[file_name] = state_before, Processor.disk_state(file_name)
+            if totals is not None:
+                Processor.write_totals(file_name, totals)
+        return 'Data file was compacted.'
+
+    @staticmethod
+    def compact_file_in_background(file_name):
+        '''
+        runs compact_file on a background thread (not a daemon, so the tracker does not exit
+        half way through it; see also wait_for_compaction)
+        :param file_name:
+        :return: the thread (the running one when the file is already being compacted)
+        '''
+        thread = Processor.compaction_threads.get(file_name)
+        if thread is not None and thread.is_alive():
+            return thread
+        thread = threading.Thread(target=Processor.compact_file, args=(file_name,))
+        Processor.compaction_threads[file_name] = thread
+        thread.start()
+        return thread
+
+    @staticmethod
+    def wait_for_compaction(file_name):
+        '''
+        waits until the background compaction of a data file (if any) has finished
+        :param file_name:
+        :return: nothing
+        '''
+        thread = Processor.compaction_threads.pop(file_name, None)
+        if thread is not None:
+            thread.join()
+
+    @staticmethod
+    def report_hours(list_employee_hours, group_by='project', start_date=None, end_date=None):
+        '''
+        totals the hours worked per project, employee, day or week
+        :param list_employee_hours: rows, an EntryStore or EntryColumns
+        :param group_by: 'project', 'employee', 'day' or 'week'
+        :param start_date: first date to include (string formatted as 01/01/2021), or None
+        :param end_date: last date to include (string formatted as 01/01/2021), or None
+        :return: list of (label, total hours, number of entries)
+        '''
+        if start_date:
+            start_date = EntryRecord.date_to_ordinal(start_date)
+        if end_date:
+            end_date = EntryRecord.date_to_ordinal(end_date)
+        return HoursReport(list_employee_hours).totals(group_by, start_date or None, end_date or None)
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: 1)
+    def add_data_to_list(new_entry, list_employee_hours):  # new_entry is the object instance
+        '''appends the object instance as a dictionary row to the list of employee hours
+
+        :param new_entry:
+        :param list_employee_hours: (an EntryStore of EntryRecords gets an EntryRecord)
+        :return:list_employee_hours, status (with a warning when the entry looks like a duplicate)
+        '''
+        if getattr(list_employee_hours, 'compact', False):
+            new_row = new_entry.record_method()
+        else:
+            new_row = new_entry.dict_method()   # appends as a dictionary row
+        detector = getattr(list_employee_hours, 'duplicate_detector', None)
+        warnings = detector.check(new_row) if detector is not None else []
+        list_employee_hours.append(new_row)
+        return list_employee_hours, Processor.with_warnings('New entry was added to list.', warnings)
+
+    @staticmethod
+    def with_warnings(status, warnings, limit=10):
+        '''
+        adds warnings to a status, one per line
+        :param status:
+        :param warnings: list of warnings (see DuplicateDetector.check)
+        :param limit: number of warnings shown (the rest are counted)
+        :return: status
+        '''
+        for warning in warnings[:limit]:
+            status += '\nWarning: ' + warning
+        if len(warnings) > limit:
+            status += '\n(' + str(len(warnings) - limit) + ' more warnings)'
+        return status
+
+    @staticmethod
+    def find_duplicates(list_employee_hours):
+        '''
+        :param list_employee_hours: an EntryStore (its DuplicateDetector is used) or a plain list
+        :return: groups of rows with the same employee, project and date, list of (employee, date, hours)
+                 for days of more than 24 hours
+        '''
+        detector = getattr(list_employee_hours, 'duplicate_detector', None)
+        if detector is None:
+            detector = DuplicateDetector(list_employee_hours)
+        return detector.duplicates(), detector.long_days()
+
+
+    @staticmethod
+    @Instrumentation.timed(rows=lambda result, args: result[1] is not None)
+    def remove_data_from_list(remove_entry, list_employee_hours):
+        '''
+        removes the entry from the list
+        :param remove_entry:
+        :param list_employee_hours: an EntryStore (looked up by its index) or a plain list
+        :return:list_employee_hours, removed_row, status
+        '''
+        status = 'Entry was not in list.'
+        removed_row = None                       # stays None when no entry matches
+        remove_entry = remove_entry.strip()      # remove_entry is a string
+        if isinstance(list_employee_hours, EntryStore):
+            removed_row = list_employee_hours.pop(remove_entry)
+        else:
+            for position, entry_row in enumerate(list_employee_hours):
+                if entry_row['EntryNum'] == remove_entry:  # remove the user selected entry
+                    removed_row = list_employee_hours.pop(position)
+                    break
+        if removed_row is not None:
+            status = 'Entry was removed.'
+        return list_employee_hours, removed_row, status
+
+    @staticmethod
+    def remove_many_from_list(remove_entries, list_employee_hours):
+        '''
+        removes several entries from the list in a single pass
+        :param remove_entries: list of entry numbers (strings)
+        :param list_employee_hours: an EntryStore or a plain list
+        :return:list_employee_hours, removed_rows, status
+        '''
+        if isinstance(list_employee_hours, EntryStore):
+            removed_rows = list_employee_hours.remove_many(remove_entries)
+        else:
+            remove_entries = {entry.strip() for entry in remove_entries}
+            removed_rows = [row for row in list_employee_hours if row['EntryNum'] in remove_entries]
+            list_employee_hours[:] = [row for row in list_employee_hours if row['EntryNum'] not in remove_entries]
+        status = str(len(removed_rows)) + ' entries were removed.'
+        return list_employee_hours, removed_rows, status
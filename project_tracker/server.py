@@ -0,0 +1,289 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: HTTP/JSON server of the project tracker
+# Description: Serves the entries of one data file to many clients at once (asyncio),
+#              so other tools can add and read entries without running the menu.
+#              1) The entries are held in memory by a Session; requests are answered
+#              from it on the event loop, one at a time, so no locking is needed.
+#              2) Changes are saved by a background task every few seconds (one
+#              incremental save for all the entries added in between). The changes are
+#              taken from the session on the event loop and written to the file on a worker
+#              thread, so requests are answered while the file is written. The periodic save
+#              does not wait for the file lock: when the menu, a batch import or a compaction
+#              holds the data file, it is tried again at the next interval.
+#              3) Endpoints (all bodies are json):
+#                 GET    /entries?offset=0&page_size=20&project=&employee=&start_date=&end_date=
+#                 POST   /entries            one entry or a list of entries (?add_projects=1
+#                                            adds unknown projects instead of rejecting the rows);
+#                                            the response lists warnings for likely duplicates
+#                 DELETE /entries/<EntryNum>
+#                 GET    /projects           POST /projects {"name": ...}
+#                 GET    /report?group_by=project&start_date=&end_date=
+#                 GET    /duplicates         entries logged twice and days over 24 hours
+#                 GET    /totals             hours per project, employee and project and month
+#                 POST   /save               saves now
+#              Example: python FinalHedyK.py --serve --port 8080
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+#                   10/17/2026, Added GET /duplicates
+#                   10/17/2026, Added GET /totals
+#                   10/17/2026, POST /entries returns the duplicate warnings
+#                   10/17/2026, The background save skips an interval instead of waiting for the file lock
+#                   10/17/2026, The session is closed when the server stops (waits for a compaction)
+#                   10/17/2026, Saves are written on a worker thread; POST /save waits for its save
+#                   10/17/2026, A damaged data file is reported instead of ending with a traceback
+# -------------------------------------------------------------------------------------------- #
+
+import json     # module for the request and response bodies
+import asyncio  # module for serving many connections on one thread
+from urllib.parse import urlsplit, parse_qs   # splits the path and the query string of a request
+
+from .processing import EntryStream
+from .batch import BatchImporter
+
+
+class ApiServer:
+    """ Answers HTTP/JSON requests from the entries of a Session and saves them in the background """
+
+    max_body = 16 * 2 ** 20    # largest request body accepted (bytes)
+    reasons = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+    def __init__(self, session, flush_interval=2.0):
+        self.session = session
+        self.flush_interval = flush_interval   # seconds between background saves
+        self.changed = False                   # True when there are changes that were not saved
+        self.save_status = ''                  # Message from the last save
+        self.save_lock = asyncio.Lock()        # one save at a time
+
+    async def flush(self, blocking=True):
+        '''
+        saves the changes: they are taken from the session on the event loop (a consistent
+        snapshot), written to the file on a worker thread while requests go on being answered,
+        and the result is brought back into the session on the event loop; a caller that is
+        cancelled (the server stopping) does not cut the save off half way
+        :param blocking: False to raise BlockingIOError at once when another thread or process
+                         holds the data file
+        :return: status
+        '''
+        return await asyncio.shield(self.__flush(blocking))
+
+    async def __flush(self, blocking):
+        async with self.save_lock:
+            if self.changed:
+                self.changed = False
+                snapshot = self.session.begin_save()
+                try:
+                    await asyncio.to_thread(self.session.write_save, snapshot, blocking)
+                except BaseException:
+                    self.session.cancel_save(snapshot)
+                    self.changed = True    # still to be saved
+                    raise
+                self.save_status = self.session.end_save(snapshot)
+        return self.save_status
+
+    async def flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush(blocking=False)
+            except BlockingIOError:    # the file is in use: tried again at the next interval
+                pass
+            except Exception as error:    # tried again at the next interval
+                self.save_status = 'Save failed: ' + str(error)
+
+    async def handle_connection(self, reader, writer):
+        '''
+        reads requests from one connection (kept open between requests unless the client closes it)
+        :param reader:
+        :param writer:
+        :return: nothing
+        '''
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, separator, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    writer.write(self.response(400, {'error': 'malformed request'}, False))
+                    break
+                if length > self.max_body:
+                    writer.write(self.response(413, {'error': 'request body is too large'}, False))
+                    break
+                body = await reader.readexactly(length) if length else b''
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except Exception as error:    # the server keeps running for the other clients
+                    status, payload = 500, {'error': str(error)}
+                writer.write(self.response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass    # the client went away
+        finally:
+            writer.close()
+
+    def response(self, status, payload, keep_alive=True):
+        '''
+        :param status: HTTP status code
+        :param payload: object sent as json
+        :param keep_alive: keeps the connection open for the next request
+        :return: bytes of the response
+        '''
+        body = json.dumps(payload).encode()
+        head = 'HTTP/1.1 ' + str(status) + ' ' + self.reasons[status] + '\r\n' + \
+               'Content-Type: application/json\r\n' + \
+               'Content-Length: ' + str(len(body)) + '\r\n' + \
+               'Connection: ' + ('keep-alive' if keep_alive else 'close') + '\r\n\r\n'
+        return head.encode('latin-1') + body
+
+    async def dispatch(self, method, target, body):
+        '''
+        runs the endpoint of a request
+        :param method: GET, POST or DELETE
+        :param target: path with the query string
+        :param body: request body (bytes)
+        :return: HTTP status code, object to send as json
+        '''
+        parts = urlsplit(target)
+        path = parts.path.rstrip('/') or '/'
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        try:
+            if path == '/entries' and method == 'GET':
+                return self.list_entries(query)
+            if path == '/entries' and method == 'POST':
+                return self.add_entries(json.loads(body or b'null'), query.get('add_projects', '') in ('1', 'true'))
+            if path.startswith('/entries/') and method == 'DELETE':
+                return self.remove_entry(path[len('/entries/'):])
+            if path == '/projects' and method == 'GET':
+                return 200, [{'name': name, 'entries': self.session.projects.entry_count(name)}
+                             for name in self.session.projects]
+            if path == '/projects' and method == 'POST':
+                return self.add_project(json.loads(body or b'null'))
+            if path == '/report' and method == 'GET':
+                return 200, [{'label': label, 'hours': total, 'entries': count} for label, total, count in
+                             self.session.report(query.get('group_by', 'project'), query.get('start_date', ''),
+                                                 query.get('end_date', ''))]
+            if path == '/duplicates' and method == 'GET':
+                groups, long_days = self.session.duplicates()
+                return 200, {'duplicates': [[self.row_json(row) for row in rows] for rows in groups],
+                             'long_days': [{'EmployeeName': employee_name, 'FullDate': date, 'HoursWorked': hours}
+                                           for employee_name, date, hours in long_days]}
+            if path == '/totals' and method == 'GET':
+                return 200, self.session.totals()
+            if path == '/save' and method == 'POST':
+                self.changed = True    # saves even when nothing was changed through the server
+                return 200, {'status': await self.flush()}
+        except ValueError as error:    # bad json, numbers or dates
+            return 400, {'error': str(error)}
+        if path in ('/entries', '/projects', '/report', '/duplicates', '/totals', '/save') or path.startswith('/entries/'):
+            return 405, {'error': method + ' is not supported on ' + path}
+        return 404, {'error': 'no such endpoint'}
+
+    def list_entries(self, query):
+        offset = int(query.get('offset', 0))
+        page_size = int(query.get('page_size', 20))
+        if offset < 0 or page_size < 0:
+            raise ValueError('offset and page_size can not be negative')
+        rows, total = self.session.page(offset, page_size, project=query.get('project', ''),
+                                        employee=query.get('employee', ''),
+                                        start_date=query.get('start_date', ''), end_date=query.get('end_date', ''))
+        return 200, {'entries': [self.row_json(row) for row in rows], 'offset': offset, 'total': total}
+
+    def add_entries(self, data, add_projects=False):
+        '''
+        validates and adds one entry or a list of entries (as in the batch import)
+        :param data: json object or list of objects with EmployeeName, ProjectName, FullDate and HoursWorked
+        :param add_projects: adds projects that are not in the project list instead of rejecting the rows
+        :return: HTTP status code, {'added': entry numbers, 'rejected': [{'index', 'reason'}], 'warnings': [...]}
+        '''
+        items = [item if isinstance(item, dict) else 'entry is not a json object'
+                 for item in (data if isinstance(data, list) else [data])]
+        valid_rows, rejected_rows = BatchImporter.validate_rows(list(enumerate(items)))
+        list_projects = self.session.projects
+        new_rows = []
+        for index, row in valid_rows:
+            if row['ProjectName'] not in list_projects:
+                if not add_projects:
+                    rejected_rows.append((index, row, 'project is not in the list of projects'))
+                    continue
+                list_projects.add(row['ProjectName'])
+            row['ProjectName'] = list_projects.get(row['ProjectName'])
+            new_rows.append(row)
+        warnings = []
+        if new_rows:
+            warnings, status = self.session.add_rows(new_rows)
+            self.changed = True
+        rejected = sorted((index, reason) for index, row, reason in rejected_rows)
+        return (201 if new_rows else 400), {'added': [row['EntryNum'] for row in new_rows],
+                                            'rejected': [{'index': index, 'reason': reason}
+                                                         for index, reason in rejected],
+                                            'warnings': warnings}
+
+    def remove_entry(self, entry_num):
+        removed_row, status = self.session.remove_entry(entry_num)
+        if removed_row is None:
+            return 404, {'error': status}
+        self.changed = True
+        return 200, {'removed': self.row_json(removed_row)}
+
+    def add_project(self, data):
+        if not isinstance(data, dict) or not str(data.get('name', '')).strip():
+            raise ValueError('give the project as {"name": ...}')
+        added = self.session.add_project(data['name'])
+        return (201 if added else 200), {'name': self.session.projects.get(data['name']), 'added': added}
+
+    @staticmethod
+    def row_json(row):
+        '''
+        :param row: dictionary row or EntryRecord
+        :return: dictionary of the columns of the data file
+        '''
+        return {key: row[key] for key in EntryStream.fieldnames}
+
+    async def serve(self, host='127.0.0.1', port=8080):
+        '''
+        serves until cancelled (or interrupted), then saves what is left
+        :param host:
+        :param port:
+        :return: nothing
+        '''
+        self.session.load()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        flusher = asyncio.create_task(self.flush_periodically())
+        print('Serving ' + self.session.file_name + ' on http://' + host + ':' + str(port) + '/ (Ctrl+C to stop)')
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            flusher.cancel()
+            print(await self.flush() or 'There were no changes to save.')
+
+    @staticmethod
+    def run(session, host='127.0.0.1', port=8080, flush_interval=2.0):
+        '''
+        runs the server on a new event loop
+        :return: exit code
+        '''
+        try:
+            asyncio.run(ApiServer(session, flush_interval).serve(host, port))
+        except KeyboardInterrupt:
+            pass
+        except ValueError as error:    # the data file is damaged (serve loads it before listening)
+            print(error)
+            return 2
+        finally:
+            session.close()
+        return 0
@@ -0,0 +1,161 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Session of the project tracker
+# Description: Holds the state of one run of the tracker (the data file name, the entries,
+#              the projects and the next entry number), which used to be the globals
+#              of FinalHedyK.py. The data file is only read when it is first needed.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+#                   10/17/2026, The entries are kept by a storage backend (storage.py)
+#                   10/17/2026, save() can give up at once when the data file is locked
+#                   10/17/2026, Added begin_save, write_save, end_save and cancel_save (a save written on a thread)
+# -------------------------------------------------------------------------------------------- #
+
+from .data import DEFAULT_FILE_NAME
+from .storage import Storage
+
+
+class Session:
+    """
+    one run of the tracker on a data file; the entries, projects and counter are kept
+    by a storage backend (CsvStorage, or SqliteStorage for .db files), which reads
+    nothing until the entries, projects or counter are used
+    """
+
+    def __init__(self, file_name=DEFAULT_FILE_NAME, compact=False):
+        self.file_name = file_name     # Name of the data file (csv, .bin, or an SQLite .db)
+        self.storage = Storage.open(file_name, compact)
+        self.status = ''               # Message from the last load, for user feedback
+
+    @property
+    def loaded(self):
+        return self.storage.loaded
+
+    @property
+    def projects(self):
+        return self.storage.projects
+
+    @property
+    def counter(self):
+        return self.storage.counter
+
+    def count(self):
+        """
+        :return: number of entries
+        """
+        return self.storage.count()
+
+    def load(self):
+        """
+        reads (or re-reads) the data file; unsaved changes are lost
+        :return: status
+        """
+        self.status = self.storage.load()
+        return self.status
+
+    def add_entry(self, new_entry):
+        """
+        adds a validated EmployeeHours object (made with entry number self.counter)
+        :param new_entry:
+        :return: status
+        """
+        return self.storage.add_entry(new_entry)
+
+    def add_rows(self, rows):
+        """
+        adds many validated dictionary rows at once (they are given new entry numbers)
+        :param rows:
+        :return: list of warnings (rows that look like duplicates), status
+        """
+        return self.storage.add_rows(rows)
+
+    def remove_entry(self, entry_num):
+        """
+        removes an entry by its entry number
+        :param entry_num: (string)
+        :return: removed row (None when the entry number was not in the list), status
+        """
+        return self.storage.remove_entry(entry_num)
+
+    def restore_entry(self, removed_row):
+        """
+        puts back a row that was removed (when the user does not confirm the removal)
+        :param removed_row:
+        :return: nothing
+        """
+        self.storage.restore_entry(removed_row)
+
+    def add_project(self, project_name):
+        """
+        :param project_name:
+        :return: True if the project was new
+        """
+        return self.projects.add(project_name)
+
+    def save(self, blocking=True):
+        """
+        saves the changes since the last save
+        :param blocking: False to raise BlockingIOError at once when the data file is locked
+        :return: status
+        """
+        return self.storage.save(blocking)
+
+    def begin_save(self):
+        """
+        takes the changes to save, so they can be written on another thread (write_save)
+        while the entries go on changing; end_save (or cancel_save) is called on this thread
+        :return: snapshot
+        """
+        return self.storage.begin_save()
+
+    def write_save(self, snapshot, blocking=True):
+        """
+        writes the changes taken by begin_save (on any thread)
+        :param snapshot:
+        :param blocking: False to raise BlockingIOError at once when the data file is locked
+        :return: nothing
+        """
+        self.storage.write_save(snapshot, blocking)
+
+    def end_save(self, snapshot):
+        """
+        :param snapshot: written by write_save
+        :return: status
+        """
+        return self.storage.end_save(snapshot)
+
+    def cancel_save(self, snapshot):
+        """
+        keeps the changes of a snapshot that could not be written, so the next save has them
+        :param snapshot:
+        :return: nothing
+        """
+        self.storage.cancel_save(snapshot)
+
+    def page(self, offset=0, page_size=20, **filters):
+        """
+        :return: list of rows on the page, total number of matching entries (see Processor.select_entries)
+        """
+        return self.storage.page(offset, page_size, **filters)
+
+    def report(self, group_by='project', start_date='', end_date=''):
+        """
+        :return: list of (label, total hours, number of entries) (see Processor.report_hours)
+        """
+        return self.storage.report(group_by, start_date, end_date)
+
+    def duplicates(self):
+        """
+        :return: groups of rows with the same employee, project and date, list of (employee, date, hours)
+                 for days of more than 24 hours
+        """
+        return self.storage.duplicates()
+
+    def totals(self):
+        """
+        :return: hours and entries per project, employee and project and month (see AggregateTotals.snapshot);
+                 a csv data file is not read when its cached totals are up to date
+        """
+        return self.storage.totals()
+
+    def close(self):
+        self.storage.close()
@@ -0,0 +1,566 @@
+# -------------------------------------------------------------------------------------------- #
+# Title: Storage backends of the project tracker
+# Description: The places the entries are kept, behind one interface (Storage):
+#              1) CsvStorage keeps the entries in memory and saves them to the csv
+#              (or .bin) data file through Processor, as the tracker always has.
+#              2) SqliteStorage keeps them in an SQLite database (.db, .sqlite or .sqlite3):
+#              removing an entry, a page of a project's entries and the hours totals are
+#              indexed queries instead of loops over every entry.
+#              Storage.open picks the backend from the file extension.
+# ChangeLog: (Who, When, What)
+#                   10/17/2026, Created Script
+#                   10/17/2026, Added duplicates() (entries logged twice, days over 24 hours)
+#                   10/17/2026, Added totals(); CsvStorage caches them next to the data file
+#                   10/17/2026, Added SqliteStorage.rows() (for the monthly export)
+#                   10/17/2026, Storage is an abstract base class
+#                   10/17/2026, add_rows checks each row for duplicates and returns the warnings
+#                   10/17/2026, save(blocking=False) raises BlockingIOError when the data file is locked
+#                   10/17/2026, CsvStorage.close() waits for the background compaction of the data file
+#                   10/17/2026, save() is split into begin_save, write_save and end_save (the server writes on a thread)
+#                   10/17/2026, CsvStorage takes the totals from their cache on load instead of adding up the entries
+#                   10/17/2026, SqliteStorage: save(blocking=False) does not wait for a locked database, and
+#                               the project filter ignores case as the csv one does
+# -------------------------------------------------------------------------------------------- #
+
+import os       # module for file handling
+import errno    # module for the error number of BlockingIOError
+import sqlite3  # module for the SQLite database backend
+from abc import ABC, abstractmethod    # a backend that misses a method can not be created
+
+from .data import DEFAULT_FILE_NAME, EntryRecord, ProjectRegistry, DuplicateDetector, AggregateTotals
+from .processing import HoursReport, SaveSnapshot, Processor
+
+
+class Storage(ABC):
+    '''
+    interface of a storage backend (abstract); the entries are read when they are first needed,
+    and changes are kept until save() (load() throws them away)
+    '''
+
+    @staticmethod
+    def open(file_name=DEFAULT_FILE_NAME, compact=False):
+        '''
+        :param file_name: data file; the extension picks the backend
+        :param compact: holds the entries as EntryRecords (CsvStorage only; a .bin file always does)
+        :return: SqliteStorage or CsvStorage
+        '''
+        if SqliteStorage.is_sqlite(file_name):
+            return SqliteStorage(file_name)
+        return CsvStorage(file_name, compact)
+
+    @property
+    @abstractmethod
+    def loaded(self):
+        ''' :return: True once the entries (or the project counts) have been read '''
+
+    @property
+    @abstractmethod
+    def projects(self):
+        ''' :return: ProjectRegistry of the projects '''
+
+    @property
+    @abstractmethod
+    def counter(self):
+        ''' :return: entry number for the next new entry '''
+
+    @abstractmethod
+    def count(self):
+        ''' :return: number of entries '''
+
+    @abstractmethod
+    def load(self):
+        ''' (re)reads the entries; unsaved changes are lost. :return: status '''
+
+    @abstractmethod
+    def add_entry(self, new_entry):
+        ''' :param new_entry: validated EmployeeHours object. :return: status '''
+
+    @abstractmethod
+    def add_rows(self, rows):
+        '''
+        adds many validated dictionary rows (they are given new entry numbers); each is checked for
+        duplicates and days over 24 hours, as add_entry does
+        :return: list of warnings, status
+        '''
+
+    @abstractmethod
+    def remove_entry(self, entry_num):
+        ''' :param entry_num: (string). :return: removed row (None if not found), status '''
+
+    @abstractmethod
+    def restore_entry(self, removed_row):
+        ''' puts back a row returned by remove_entry. :return: nothing '''
+
+    def save(self, blocking=True):
+        '''
+        :param blocking: False to raise BlockingIOError at once, instead of waiting, when the
+                         data file is locked by another thread or process
+        :return: status
+        '''
+        snapshot = self.begin_save()
+        try:
+            self.write_save(snapshot, blocking)
+        except BaseException:
+            self.cancel_save(snapshot)
+            raise
+        return self.end_save(snapshot)
+
+    @abstractmethod
+    def begin_save(self):
+        '''
+        takes the changes to save; the entries can go on changing while they are written
+        :return: snapshot for write_save
+        '''
+
+    @abstractmethod
+    def write_save(self, snapshot, blocking=True):
+        '''
+        writes the snapshot (can run on another thread: nothing else of the storage is used)
+        :param snapshot: from begin_save
+        :param blocking: as in save()
+        :return: nothing
+        '''
+
+    @abstractmethod
+    def end_save(self, snapshot):
+        ''' brings a written snapshot back into the entries. :return: status '''
+
+    @abstractmethod
+    def cancel_save(self, snapshot):
+        ''' takes back the changes of a snapshot that could not be written (saved next time). :return: nothing '''
+
+    @abstractmethod
+    def page(self, offset=0, page_size=20, project='', employee='', start_date='', end_date=''):
+        ''' :return: list of rows on the page, total number of matching entries '''
+
+    @abstractmethod
+    def report(self, group_by='project', start_date='', end_date=''):
+        ''' :return: list of (label, total hours, number of entries) '''
+
+    @abstractmethod
+    def duplicates(self):
+        ''' :return: groups of rows with the same employee, project and date, list of (employee, date, hours)
+            for days of more than 24 hours '''
+
+    @abstractmethod
+    def totals(self):
+        ''' :return: hours and entries per project, employee and project and month (see AggregateTotals.snapshot) '''
+
+    def close(self):
+        pass
+
+
+class CsvStorage(Storage):
+    '''
+    the csv (or .bin) data file, read into an EntryStore; saving appends the changes
+    (see Processor.save_changes_to_file)
+    '''
+
+    def __init__(self, file_name=DEFAULT_FILE_NAME, compact=False):
+        self.file_name = file_name
+        self.compact = compact         # Holds the entries as EntryRecords instead of dictionary rows
+        self.__entries = None          # EntryStore of the entries (None until the file is read)
+        self.__projects = None         # ProjectRegistry of the projects
+        self.__counter = 0             # Entry number for the next new entry
+
+    @property
+    def loaded(self):
+        return self.__entries is not None
+
+    @property
+    def entries(self):
+        if self.__entries is None:
+            self.load()
+        return self.__entries
+
+    @property
+    def projects(self):
+        if self.__projects is None:
+            self.load()
+        return self.__projects
+
+    @property
+    def counter(self):
+        if self.__entries is None:
+            self.load()
+        return self.__counter
+
+    def count(self):
+        return len(self.entries)
+
+    def load(self):
+        with Processor.locked(self.file_name, shared=True):    # nobody saves before the cached totals are checked
+            self.__entries, self.__projects, status, self.__counter = \
+                Processor.read_data_from_file(self.file_name, self.compact)
+            totals = Processor.read_totals(self.file_name)
+        if totals is not None:    # otherwise they are added up when first needed (and cached by the next save)
+            self.__entries.aggregate_totals = AggregateTotals.from_snapshot(totals)
+        return status
+
+    def add_entry(self, new_entry):
+        _, status = Processor.add_data_to_list(new_entry, self.entries)
+        self.__counter += 1   # entry has been validated and one added to counter in preparation for the next entry
+        return status
+
+    def add_rows(self, rows):
+        entries = self.entries
+        detector = entries.duplicate_detector
+        warnings = []
+        for row in rows:
+            row['EntryNum'] = str(self.__counter)
+            if entries.compact:
+                row = EntryRecord.from_row(row)
+            warnings.extend(detector.check(row))    # before the row is added, so rows that repeat each other are found
+            entries.append(row)
+            self.__counter += 1
+        return warnings, Processor.with_warnings('Data added to list (' + str(len(rows)) + ' entries).', warnings)
+
+    def remove_entry(self, entry_num):
+        _, removed_row, status = Processor.remove_data_from_list(entry_num, self.entries)
+        return removed_row, status
+
+    def restore_entry(self, removed_row):
+        self.entries.append(removed_row)
+
+    def begin_save(self):
+        return SaveSnapshot(self.file_name, self.entries, self.__entries.aggregate_totals.snapshot())
+
+    def write_save(self, snapshot, blocking=True):
+        Processor.write_save(snapshot, blocking)
+
+    def end_save(self, snapshot):
+        status, self.__counter = Processor.end_save(self.entries, snapshot, self.counter)
+        return status
+
+    def cancel_save(self, snapshot):
+        Processor.cancel_save(self.entries, snapshot)
+
+    def close(self):
+        Processor.wait_for_compaction(self.file_name)    # it may be half way through replacing the data file
+
+    def page(self, offset=0, page_size=20, project='', employee='', start_date='', end_date=''):
+        return Processor.select_entries(self.entries, offset, page_size, project, employee, start_date, end_date)
+
+    def report(self, group_by='project', start_date='', end_date=''):
+        if group_by in ('project', 'employee') and not start_date and not end_date:    # from the running totals
+            return [tuple(total) for total in self.totals()[group_by + 's']]
+        return Processor.report_hours(self.entries, group_by, start_date, end_date)
+
+    def totals(self):
+        if self.__entries is None:    # the cached totals are used until the entries are needed
+            totals = Processor.read_totals(self.file_name)
+            if totals is not None:
+                return totals
+            self.load()
+            with Processor.locked(self.file_name, shared=True):
+                totals = self.__entries.aggregate_totals.snapshot()
+                if self.__entries.disk_state == Processor.disk_state(self.file_name):    # nobody saved since
+                    Processor.write_totals(self.file_name, totals)
+            return totals
+        return self.entries.aggregate_totals.snapshot()
+
+    def duplicates(self):
+        return Processor.find_duplicates(self.entries)
+
+
+class SqliteStorage(Storage):
+    '''
+    an SQLite database in WAL mode (readers are not blocked while the tracker writes);
+    the entries stay in the database and are found through the indexes on project,
+    employee and date. Adds and removes go into one open transaction that save()
+    commits and load() rolls back, so a save is a single batched write.
+    '''
+
+    extensions = ('.db', '.sqlite', '.sqlite3')
+
+    # the statements are written once with ? parameters; sqlite3 keeps them prepared (cached_statements)
+    create_sql = (
+        '''CREATE TABLE IF NOT EXISTS entries (
+               entry_num INTEGER PRIMARY KEY,
+               employee_name TEXT NOT NULL,
+               project_name TEXT NOT NULL,
+               full_date TEXT NOT NULL,
+               hours_worked REAL NOT NULL,
+               date_ordinal INTEGER NOT NULL)''',
+        'CREATE INDEX IF NOT EXISTS entries_project ON entries (project_name, date_ordinal)',
+        'CREATE INDEX IF NOT EXISTS entries_project_nocase ON entries (project_name COLLATE NOCASE, date_ordinal)',
+        'CREATE INDEX IF NOT EXISTS entries_employee ON entries (employee_name COLLATE NOCASE, date_ordinal)',
+        'CREATE INDEX IF NOT EXISTS entries_date ON entries (date_ordinal)',
+    )
+    columns_sql = 'entry_num, employee_name, project_name, full_date, hours_worked'
+    insert_sql = '''INSERT INTO entries (entry_num, employee_name, project_name, full_date, hours_worked, date_ordinal)
+                    VALUES (?, ?, ?, ?, ?, ?)'''
+    select_one_sql = 'SELECT ' + columns_sql + ' FROM entries WHERE entry_num = ?'
+    delete_sql = 'DELETE FROM entries WHERE entry_num = ?'
+    count_sql = 'SELECT COUNT(*) FROM entries'
+    counter_sql = 'SELECT COALESCE(MAX(entry_num), 0) + 1 FROM entries'
+    projects_sql = 'SELECT MIN(project_name), COUNT(*) FROM entries GROUP BY project_name COLLATE NOCASE'
+    # duplicates: same employee, project and date (names compared regardless of case); uses entries_employee
+    same_entry_sql = '''SELECT entry_num FROM entries WHERE employee_name = ? COLLATE NOCASE AND date_ordinal = ?
+                        AND project_name = ? COLLATE NOCASE ORDER BY entry_num'''
+    day_hours_sql = 'SELECT COALESCE(SUM(hours_worked), 0) FROM entries WHERE employee_name = ? COLLATE NOCASE ' \
+                    'AND date_ordinal = ?'
+    duplicates_sql = '''SELECT group_concat(entry_num) FROM entries
+                        GROUP BY employee_name COLLATE NOCASE, date_ordinal, project_name COLLATE NOCASE
+                        HAVING COUNT(*) > 1 ORDER BY lower(employee_name), lower(project_name), date_ordinal'''
+    month_totals_sql = '''SELECT project_name, date_ordinal, SUM(hours_worked), COUNT(*) FROM entries
+                          GROUP BY project_name, date_ordinal'''    # folded into months by totals()
+    long_days_sql = '''SELECT MIN(employee_name), date_ordinal, SUM(hours_worked) FROM entries
+                       GROUP BY employee_name COLLATE NOCASE, date_ordinal HAVING SUM(hours_worked) > ?
+                       ORDER BY lower(employee_name), date_ordinal'''
+    group_sql = {   # group_by -> expression the totals are grouped by
+        'project': 'project_name',
+        'employee': 'employee_name',
+        'day': 'date_ordinal',
+        'week': 'date_ordinal - (date_ordinal - 1) % 7',    # ordinal 1 (1/1/0001) was a Monday
+    }
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.connection = sqlite3.connect(file_name, cached_statements=64, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')    # WAL stays consistent; the last commit may be lost on power failure
+        with self.connection:
+            for sql in self.create_sql:
+                self.connection.execute(sql)
+        self.__projects = None         # ProjectRegistry (None until the database is read)
+        self.__counter = 0             # Entry number for the next new entry
+        self.__changes = 0             # Entries added or removed since the last save
+
+    @staticmethod
+    def is_sqlite(file_name):
+        '''
+        :param file_name:
+        :return: True when the file name has a .db, .sqlite or .sqlite3 extension
+        '''
+        return os.path.splitext(file_name)[1].lower() in SqliteStorage.extensions
+
+    @staticmethod
+    def row_of(values):
+        '''
+        :param values: (entry_num, employee_name, project_name, full_date, hours_worked) from a query
+        :return: dictionary row
+        '''
+        return {'EntryNum': str(values[0]), 'EmployeeName': values[1], 'ProjectName': values[2],
+                'FullDate': values[3], 'HoursWorked': values[4]}
+
+    @staticmethod
+    def values_of(row):
+        '''
+        :param row: dictionary row (or EntryRecord) with valid date and hours
+        :return: parameters for insert_sql
+        '''
+        date_ordinal = getattr(row, 'date_ordinal', 0) or EntryRecord.date_to_ordinal(row['FullDate'])
+        return (int(row['EntryNum']), row['EmployeeName'], row['ProjectName'], str(row['FullDate']),
+                float(row['HoursWorked']), date_ordinal)
+
+    @property
+    def loaded(self):
+        return self.__projects is not None
+
+    @property
+    def projects(self):
+        if self.__projects is None:
+            self.__read_projects()
+        return self.__projects
+
+    @property
+    def counter(self):
+        if self.__projects is None:
+            self.__read_projects()
+        return self.__counter
+
+    def count(self):
+        return self.connection.execute(self.count_sql).fetchone()[0]
+
+    def __read_projects(self):
+        '''
+        counts the entries per project and finds the next entry number; the open transaction is
+        kept (the properties call this before the first change, and load() after rolling back)
+        :return: nothing
+        '''
+        self.__projects = ProjectRegistry()
+        for project_name, count in self.connection.execute(self.projects_sql):
+            self.__projects.set_entry_count(project_name, count)
+        self.__counter = self.connection.execute(self.counter_sql).fetchone()[0]
+
+    def load(self):
+        self.connection.rollback()
+        self.__changes = 0
+        self.__read_projects()
+        return 'Data read from database (' + str(self.count()) + ' entries).'
+
+    def add_entry(self, new_entry):
+        list_projects, counter = self.projects, self.counter    # read before the insert (see __read_projects)
+        row = new_entry.dict_method()
+        warnings = self.__insert_checked(row)
+        list_projects.entry_added(row)
+        self.__counter = max(counter, int(row['EntryNum']) + 1)
+        self.__changes += 1
+        return Processor.with_warnings('New entry was added to list.', warnings)
+
+    def add_rows(self, rows):
+        list_projects = self.projects    # read before the inserts (see __read_projects)
+        warnings = []
+        for entry_num, row in enumerate(rows, self.counter):
+            row['EntryNum'] = str(entry_num)
+            warnings.extend(self.__insert_checked(row))    # the earlier rows of the batch are checked against too
+            list_projects.entry_added(row)
+        self.__counter += len(rows)
+        self.__changes += len(rows)
+        return warnings, Processor.with_warnings('Data added to database (' + str(len(rows)) + ' entries).', warnings)
+
+    def __insert_checked(self, row):
+        '''
+        inserts a row after looking up the entries it clashes with (two indexed queries)
+        :param row:
+        :return: list of warnings (see DuplicateDetector.describe)
+        '''
+        values = self.values_of(row)
+        same_entry_nums = [str(entry_num) for entry_num, in
+                           self.connection.execute(self.same_entry_sql, (values[1], values[5], values[2]))]
+        day_hours = self.connection.execute(self.day_hours_sql, (values[1], values[5])).fetchone()[0] + values[4]
+        self.connection.execute(self.insert_sql, values)
+        return DuplicateDetector.describe(row, same_entry_nums, day_hours)
+
+    def remove_entry(self, entry_num):
+        list_projects = self.projects    # read before the delete (see __read_projects)
+        try:
+            values = self.connection.execute(self.select_one_sql, (int(entry_num),)).fetchone()
+        except ValueError:    # not an entry number
+            values = None
+        if values is None:
+            return None, 'Entry was not in list.'
+        self.connection.execute(self.delete_sql, (values[0],))
+        removed_row = self.row_of(values)
+        list_projects.entry_removed(removed_row)
+        self.__changes += 1
+        return removed_row, 'Entry was removed.'
+
+    def remove_many(self, entry_nums):
+        '''
+        removes several entries in one batch
+        :param entry_nums: entry numbers (strings)
+        :return: number of entries removed
+        '''
+        removed = 0
+        for entry_num in entry_nums:
+            removed_row, status = self.remove_entry(entry_num)
+            removed += removed_row is not None
+        return removed
+
+    def restore_entry(self, removed_row):
+        list_projects = self.projects    # read before the insert (see __read_projects)
+        self.connection.execute(self.insert_sql, self.values_of(removed_row))
+        list_projects.entry_added(removed_row)
+        self.__changes -= 1    # the removal and the restore cancel out
+
+    def begin_save(self):    # the snapshot is the number of changes to commit
+        changes, self.__changes = self.__changes, 0
+        return changes
+
+    def write_save(self, changes, blocking=True):
+        '''
+        commits the open transaction; SQLite has its own locks: a locked database is waited for
+        up to sqlite3's busy timeout, or not at all when blocking is False
+        :param changes: as given by begin_save
+        :param blocking: False to raise BlockingIOError at once when another connection holds the database
+        :return: nothing
+        '''
+        if not changes:
+            return
+        if blocking:
+            self.connection.commit()
+            return
+        busy_timeout = self.connection.execute('PRAGMA busy_timeout').fetchone()[0]
+        self.connection.execute('PRAGMA busy_timeout = 0')
+        try:
+            self.connection.commit()
+        except sqlite3.OperationalError as error:
+            if 'locked' not in str(error) and 'busy' not in str(error):
+                raise
+            raise BlockingIOError(errno.EWOULDBLOCK, 'The database is being written by someone else.',
+                                  self.file_name) from error
+        finally:
+            self.connection.execute('PRAGMA busy_timeout = ' + str(int(busy_timeout)))
+
+    def end_save(self, changes):
+        if not changes:
+            return 'There were no changes to save.'
+        return 'Changes saved to database (' + str(changes) + ' entries added or removed).'
+
+    def cancel_save(self, changes):
+        self.__changes += changes
+
+    def __where(self, project, employee, start_date, end_date):
+        '''
+        :return: WHERE clause (or ''), parameters
+        '''
+        conditions, parameters = [], []
+        if project.strip():    # in any case, like the csv filter (uses entries_project_nocase)
+            conditions.append('project_name = ? COLLATE NOCASE')
+            parameters.append(project.strip())
+        if employee.strip():
+            conditions.append('employee_name = ? COLLATE NOCASE')
+            parameters.append(employee.strip())
+        if start_date:
+            conditions.append('date_ordinal >= ?')
+            parameters.append(EntryRecord.date_to_ordinal(start_date))
+        if end_date:
+            conditions.append('date_ordinal <= ?')
+            parameters.append(EntryRecord.date_to_ordinal(end_date))
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), parameters
+
+    def page(self, offset=0, page_size=20, project='', employee='', start_date='', end_date=''):
+        where, parameters = self.__where(project, employee, start_date, end_date)
+        total = self.connection.execute('SELECT COUNT(*) FROM entries' + where, parameters).fetchone()[0]
+        rows = self.connection.execute(
+            'SELECT ' + self.columns_sql + ' FROM entries' + where +
+            (' ORDER BY date_ordinal, project_name, entry_num' if where else    # filtered pages are in date order
+             ' ORDER BY project_name, date_ordinal, entry_num') + ' LIMIT ? OFFSET ?',
+            parameters + [page_size, offset])
+        return [self.row_of(values) for values in rows], total
+
+    def report(self, group_by='project', start_date='', end_date=''):
+        if group_by not in HoursReport.group_choices:
+            raise ValueError('Report can be grouped by ' + ', '.join(HoursReport.group_choices) + '.')
+        where, parameters = self.__where('', '', start_date, end_date)
+        group = self.group_sql[group_by]
+        groups = self.connection.execute('SELECT ' + group + ', SUM(hours_worked), COUNT(*) FROM entries' +
+                                         where + ' GROUP BY ' + group, parameters).fetchall()
+        if group_by in ('project', 'employee'):    # listed alphabetically, as in HoursReport
+            return sorted(groups)
+        labels = 'Week of ' if group_by == 'week' else ''
+        return [(labels + EntryRecord.ordinal_to_date(key), total, count) for key, total, count in sorted(groups)]
+
+    def totals(self):
+        totals = {'projects': [list(total) for total in self.report('project')],
+                  'employees': [list(total) for total in self.report('employee')]}
+        months = {}
+        for project_name, date_ordinal, hours, entries in self.connection.execute(self.month_totals_sql):
+            total = months.setdefault((project_name, AggregateTotals.month_of(date_ordinal)), [0.0, 0])
+            total[0] += hours
+            total[1] += entries
+        totals['months'] = [[project_name, month, round(hours, 6), entries]
+                            for (project_name, month), (hours, entries) in sorted(months.items())]
+        return totals
+
+    def rows(self):
+        '''
+        :return: generator of all the entries as dictionary rows (in entry number order)
+        '''
+        for values in self.connection.execute('SELECT ' + self.columns_sql + ' FROM entries ORDER BY entry_num'):
+            yield self.row_of(values)
+
+    def duplicates(self):
+        groups = []
+        for entry_nums, in self.connection.execute(self.duplicates_sql).fetchall():
+            groups.append([self.row_of(self.connection.execute(self.select_one_sql, (int(entry_num),)).fetchone())
+                           for entry_num in sorted(entry_nums.split(','), key=int)])
+        long_days = [(employee_name, EntryRecord.ordinal_to_date(date_ordinal), round(hours, 6))
+                     for employee_name, date_ordinal, hours in
+                     self.connection.execute(self.long_days_sql, (DuplicateDetector.max_hours_per_day,))]
+        return groups, long_days
+
+    def close(self):
+        self.connection.close()
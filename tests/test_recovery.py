@@ -0,0 +1,126 @@
+"""
+Saves that fail half way: the entry numbers must still match the EntryStore, and a
+journal left behind by a compaction that died must not drop rows a second time.
+Run with: python -m unittest discover tests
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from project_tracker import Session, Processor
+
+
+class RecoveryTest(unittest.TestCase):
+
+    rows = [('Margaretha Novik', 'DW Implementation', '1/4/2021', '8.0'),
+            ('Giff Tinwell', 'DW Planning', '1/5/2021', '6.5'),
+            ('Ann Lee', 'Intranet', '1/6/2021', '7.0'),
+            ('Bob Ray', 'Intranet', '1/7/2021', '2.0')]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_csv(self, file_name, rows):
+        with open(file_name, 'w', newline='') as csv_file:
+            csv_file.write('EntryNum,EmployeeName,ProjectName,FullDate,HoursWorked\n')
+            for number, row in enumerate(rows, 1):
+                csv_file.write(str(number) + ',' + ','.join(row) + '\n')
+
+    def names(self, file_name):
+        session = Session(file_name)
+        try:
+            return sorted(row['EmployeeName'] for row in session.storage.entries)
+        finally:
+            session.close()
+
+    def test_failed_binary_save_keeps_entry_numbers(self):
+        csv_file_name = os.path.join(self.directory, 'f.csv')
+        file_name = os.path.join(self.directory, 'f.bin')
+        self.write_csv(csv_file_name, self.rows)
+        Processor.export_to_binary(csv_file_name, file_name)
+        session = Session(file_name)
+        session.load()
+        removed_row, status = session.remove_entry('1')    # the others would be numbered from 1 again
+        self.assertEqual(removed_row['EmployeeName'], 'Margaretha Novik')
+        shown = {row['EntryNum']: row['EmployeeName'] for row in session.storage.entries}
+        real_replace = os.replace
+
+        def failing_replace(source, destination):
+            if source.endswith('.bin.tmp'):
+                raise OSError('disk full')
+            return real_replace(source, destination)
+
+        with mock.patch('os.replace', failing_replace):
+            self.assertRaises(OSError, session.save)
+        self.assertFalse(os.path.exists(file_name + '.tmp'))
+        self.assertEqual({row['EntryNum']: row['EmployeeName'] for row in session.storage.entries}, shown)
+        removed_row, status = session.remove_entry('2')    # the entry shown as 2
+        self.assertEqual(removed_row['EmployeeName'], 'Giff Tinwell')
+        session.save()
+        session.close()
+        self.assertEqual(self.names(file_name), ['Ann Lee', 'Bob Ray'])
+
+    def test_saved_binary_file_is_renumbered(self):
+        csv_file_name = os.path.join(self.directory, 'f.csv')
+        file_name = os.path.join(self.directory, 'f.bin')
+        self.write_csv(csv_file_name, self.rows)
+        Processor.export_to_binary(csv_file_name, file_name)
+        session = Session(file_name)
+        session.remove_entry('1')
+        session.save()
+        self.assertEqual(sorted(row['EntryNum'] for row in session.storage.entries), ['1', '2', '3'])
+        self.assertEqual(session.remove_entry('1')[0]['EmployeeName'], 'Giff Tinwell')
+        session.close()
+
+    def compact_and_die(self, dies_in):
+        '''
+        removes one entry, then compacts the data file with dies_in failing
+        :param dies_in: 'replace' (the data file is not replaced) or 'remove' (the journal is not deleted)
+        :return: name of the data file
+        '''
+        file_name = os.path.join(self.directory, 'f.csv')
+        self.write_csv(file_name, self.rows * 10)    # 40 rows, so one removal does not start a compaction
+        session = Session(file_name)
+        session.remove_entry('1')
+        session.save()
+        session.close()
+        self.assertTrue(os.path.exists(Processor.journal_name(file_name)))
+        real = getattr(os, dies_in)
+
+        def dying(*arguments):
+            if arguments[-1] in (file_name, Processor.journal_name(file_name)):
+                raise OSError('the process died')
+            return real(*arguments)
+
+        with mock.patch('os.' + dies_in, dying):
+            self.assertRaises(OSError, Processor.compact_file, file_name)
+        return file_name
+
+    def test_journal_left_after_replace_is_ignored(self):
+        file_name = self.compact_and_die('remove')
+        self.assertTrue(os.path.exists(Processor.journal_name(file_name)))
+        self.assertEqual(len(self.names(file_name)), 39)
+        session = Session(file_name)    # removals logged after the crash still count
+        session.remove_entry('1')
+        session.save()
+        session.close()
+        self.assertEqual(len(self.names(file_name)), 38)
+        self.assertEqual(Processor.compact_file(file_name), 'Data file was compacted.')
+        self.assertFalse(os.path.exists(Processor.journal_name(file_name)))
+        self.assertEqual(len(self.names(file_name)), 38)
+
+    def test_journal_kept_when_replace_fails(self):
+        file_name = self.compact_and_die('replace')
+        self.assertEqual(len(self.names(file_name)), 39)
+        self.assertEqual(Processor.compact_file(file_name), 'Data file was compacted.')
+        self.assertEqual(len(self.names(file_name)), 39)
+
+
+if __name__ == '__main__':
+    unittest.main()